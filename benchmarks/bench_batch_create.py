@@ -0,0 +1,112 @@
+"""Single item vs batch create benchmark
+
+Creates persons through the repository on a SQLite database (stand-in for a
+remote database) where every statement waits a fixed delay (without blocking
+the event loop) to simulate the network round trip. Prints the throughput in
+items per second of:
+
+- single: one create (session, INSERT and commit) per person, as
+  POST /api/v1/persons
+- batch: create_many of BATCH_MAX_ITEMS persons (one SELECT, one multi-row
+  INSERT and one commit), as POST /api/v1/persons:batch
+
+Usage:
+    python benchmarks/bench_batch_create.py [--items 2000] [--delay-ms 1]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from typing import List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.util import await_only
+
+from web_api_template.core.repository.manager.sqlalchemy.async_database import (
+    AsyncDatabase,
+)
+from web_api_template.core.repository.model.sqlalchemy import metadata
+from web_api_template.core.settings import settings
+from web_api_template.domain.entities.person_create import PersonCreate
+from web_api_template.infrastructure.repositories.sqlalchemy.person_write_repository_impl import (
+    PersonWriteRepositoryImpl,
+)
+
+
+def persons(prefix: str, items: int) -> List[PersonCreate]:
+    return [
+        PersonCreate(
+            name=f"Person{index}",
+            surname=f"Surname{index}",
+            email=f"email{index}@mail.com",
+            identification_number=f"{prefix}-{index}",
+        )
+        for index in range(items)
+    ]
+
+
+async def single(repository: PersonWriteRepositoryImpl, items: int) -> float:
+    """Items per second creating one person at a time"""
+    entities: List[PersonCreate] = persons("single", items)
+    start: float = time.perf_counter()
+    for entity in entities:
+        await repository.create(entity=entity)
+    return items / (time.perf_counter() - start)
+
+
+async def batch(repository: PersonWriteRepositoryImpl, items: int) -> float:
+    """Items per second creating BATCH_MAX_ITEMS persons at a time"""
+    entities: List[PersonCreate] = persons("batch", items)
+    start: float = time.perf_counter()
+    for first in range(0, items, settings.BATCH_MAX_ITEMS):
+        last: int = first + settings.BATCH_MAX_ITEMS
+        await repository.create_many(entities=entities[first:last])
+    return items / (time.perf_counter() - start)
+
+
+async def main(items: int, delay_ms: float) -> None:
+    # Statement logging would dominate the timings
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as folder:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(folder, 'bench.db')}"
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def inject_delay(*args, **kwargs):
+            # Non blocking wait (yields to the event loop), as a network round trip
+            await_only(asyncio.sleep(delay_ms / 1000))
+
+        # The repositories get their sessions from the DEFAULT database
+        AsyncDatabase._engines = {"DEFAULT": engine}
+        AsyncDatabase._sessions = {
+            "DEFAULT": sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        }
+        repository = PersonWriteRepositoryImpl()
+
+        print(
+            f"{items} persons, {delay_ms} ms per statement, "
+            f"batch of {settings.BATCH_MAX_ITEMS}"
+        )
+        print(f"{'mode':>6} | {'items/s':>9}")
+        print(f"{'single':>6} | {await single(repository, items):>9.0f}")
+        print(f"{'batch':>6} | {await batch(repository, items):>9.0f}")
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--delay-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    asyncio.run(main(items=args.items, delay_ms=args.delay_ms))
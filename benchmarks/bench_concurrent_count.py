@@ -0,0 +1,101 @@
+"""Sequential vs concurrent page count benchmark
+
+Uses a SQLite database (stand-in for a remote database) where every statement
+waits a fixed delay (without blocking the event loop) to simulate the network
+round trip. Measures the p50/p95 latency of AsyncPaginator.list when the count and
+the items query run one after the other, and concurrently on two connections.
+
+Usage:
+    python benchmarks/bench_concurrent_count.py [--delay-ms 20] [--requests 100]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import List
+
+from ksuid import Ksuid
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.util import await_only
+
+from web_api_template.core.repository.manager.sqlalchemy.async_paginator import (
+    AsyncPaginator,
+)
+from web_api_template.core.repository.model.sqlalchemy import metadata
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel
+
+ROWS: int = 10_000
+
+
+async def seed(engine) -> None:
+    """Inserts the persons"""
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(
+            insert(PersonModel),
+            [
+                {
+                    "id": str(Ksuid()),
+                    "name": f"Person{index}",
+                    "surname": f"Surname{index}",
+                    "email": f"email{index}@mail.com",
+                    "identification_number": f"ID-{index}",
+                    "version": 0,
+                }
+                for index in range(ROWS)
+            ],
+        )
+
+
+async def measure(async_session, concurrent: bool, requests: int) -> List[float]:
+    """Latencies (ms) of the list requests"""
+    timings: List[float] = []
+    for request in range(requests):
+        start: float = time.perf_counter()
+        async with async_session() as session:
+            await AsyncPaginator(
+                session, count_session_factory=async_session if concurrent else None
+            ).list(model=PersonModel, page=request % 50 + 1, size=20)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def main(delay_ms: float, requests: int) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(folder, 'bench.db')}",
+            pool_size=10,
+        )
+        await seed(engine)
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def inject_delay(*args, **kwargs):
+            # Non blocking wait (yields to the event loop), as a network round trip
+            await_only(asyncio.sleep(delay_ms / 1000))
+
+        async_session = async_sessionmaker(engine, class_=AsyncSession)
+
+        print(f"Round trip delay: {delay_ms} ms, {requests} requests")
+        print(f"{'mode':>12} | {'p50 (ms)':>9} | {'p95 (ms)':>9}")
+        for concurrent in (False, True):
+            timings: List[float] = await measure(async_session, concurrent, requests)
+            quantiles: List[float] = statistics.quantiles(timings, n=20)
+            print(
+                f"{'concurrent' if concurrent else 'sequential':>12} | "
+                f"{statistics.median(timings):>9.2f} | {quantiles[18]:>9.2f}"
+            )
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--delay-ms", type=float, default=20.0)
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    asyncio.run(main(delay_ms=args.delay_ms, requests=args.requests))
@@ -0,0 +1,87 @@
+"""JSON response encoders benchmark
+
+Renders pages of policies (the content FastAPI passes to the response class)
+with the standard library json (JSONResponse), orjson and msgspec, and prints
+the time per page.
+
+Usage:
+    python benchmarks/bench_json_response.py [--items 100 1000] [--repetitions 200]
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+from typing import Any, Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from ksuid import Ksuid
+
+from web_api_template.core.api.fast_json_response import ENCODERS, get_json_encoder
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.domain.aggregates import Policy
+from web_api_template.domain.types import (
+    CurrencyEnum,
+    PolicyStatusEnum,
+    PolicyTypeEnum,
+)
+
+
+def page(items: int) -> Any:
+    """Page of policies, as FastAPI passes it to the response class"""
+    start_date: date = date(2024, 1, 1)
+    return jsonable_encoder(
+        Page(
+            items=[
+                Policy(
+                    id=str(Ksuid()),
+                    policy_holder_id=str(Ksuid()),
+                    policy_number=f"POL-{index}",
+                    status=PolicyStatusEnum.ACTIVE,
+                    policy_type=PolicyTypeEnum.CAR,
+                    start_date=start_date + timedelta(days=index),
+                    end_date=start_date + timedelta(days=365 + index),
+                    premium=100.0 + index,
+                    currency=CurrencyEnum.EUR,
+                )
+                for index in range(items)
+            ],
+            total=items,
+        )
+    )
+
+
+def microseconds_per_page(
+    encode: Callable[[Any], bytes], content: Any, repetitions: int
+) -> float:
+    """Best time per page over the repetitions"""
+    best: float = float("inf")
+    for _ in range(repetitions):
+        start: float = time.perf_counter()
+        encode(content)
+        best = min(best, time.perf_counter() - start)
+    return best * 1_000_000
+
+
+def main(items: List[int], repetitions: int) -> None:
+    encoders = {name: get_json_encoder(name) for name in ENCODERS}
+
+    print(f"Best of {repetitions}")
+    print(f"{'items':>6} | " + " | ".join(f"{name + ' (us)':>14}" for name in encoders))
+    for size in items:
+        content: Any = page(size)
+        print(
+            f"{size:>6} | "
+            + " | ".join(
+                f"{microseconds_per_page(encode, content, repetitions):>14.1f}"
+                for encode in encoders.values()
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repetitions", type=int, default=200)
+    args = parser.parse_args()
+
+    main(items=args.items, repetitions=args.repetitions)
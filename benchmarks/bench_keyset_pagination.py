@@ -0,0 +1,114 @@
+"""Offset vs keyset pagination benchmark
+
+Seeds a SQLite database (stand-in for Postgres) with persons and measures the
+time to recover page 1, 1,000 and 100,000 with both pagination modes.
+
+Usage:
+    python benchmarks/bench_keyset_pagination.py [--rows 1000010] [--size 10]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import List
+
+from ksuid import Ksuid
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from web_api_template.core.repository.manager.sqlalchemy.async_paginator import (
+    AsyncPaginator,
+)
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.repository.model.sqlalchemy import metadata
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel
+
+PAGES: List[int] = [1, 1_000, 100_000]
+REPETITIONS: int = 5
+
+
+async def seed(engine, rows: int) -> None:
+    """Inserts the given number of persons"""
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+        chunk: int = 50_000
+        for start in range(0, rows, chunk):
+            await conn.execute(
+                insert(PersonModel),
+                [
+                    {
+                        "id": str(Ksuid()),
+                        "name": f"Person{index}",
+                        "surname": f"Surname{index}",
+                        "email": f"email{index}@mail.com",
+                        "identification_number": f"ID-{index}",
+                        "version": 0,
+                    }
+                    for index in range(start, min(start + chunk, rows))
+                ],
+            )
+
+
+async def cursor_for_page(session: AsyncSession, page: int, size: int) -> str:
+    """Gets the cursor that points to the given page (excluded from timings)"""
+    previous: Page = await AsyncPaginator(session).list(
+        model=PersonModel, page=page - 1, size=size
+    )
+    return previous.next_cursor
+
+
+async def timed(coroutine_factory) -> float:
+    """Best time (ms) over REPETITIONS executions"""
+    timings: List[float] = []
+    for _ in range(REPETITIONS):
+        start: float = time.perf_counter()
+        await coroutine_factory()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+async def main(rows: int, size: int) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(folder, 'bench.db')}"
+        )
+        print(f"Seeding {rows} persons ...")
+        await seed(engine, rows)
+
+        async_session = async_sessionmaker(engine, class_=AsyncSession)
+        async with async_session() as session:
+            print(f"{'page':>8} | {'offset (ms)':>12} | {'keyset (ms)':>12}")
+            for page in PAGES:
+                if (page - 1) * size >= rows:
+                    continue
+
+                offset_ms: float = await timed(
+                    lambda page=page: AsyncPaginator(session).list(
+                        model=PersonModel, page=page, size=size
+                    )
+                )
+
+                if page == 1:
+                    keyset_ms: float = offset_ms
+                else:
+                    cursor: str = await cursor_for_page(session, page, size)
+                    keyset_ms = await timed(
+                        lambda cursor=cursor: AsyncPaginator(session).list(
+                            model=PersonModel, size=size, cursor=cursor
+                        )
+                    )
+
+                print(f"{page:>8} | {offset_ms:>12.2f} | {keyset_ms:>12.2f}")
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_010)
+    parser.add_argument("--size", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(main(rows=args.rows, size=args.size))
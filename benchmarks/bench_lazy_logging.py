@@ -0,0 +1,98 @@
+"""CPU time per request of the log calls benchmark
+
+Runs the DEBUG log calls of a person update request (api, service,
+repository and permission check) with the logger at LOG_LEVEL (the stream
+sink writes to os.devnull). Prints the CPU time (time.process_time) by
+request of:
+
+- eager: f-string messages (formatted even if the level is filtered out)
+- lazy: loguru positional arguments, formatted only if a sink accepts the
+  level ("...: {}", value), and logger.opt(lazy=True) for computed values
+
+Usage:
+    python benchmarks/bench_lazy_logging.py [--requests 20000] [--level INFO]
+"""
+
+import argparse
+import os
+import time
+from typing import Callable, Dict, List
+
+from loguru import logger
+
+from web_api_template.domain.entities.person_create import PersonCreate
+from web_api_template.domain.entities.person_filter import PersonFilter
+
+FORMAT: str = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+)
+
+PERSON: PersonCreate = PersonCreate(
+    name="John",
+    surname="Doe",
+    email="johndoe@mail.com",
+    identification_number="123456789",
+)
+FILTER: PersonFilter = PersonFilter(name="John", surname="Doe")
+PERMISSIONS: List[str] = [f"persons:permission-{index}" for index in range(20)]
+ALLOWED: List[str] = ["persons:admin", "persons:write"]
+STATS: Dict[str, int] = {"hits": 1000, "misses": 10}
+
+
+def stats() -> Dict[str, int]:
+    return dict(STATS)
+
+
+def eager(id: str) -> None:
+    logger.debug(f"update request: {PERSON}")
+    logger.debug(f"Entering. id: {id} request: {PERSON}")
+    logger.debug(f"User with permissions {PERMISSIONS} not in {ALLOWED}")
+    logger.debug(f"Entering. filter: {FILTER}")
+    logger.debug(f"Person: {PERSON}")
+    logger.debug(f"Cache stats: {stats()}")
+
+
+def lazy(id: str) -> None:
+    logger.debug("update request: {}", PERSON)
+    logger.debug("Entering. id: {} request: {}", id, PERSON)
+    logger.debug("User with permissions {} not in {}", PERMISSIONS, ALLOWED)
+    logger.debug("Entering. filter: {}", FILTER)
+    logger.debug("Person: {}", PERSON)
+    logger.opt(lazy=True).debug("Cache stats: {}", stats)
+
+
+def measure(request: Callable[[str], None], requests: int) -> float:
+    """CPU microseconds by request"""
+    start: float = time.process_time()
+    for index in range(requests):
+        request(str(index))
+    return (time.process_time() - start) / requests * 1e6
+
+
+def main(requests: int, level: str) -> None:
+    print(f"{requests} requests, LOG_LEVEL={level}, 6 DEBUG records by request")
+    print(f"{'mode':>6} | {'CPU us/req':>10}")
+
+    with open(os.devnull, "w") as devnull:
+        logger.remove()
+        logger.add(devnull, level=level, format=FORMAT)
+
+        results: Dict[str, float] = {}
+        for name, request in (("eager", eager), ("lazy", lazy)):
+            # Warm up
+            measure(request, min(requests, 1000))
+            results[name] = measure(request, requests)
+            print(f"{name:>6} | {results[name]:>10.2f}")
+
+        logger.remove()
+
+    print(f"saved: {results['eager'] - results['lazy']:.2f} CPU us by request")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--level", default="INFO")
+    args = parser.parse_args()
+
+    main(requests=args.requests, level=args.level)
@@ -0,0 +1,165 @@
+"""Request latency with LOG_LEVEL=DEBUG benchmark
+
+Runs requests against a FastAPI app instrumented with OpenTelemetry, whose
+endpoint writes --logs DEBUG records (as a DEBUG-heavy request). The spans
+are serialized to OTLP protobuf in a BatchSpanProcessor (the export work,
+without network). The stream sinks write to os.devnull. Prints the request
+latency (p50/p95/p99) and the spans exported by request of:
+
+- before: stream sink with enqueue=True plus a span per record
+  (the former OpenTelemetryHandler)
+- after: BackgroundSink (bounded queue, batched writes in a thread) plus the
+  records as events of the request span (SpanEventSink)
+
+Usage:
+    python benchmarks/bench_logging.py [--requests 2000] [--concurrency 10] [--logs 30]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import time
+from typing import List, Sequence
+
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.trace import SpanKind
+from opentelemetry.trace.status import Status, StatusCode
+
+from web_api_template.core.log_sinks import BackgroundSink, SpanEventSink
+
+FORMAT: str = (
+    "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+)
+
+
+class SerializingExporter(SpanExporter):
+    """Encodes the spans as the OTLP exporter does, without sending them"""
+
+    spans: int = 0
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        SerializingExporter.spans += len(spans)
+        encode_spans(spans).SerializeToString()
+        return SpanExportResult.SUCCESS
+
+
+class OpenTelemetryHandler(logging.Handler):
+    """Former sink: a new span by record"""
+
+    def emit(self, record) -> None:
+        tracer = trace.get_tracer(__name__)
+        with tracer.start_as_current_span(
+            "loguru-span", kind=SpanKind.INTERNAL
+        ) as span:
+            span.set_attribute("loguru.message", record.getMessage())
+            span.set_status(Status(StatusCode.OK))
+            if record.exc_info:
+                span.record_exception(record.exc_info[1])
+
+
+def configure(mode: str, devnull) -> None:
+    logger.remove()
+    if mode == "before":
+        logger.add(devnull, level="DEBUG", format=FORMAT, enqueue=True)
+        logger.add(OpenTelemetryHandler(), level="DEBUG", format=FORMAT)
+    else:
+        logger.add(BackgroundSink(devnull), level="DEBUG", format=FORMAT)
+        logger.add(SpanEventSink(), level="DEBUG", format="{message}")
+
+
+def create_app(logs: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/persons/{id}")
+    async def get_person(id: str):
+        for index in range(logs):
+            logger.debug("Step {} of the request for: {}", index, id)
+        return {"id": id}
+
+    FastAPIInstrumentor.instrument_app(app)
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def request(index: int) -> None:
+            async with semaphore:
+                start: float = time.perf_counter()
+                await client.get(f"/persons/{index}")
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*[request(index) for index in range(requests)])
+
+    return sorted(latencies)
+
+
+def percentile(latencies: List[float], value: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * value))]
+
+
+def main(requests: int, concurrency: int, logs: int) -> None:
+    provider = TracerProvider()
+    processor = BatchSpanProcessor(SerializingExporter())
+    provider.add_span_processor(processor)
+    trace.set_tracer_provider(provider)
+
+    print(
+        f"{requests} requests, {concurrency} concurrent, "
+        f"{logs} DEBUG records by request"
+    )
+    print(
+        f"{'mode':>6} | {'p50 ms':>7} | {'p95 ms':>7} | {'p99 ms':>7} | "
+        f"{'mean ms':>7} | {'spans/req':>9}"
+    )
+
+    with open(os.devnull, "w") as devnull:
+        for mode in ("before", "after"):
+            configure(mode, devnull)
+            app = create_app(logs)
+            # Warm up
+            asyncio.run(run(app, min(requests, 100), concurrency))
+            processor.force_flush()
+            SerializingExporter.spans = 0
+
+            latencies: List[float] = asyncio.run(run(app, requests, concurrency))
+            processor.force_flush()
+
+            print(
+                f"{mode:>6} | {percentile(latencies, 0.5):>7.2f} | "
+                f"{percentile(latencies, 0.95):>7.2f} | "
+                f"{percentile(latencies, 0.99):>7.2f} | "
+                f"{statistics.mean(latencies):>7.2f} | "
+                f"{SerializingExporter.spans / requests:>9.1f}"
+            )
+
+        logger.remove()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--logs", type=int, default=30)
+    args = parser.parse_args()
+
+    main(requests=args.requests, concurrency=args.concurrency, logs=args.logs)
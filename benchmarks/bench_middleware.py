@@ -0,0 +1,124 @@
+"""Requests/sec through the middleware chain benchmark
+
+Runs GET requests against a FastAPI app with the middleware chain of the
+application (OpenTelemetry instrumentation, TransactionMiddleware,
+JwtAuthMiddleware, CORS, TraceIDMiddleware and UnitOfWorkMiddleware), without
+database access. Prints requests/sec and latency (p50/p99) of:
+
+- before: TraceIDMiddleware as a BaseHTTPMiddleware (a task and a wrapped
+  response stream by request), inside the instrumentation
+- after: pure ASGI TraceIDMiddleware (trace id of the request span), with the
+  instrumentation as the outermost middleware
+
+Usage:
+    python benchmarks/bench_middleware.py [--requests 5000] [--concurrency 10]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+import httpx
+from auth_middleware.jwt_auth_middleware import JwtAuthMiddleware
+from auth_middleware.providers.cognito.cognito_provider import CognitoProvider
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from ksuid import Ksuid
+from opentelemetry import trace
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.sdk.trace import TracerProvider
+from starlette.middleware.base import BaseHTTPMiddleware
+from transaction_middleware import TransactionMiddleware
+
+from web_api_template.core.logging import trace_id_context
+from web_api_template.core.middleware import TraceIDMiddleware, UnitOfWorkMiddleware
+
+
+class BaseHTTPTraceIDMiddleware(BaseHTTPMiddleware):
+    """Former TraceIDMiddleware"""
+
+    async def dispatch(self, request: Request, call_next):
+        trace_id_context.set(str(Ksuid()))
+        response = await call_next(request)
+        trace_id_context.set(None)
+        return response
+
+
+def create_app(mode: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/persons/{id}")
+    async def get_person(id: str):
+        return {"id": id, "trace_id": trace_id_context.get()}
+
+    if mode == "before":
+        FastAPIInstrumentor.instrument_app(app)
+
+    app.add_middleware(UnitOfWorkMiddleware)
+    app.add_middleware(
+        BaseHTTPTraceIDMiddleware if mode == "before" else TraceIDMiddleware
+    )
+    app.add_middleware(CORSMiddleware, allow_origins=["*"])
+    app.add_middleware(JwtAuthMiddleware, auth_provider=CognitoProvider())
+    app.add_middleware(TransactionMiddleware)
+
+    if mode == "after":
+        FastAPIInstrumentor.instrument_app(app)
+
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def request(index: int) -> None:
+            async with semaphore:
+                start: float = time.perf_counter()
+                await client.get(f"/persons/{index}")
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*[request(index) for index in range(requests)])
+
+    return sorted(latencies)
+
+
+def percentile(latencies: List[float], value: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * value))]
+
+
+def main(requests: int, concurrency: int) -> None:
+    trace.set_tracer_provider(TracerProvider())
+
+    print(f"{requests} requests, {concurrency} concurrent")
+    print(f"{'mode':>6} | {'req/s':>7} | {'p50 ms':>7} | {'p99 ms':>7}")
+
+    for mode in ("before", "after"):
+        app = create_app(mode)
+        # Warm up
+        asyncio.run(run(app, min(requests, 200), concurrency))
+
+        start: float = time.perf_counter()
+        latencies: List[float] = asyncio.run(run(app, requests, concurrency))
+        elapsed: float = time.perf_counter() - start
+
+        print(
+            f"{mode:>6} | {requests / elapsed:>7.0f} | "
+            f"{percentile(latencies, 0.5):>7.2f} | "
+            f"{percentile(latencies, 0.99):>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    main(requests=args.requests, concurrency=args.concurrency)
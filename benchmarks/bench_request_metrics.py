@@ -0,0 +1,101 @@
+"""Request metrics overhead benchmark
+
+Calls an ASGI app that answers a route of --routes (as the router, it sets the
+route in the scope) directly, without HTTP client, with and without
+RequestMetricsMiddleware. The metrics are recorded in the OpenTelemetry SDK
+with a Prometheus reader. Prints the CPU time (time.process_time) by request
+of both, the overhead, and the time to render /metrics (generate_latest).
+
+Usage:
+    python benchmarks/bench_request_metrics.py [--requests 100000] [--routes 50]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from opentelemetry import metrics
+from opentelemetry.exporter.prometheus import PrometheusMetricReader
+from opentelemetry.sdk.metrics import MeterProvider
+from prometheus_client import REGISTRY, generate_latest
+from starlette.types import Message, Receive, Scope, Send
+
+from web_api_template.core.middleware import RequestMetricsMiddleware
+
+
+class Route:
+    def __init__(self, path_format: str):
+        self.path_format = path_format
+
+
+def create_app(routes: int):
+    templates: List[Route] = [
+        Route(f"/api/v1/resource_{index}/{{id}}") for index in range(routes)
+    ]
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        scope["route"] = templates[scope["index"] % routes]
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    return app
+
+
+async def receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message: Message) -> None:
+    pass
+
+
+async def measure(app, requests: int) -> float:
+    """CPU microseconds by request"""
+    start: float = time.process_time()
+    for index in range(requests):
+        scope: Scope = {
+            "type": "http",
+            "method": "GET",
+            "path": f"/api/v1/resource/{index}",
+            "index": index,
+        }
+        await app(scope, receive, send)
+    return (time.process_time() - start) / requests * 1e6
+
+
+def main(requests: int, routes: int) -> None:
+    # As start_application: after the instruments are created
+    metrics.set_meter_provider(MeterProvider(metric_readers=[PrometheusMetricReader()]))
+
+    print(f"{requests} requests, {routes} routes")
+
+    bare = create_app(routes)
+    instrumented = RequestMetricsMiddleware(create_app(routes))
+
+    # Warm up (creates the series)
+    asyncio.run(measure(instrumented, routes * 10))
+
+    bare_us: float = asyncio.run(measure(bare, requests))
+    instrumented_us: float = asyncio.run(measure(instrumented, requests))
+    print(f"{'without metrics':>16} | {bare_us:>7.2f} CPU us/req")
+    print(f"{'with metrics':>16} | {instrumented_us:>7.2f} CPU us/req")
+    print(f"{'overhead':>16} | {instrumented_us - bare_us:>7.2f} CPU us/req")
+
+    start: float = time.perf_counter()
+    scrapes: int = 20
+    for _ in range(scrapes):
+        size: int = len(generate_latest(REGISTRY))
+    print(
+        f"/metrics render: {(time.perf_counter() - start) / scrapes * 1000:.2f} ms "
+        f"({size} bytes)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--routes", type=int, default=50)
+    args = parser.parse_args()
+
+    main(requests=args.requests, routes=args.routes)
@@ -0,0 +1,75 @@
+"""selective_cache hit latency benchmark
+
+Calls a cached coroutine (SimpleMemoryCache, key always in the cache) with
+the previous selective_cache implementation (aiocache decorator rebuilt on
+every call) and with the current one (decorator built once), and prints the
+mean latency of a cache hit.
+
+Usage:
+    python benchmarks/bench_selective_cache.py [--calls 100000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from aiocache import cached, caches
+
+from web_api_template.core.selective_cache import selective_cache, set_cache_enabled
+
+ALIAS: str = "bench"
+
+
+def previous_selective_cache(ttl=60, key_builder=None, alias="default"):
+    """selective_cache before the fix"""
+
+    def decorator(func):
+        async def wrapper(*args, **kwargs):
+            return await cached(ttl=ttl, key_builder=key_builder, alias=alias)(func)(
+                *args, **kwargs
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def key_builder(f, *args, **kwargs) -> str:
+    return f"{f.__name__}_{kwargs['username']}_permissions"
+
+
+@previous_selective_cache(ttl=600, alias=ALIAS, key_builder=key_builder)
+async def before(*, username: str) -> list:
+    return ["read", "write"]
+
+
+@selective_cache(ttl=600, alias=ALIAS, key_builder=key_builder)
+async def after(*, username: str) -> list:
+    return ["read", "write"]
+
+
+async def microseconds_per_hit(func, calls: int) -> float:
+    """Mean latency of the cache hits"""
+    await func(username="john")
+    start: float = time.perf_counter()
+    for _ in range(calls):
+        await func(username="john")
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+async def main(calls: int) -> None:
+    caches.add(ALIAS, {"cache": "aiocache.SimpleMemoryCache"})
+    set_cache_enabled(True)
+
+    print(f"{calls} cache hits")
+    print(f"{'mode':>8} | {'us/call':>8}")
+    for name, func in (("before", before), ("after", after)):
+        print(f"{name:>8} | {await microseconds_per_hit(func, calls):>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    asyncio.run(main(calls=args.calls))
@@ -0,0 +1,102 @@
+"""Trusted rows serialization benchmark
+
+Builds a page of persons from ORM rows and serializes it to JSON, as the list
+endpoints do:
+
+- before: entities validated by pydantic, then validated again and encoded by
+  FastAPI (response_model) and JSONResponse
+- after: entities built without validation (model_construct) and the page
+  serialized once with model_dump_json
+
+Prints the CPU time per item.
+
+Usage:
+    python benchmarks/bench_serialization.py [--items 100] [--repetitions 200]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from ksuid import Ksuid
+
+from web_api_template.core.api import model_response
+from web_api_template.core.repository.converters import ConverterRegistry
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.domain.entities.person import Person
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel
+
+
+def persons(items: int) -> List[PersonModel]:
+    return [
+        PersonModel(
+            id=str(Ksuid()),
+            name=f"Person{index}",
+            surname=f"Surname{index}",
+            email=f"email{index}@mail.com",
+            identification_number=f"ID-{index}",
+            version=1,
+        )
+        for index in range(items)
+    ]
+
+
+async def before(rows: List[PersonModel]) -> bytes:
+    convert = validated.get(PersonModel, Person)
+    page: Page = Page(items=[convert(row) for row in rows], total=len(rows))
+    content: Any = await serialize_response(field=response_field, response_content=page)
+    return JSONResponse(content=content).body
+
+
+async def after(rows: List[PersonModel]) -> bytes:
+    convert = trusted.get(PersonModel, Person)
+    page: Page = Page.model_construct(
+        items=[convert(row) for row in rows], total=len(rows)
+    )
+    return model_response(page).body
+
+
+async def microseconds_per_item(
+    serialize: Callable[[List[PersonModel]], Awaitable[bytes]],
+    rows: List[PersonModel],
+    repetitions: int,
+) -> float:
+    """Best CPU time per item over the repetitions"""
+    best: float = float("inf")
+    for _ in range(repetitions):
+        start: float = time.process_time()
+        await serialize(rows)
+        best = min(best, time.process_time() - start)
+    return best / len(rows) * 1_000_000
+
+
+validated: ConverterRegistry = ConverterRegistry()
+validated.register(PersonModel, Person)
+trusted: ConverterRegistry = ConverterRegistry()
+trusted.register(PersonModel, Person, validate=False)
+response_field = create_response_field(name="response", type_=Page)
+
+
+async def main(items: int, repetitions: int) -> None:
+    rows: List[PersonModel] = persons(items)
+    assert await before(rows) == await after(rows)
+
+    print(f"Page of {items} persons, best of {repetitions}")
+    print(f"{'mode':>8} | {'us/item':>8}")
+    for name, serialize in (("before", before), ("after", after)):
+        print(
+            f"{name:>8} | {await microseconds_per_item(serialize, rows, repetitions):>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--repetitions", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(items=args.items, repetitions=args.repetitions))
@@ -0,0 +1,94 @@
+"""Cache expiry thundering herd load test
+
+N concurrent requests read a popular key (SimpleMemoryCache) right after it
+expires; every miss runs a "database query" (fixed delay). Prints the number
+of queries per expiry and the p95 request latency:
+
+- before: aiocache decorator (every concurrent miss queries the database)
+- single-flight: selective_cache (concurrent misses share one query)
+- stale-while-revalidate: selective_cache with stale_ttl (the expired value
+  is served while one background task refreshes it)
+
+Usage:
+    python benchmarks/bench_single_flight.py [--requests 100] [--query-ms 20]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from aiocache import cached, caches
+
+from web_api_template.core.selective_cache import selective_cache, set_cache_enabled
+
+ALIAS: str = "bench"
+TTL: float = 0.2
+
+caches.add(ALIAS, {"cache": "aiocache.SimpleMemoryCache"})
+
+
+class Database:
+    queries: int = 0
+    delay: float = 0.02
+
+    @classmethod
+    async def query(cls) -> List[str]:
+        cls.queries += 1
+        await asyncio.sleep(cls.delay)
+        return ["read", "write"]
+
+
+@cached(ttl=TTL, alias=ALIAS, key="before")
+async def before() -> List[str]:
+    return await Database.query()
+
+
+@selective_cache(ttl=TTL, alias=ALIAS, key_builder=lambda f: "single_flight")
+async def single_flight() -> List[str]:
+    return await Database.query()
+
+
+@selective_cache(
+    ttl=TTL, stale_ttl=60, alias=ALIAS, key_builder=lambda f: "stale_while_revalidate"
+)
+async def stale_while_revalidate() -> List[str]:
+    return await Database.query()
+
+
+async def timed(func) -> float:
+    start: float = time.perf_counter()
+    await func()
+    return (time.perf_counter() - start) * 1000
+
+
+async def expiry(func, requests: int) -> tuple:
+    """Queries and p95 latency (ms) of the requests after an expiry"""
+    await func()
+    await asyncio.sleep(TTL * 2)
+
+    Database.queries = 0
+    timings: List[float] = await asyncio.gather(*[timed(func) for _ in range(requests)])
+    await asyncio.sleep(Database.delay * 2)
+    return Database.queries, statistics.quantiles(timings, n=20)[18]
+
+
+async def main(requests: int, query_ms: float) -> None:
+    set_cache_enabled(True)
+    Database.delay = query_ms / 1000
+
+    print(f"{requests} concurrent requests after expiry, query {query_ms} ms")
+    print(f"{'mode':>24} | {'queries':>7} | {'p95 (ms)':>8}")
+    for func in (before, single_flight, stale_while_revalidate):
+        queries, p95 = await expiry(func, requests)
+        print(f"{func.__name__:>24} | {queries:>7} | {p95:>8.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--query-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    asyncio.run(main(requests=args.requests, query_ms=args.query_ms))
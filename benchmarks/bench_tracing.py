@@ -0,0 +1,159 @@
+"""Tracing overhead benchmark
+
+Runs requests against a FastAPI app instrumented with OpenTelemetry, whose
+endpoint opens --spans child spans (as the SQL statement spans) and fails
+(500) one request out of 100. The spans are serialized to OTLP protobuf in a
+BatchSpanProcessor (the export work, without network). Prints requests/sec,
+latency (p50/p99) and the spans exported by request of:
+
+- off: no tracer provider (no-op)
+- sampled: parent based ratio sampler (--ratio), the other traces are dropped
+- tail: sampled, plus the errors and slow requests of the other traces
+  (recorded, exported only if kept)
+- full: every trace (the former configuration)
+
+Usage:
+    python benchmarks/bench_tracing.py [--requests 3000] [--concurrency 10] [--spans 5] [--ratio 0.1]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Optional, Sequence
+
+import httpx
+from fastapi import FastAPI, HTTPException
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+
+from web_api_template.core.tracing import TailSampler, TailSpanProcessor
+
+
+class SerializingExporter(SpanExporter):
+    """Encodes the spans as the OTLP exporter does, without sending them"""
+
+    spans: int = 0
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        SerializingExporter.spans += len(spans)
+        encode_spans(spans).SerializeToString()
+        return SpanExportResult.SUCCESS
+
+
+def create_provider(mode: str, ratio: float) -> Optional[TracerProvider]:
+    if mode == "off":
+        return None
+
+    tail: bool = mode == "tail"
+    provider = TracerProvider(
+        sampler=TailSampler(1 if mode == "full" else ratio, record_unsampled=tail)
+    )
+    processor: SpanProcessor = BatchSpanProcessor(SerializingExporter())
+    if tail:
+        processor = TailSpanProcessor(
+            processor, keep_errors=True, slow_threshold_ms=1000
+        )
+    provider.add_span_processor(processor)
+    return provider
+
+
+def create_app(provider: Optional[TracerProvider], spans: int) -> FastAPI:
+    app = FastAPI()
+    tracer = (provider or trace.NoOpTracerProvider()).get_tracer(__name__)
+
+    @app.get("/persons/{id}")
+    async def get_person(id: int):
+        for _ in range(spans):
+            with tracer.start_as_current_span("SELECT DEFAULT") as span:
+                span.set_attribute("db.statement", "SELECT * FROM persons")
+        if id % 100 == 0:
+            raise HTTPException(status_code=500)
+        return {"id": id}
+
+    FastAPIInstrumentor.instrument_app(
+        app, tracer_provider=provider or trace.NoOpTracerProvider()
+    )
+    return app
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> List[float]:
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def request(index: int) -> None:
+            async with semaphore:
+                start: float = time.perf_counter()
+                await client.get(f"/persons/{index}")
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*[request(index) for index in range(requests)])
+
+    return sorted(latencies)
+
+
+def percentile(latencies: List[float], value: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * value))]
+
+
+def main(requests: int, concurrency: int, spans: int, ratio: float) -> None:
+    print(
+        f"{requests} requests, {concurrency} concurrent, {spans} child spans by "
+        f"request, ratio {ratio}"
+    )
+    print(
+        f"{'mode':>7} | {'req/s':>7} | {'p50 ms':>7} | {'p99 ms':>7} | "
+        f"{'mean ms':>7} | {'spans/req':>9}"
+    )
+
+    for mode in ("off", "sampled", "tail", "full"):
+        provider = create_provider(mode, ratio)
+        app = create_app(provider, spans)
+        # Warm up
+        asyncio.run(run(app, min(requests, 200), concurrency))
+        if provider:
+            provider.force_flush()
+        SerializingExporter.spans = 0
+
+        start: float = time.perf_counter()
+        latencies: List[float] = asyncio.run(run(app, requests, concurrency))
+        elapsed: float = time.perf_counter() - start
+        if provider:
+            provider.force_flush()
+            provider.shutdown()
+
+        print(
+            f"{mode:>7} | {requests / elapsed:>7.0f} | "
+            f"{percentile(latencies, 0.5):>7.2f} | "
+            f"{percentile(latencies, 0.99):>7.2f} | "
+            f"{statistics.mean(latencies):>7.2f} | "
+            f"{SerializingExporter.spans / requests:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--spans", type=int, default=5)
+    parser.add_argument("--ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    main(
+        requests=args.requests,
+        concurrency=args.concurrency,
+        spans=args.spans,
+        ratio=args.ratio,
+    )
@@ -1,9 +1,11 @@
-from typing import List, Optional
+from typing import AsyncIterator, Optional
 
 from pydilite import inject
 
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.exceptions import ItemNotFoundException
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
 from web_api_template.domain.exceptions import AddressNotFoundException
 from web_api_template.domain.repository import AddressReadRepository
 from web_api_template.domain.value_objects.address import Address
@@ -17,42 +19,64 @@ class ReadService:
     def __init__(self, address_db_repo: AddressReadRepository):
         self.address_db_repo = address_db_repo
 
-    async def get_list_by_person_id(self, person_id: str) -> List[Address]:
+    async def get_list_by_person_id(
+        self, person_id: str, pagination: PaginationQueryModel
+    ) -> Page:
         """
-        Get a list of addresses
+        Get a page of addresses for a given person
 
         Args:
             person_id (str): person id
-            filter (AddressFilter): Address related filter
+            pagination (PaginationQueryModel): Pagination and sorting
 
         Returns:
-            List[Address]: domain entity to return
+            Page: page of domain entities
         """
 
-        logger.debug(f"Entering. person: {person_id}")
+        logger.debug("Entering. person: {}", person_id)
 
-        entities: List[Address] = await self.address_db_repo.get_list_by_person_id(
-            person_id=person_id
+        result: Page = await self.address_db_repo.get_paginated_list(
+            filter=AddressFilter(person_id=person_id), pagination=pagination
         )
 
-        return entities
+        return result
 
-    async def get_list(self, filter: AddressFilter) -> List[Address]:
+    async def get_list(
+        self, filter: AddressFilter, pagination: PaginationQueryModel
+    ) -> Page:
         """
-        Get a list of addresses
+        Get a page of addresses
 
         Args:
             filter (AddressFilter): Address related filter
+            pagination (PaginationQueryModel): Pagination and sorting
 
         Returns:
-            List[Address]: domain entity to return
+            Page: page of domain entities
         """
 
         logger.debug("Entering. filter: {}", filter)
 
-        entities: List[Address] = await self.address_db_repo.get_list(filter=filter)
+        result: Page = await self.address_db_repo.get_paginated_list(
+            filter=filter, pagination=pagination
+        )
+
+        return result
+
+    async def export(self, filter: AddressFilter) -> AsyncIterator[Address]:
+        """
+        Get all the filtered addresses as they are recovered from the database
+
+        Args:
+            filter (AddressFilter): Address related filter
+
+        Returns:
+            AsyncIterator[Address]: domain entities to export
+        """
+
+        logger.debug("Entering. filter: {}", filter)
 
-        return entities
+        return await self.address_db_repo.stream_list(filter=filter)
 
     async def get_by_id(self, id: str) -> Optional[Address]:
         """
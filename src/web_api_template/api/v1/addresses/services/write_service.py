@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydilite import inject
+from web_api_template.core.api import BatchResult, batch_result
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.exceptions import ItemNotFoundException
 from web_api_template.domain.exceptions import (
@@ -57,6 +58,41 @@ class WriteService:
             # Domain exception raise if template does not exists
             raise PersonNotFoundException(id=person_id)
 
+    async def create_many_for_person(
+        self,
+        # current_user: User,
+        person_id: str,
+        requests: List[AddressCreate],
+    ) -> BatchResult:
+        """
+        Create addresses of a person in one transaction
+
+        Args:
+            person_id (str): The person ID to associate the addresses with.
+            requests (List[AddressCreate]): The requested addresses to create.
+
+        Raises:
+            PersonNotFoundException: If the person does not exist
+
+        Returns:
+            BatchResult: The result of every address.
+        """
+
+        logger.debug("Entering. person_id: {} addresses: {}", person_id, len(requests))
+
+        try:
+            results: List[Address] = await self.address_db_repo.create_many(
+                # current_user=current_user,
+                person_id=person_id,
+                entities=requests,
+            )
+
+            return batch_result(results)
+
+        except ItemNotFoundException:
+            # Domain exception raise if person does not exists
+            raise PersonNotFoundException(id=person_id)
+
     async def delete_by_person_and_id(self, person_id: str, id: str):
         """
         Delete the Address object with the given ID
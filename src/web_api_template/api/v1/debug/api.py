@@ -0,0 +1,76 @@
+""" Api definition
+    All validations and mappings should be in the services
+"""
+
+from typing import List, Literal
+
+from auth_middleware.functions import require_groups, require_user
+from fastapi import APIRouter, Depends, Query, status
+from starlette.requests import Request
+
+from web_api_template.core.api import ProblemDetail
+from web_api_template.core.logging import logger
+
+from .response import SlowQueryResponse
+from .services import DebugService
+
+api_router = APIRouter()
+
+
+@api_router.get(
+    "/slow-queries",
+    status_code=status.HTTP_200_OK,
+    response_model=List[SlowQueryResponse],
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ProblemDetail,
+            "description": "Internal Server Error",
+        },
+    },
+    dependencies=[
+        Depends(require_groups(["administrator"])),
+        Depends(require_user()),
+    ],
+)
+async def get_slow_queries(
+    request: Request,
+    limit: int = Query(20, ge=1, le=500),
+    order_by: Literal["total_ms", "max_ms", "mean_ms", "count"] = Query("total_ms"),
+) -> List[SlowQueryResponse]:
+    """
+    Slowest SQL statements of this process (instance), by fingerprint
+
+    Returns:
+        List[SlowQueryResponse]: statistics, slowest first
+    """
+
+    logger.debug("Slow queries by: {}", order_by)
+
+    return [
+        SlowQueryResponse(**stats)
+        for stats in DebugService().get_slow_queries(limit=limit, order_by=order_by)
+    ]
+
+
+@api_router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ProblemDetail,
+            "description": "Internal Server Error",
+        },
+    },
+    dependencies=[
+        Depends(require_groups(["administrator"])),
+        Depends(require_user()),
+    ],
+)
+async def delete_slow_queries(
+    request: Request,
+) -> None:
+    """
+    Resets the slow query statistics of this process (instance)
+    """
+
+    DebugService().reset_slow_queries()
@@ -0,0 +1,5 @@
+from .slow_query_response import SlowQueryResponse
+
+__all__ = [
+    "SlowQueryResponse",
+]
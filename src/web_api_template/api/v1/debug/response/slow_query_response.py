@@ -0,0 +1,35 @@
+from pydantic import BaseModel, Field
+
+
+class SlowQueryResponse(BaseModel):
+    """Statistics of a statement fingerprint"""
+
+    label: str = Field(
+        ..., json_schema_extra={"description": "Database label", "example": "DEFAULT"}
+    )
+    fingerprint: str = Field(
+        ...,
+        json_schema_extra={
+            "description": "Statement without literals nor bind parameters",
+            "example": "SELECT persons.id FROM persons WHERE persons.id = ?",
+        },
+    )
+    count: int = Field(
+        ..., json_schema_extra={"description": "Executions", "example": "120"}
+    )
+    total_ms: float = Field(
+        ..., json_schema_extra={"description": "Total time (ms)", "example": "360.0"}
+    )
+    mean_ms: float = Field(
+        ..., json_schema_extra={"description": "Mean time (ms)", "example": "3.0"}
+    )
+    max_ms: float = Field(
+        ..., json_schema_extra={"description": "Max time (ms)", "example": "45.0"}
+    )
+    rows: int = Field(
+        ...,
+        json_schema_extra={
+            "description": "Rows returned or affected (when the driver reports them)",
+            "example": "120",
+        },
+    )
@@ -0,0 +1,5 @@
+from .debug_service import DebugService
+
+__all__ = [
+    "DebugService",
+]
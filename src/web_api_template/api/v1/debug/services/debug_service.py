@@ -0,0 +1,25 @@
+from typing import Any, Dict, List
+
+from web_api_template.core.repository.manager.sqlalchemy.query_tracing import (
+    slow_query_table,
+)
+
+
+class DebugService:
+    """Diagnostic operations"""
+
+    def get_slow_queries(self, limit: int, order_by: str) -> List[Dict[str, Any]]:
+        """Slowest statement fingerprints of this process
+
+        Args:
+            limit (int): _description_
+            order_by (str): total_ms, max_ms, mean_ms or count
+
+        Returns:
+            List[Dict[str, Any]]: _description_
+        """
+        return slow_query_table.top(limit=limit, order_by=order_by)
+
+    def reset_slow_queries(self) -> None:
+        """Clears the statistics (i.e. before a load test)"""
+        slow_query_table.clear()
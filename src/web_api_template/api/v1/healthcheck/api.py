@@ -2,14 +2,17 @@
     All validations and mappings should be in the services
 """
 
-from fastapi import APIRouter, HTTPException, status
+from typing import List
+
+from auth_middleware.functions import require_groups, require_user
+from fastapi import APIRouter, Depends, HTTPException, status
 from starlette.requests import Request
 
 from web_api_template.core.api import ProblemDetail
 from web_api_template.core.logging import logger
 from web_api_template.core.settings import settings
 
-from .response import HealthCheckResponse
+from .response import HealthCheckDetailResponse, HealthCheckResponse, PoolStatusResponse
 from .services import HealthcheckService
 
 api_router = APIRouter()
@@ -47,3 +50,48 @@ async def get(
     else:
         logger.debug("Healthcheck failed")
         raise HTTPException(status_code=503, detail="Unhealthy")
+
+
+@api_router.get(
+    "/detail",
+    status_code=status.HTTP_200_OK,
+    response_model=HealthCheckDetailResponse,
+    responses={
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ProblemDetail,
+        },
+    },
+    dependencies=[
+        Depends(require_groups(["administrator"])),
+        Depends(require_user()),
+    ],
+)
+async def get_detail(
+    request: Request,
+) -> HealthCheckDetailResponse:
+    """
+    Healthcheck detail for operators (administrators only): connection pool
+    statistics of every database. Status is Degraded when a pool has warnings
+    (i.e. checkout time over POOL_WAIT_WARNING_MS) and Unhealthy when the services can not be verified
+
+    Returns:
+        HealthCheckDetailResponse: health information
+    """
+
+    logger.debug("Healthcheck detail started")
+
+    service: HealthcheckService = HealthcheckService()
+    databases: List[PoolStatusResponse] = [
+        PoolStatusResponse(**pool_status) for pool_status in service.pool_status()
+    ]
+
+    if not await service.verify():
+        health_status: str = "Unhealthy"
+    elif any(database.warnings for database in databases):
+        health_status = "Degraded"
+    else:
+        health_status = "Healthy"
+
+    return HealthCheckDetailResponse(
+        status=health_status, version=settings.PROJECT_VERSION, databases=databases
+    )
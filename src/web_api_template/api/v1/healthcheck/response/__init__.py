@@ -1,5 +1,9 @@
+from .health_check_detail_response import HealthCheckDetailResponse
 from .health_check_response import HealthCheckResponse
+from .pool_status_response import PoolStatusResponse
 
 __all__ = [
+    "HealthCheckDetailResponse",
     "HealthCheckResponse",
+    "PoolStatusResponse",
 ]
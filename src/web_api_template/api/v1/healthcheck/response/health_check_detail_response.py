@@ -0,0 +1,15 @@
+from typing import List
+
+from pydantic import Field
+
+from .health_check_response import HealthCheckResponse
+from .pool_status_response import PoolStatusResponse
+
+
+class HealthCheckDetailResponse(HealthCheckResponse):
+    """Health check response with the detail of every component"""
+
+    databases: List[PoolStatusResponse] = Field(
+        default=[],
+        json_schema_extra={"description": "Connection pool of every database"},
+    )
@@ -0,0 +1,72 @@
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class PoolStatusResponse(BaseModel):
+    """Connection pool statistics of a database"""
+
+    label: str = Field(
+        ..., json_schema_extra={"description": "Database label", "example": "DEFAULT"}
+    )
+    size: int = Field(
+        ..., json_schema_extra={"description": "Pool size", "example": "5"}
+    )
+    checked_out: int = Field(
+        ...,
+        json_schema_extra={"description": "Connections in use", "example": "3"},
+    )
+    overflow: int = Field(
+        ...,
+        json_schema_extra={"description": "Connections over pool size", "example": "0"},
+    )
+    checkouts: int = Field(
+        ..., json_schema_extra={"description": "Checkouts", "example": "1500"}
+    )
+    connects: int = Field(
+        ...,
+        json_schema_extra={"description": "New connections created", "example": "5"},
+    )
+    invalidations: int = Field(
+        ...,
+        json_schema_extra={"description": "Connections invalidated", "example": "0"},
+    )
+    timeouts: int = Field(
+        ...,
+        json_schema_extra={
+            "description": "Checkouts timed out (pool_timeout)",
+            "example": "0",
+        },
+    )
+    wait_p50_ms: float = Field(
+        ...,
+        json_schema_extra={
+            "description": "Checkout time median (ms), last checkouts",
+            "example": "0.2",
+        },
+    )
+    wait_p95_ms: float = Field(
+        ...,
+        json_schema_extra={
+            "description": "Checkout time p95 (ms), last checkouts",
+            "example": "1.5",
+        },
+    )
+    wait_max_ms: float = Field(
+        ...,
+        json_schema_extra={
+            "description": "Checkout time max (ms), last checkouts",
+            "example": "12.0",
+        },
+    )
+    connect_time_ms: float = Field(
+        ...,
+        json_schema_extra={
+            "description": "Time to create the last new connection (ms)",
+            "example": "25.0",
+        },
+    )
+    warnings: List[str] = Field(
+        default=[],
+        json_schema_extra={"description": "Saturation warnings"},
+    )
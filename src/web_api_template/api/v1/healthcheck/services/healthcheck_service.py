@@ -1,3 +1,5 @@
+from typing import Any, Dict, List
+
 from pydilite import inject
 
 from web_api_template.core.settings import settings
@@ -22,3 +24,14 @@ class HealthcheckService:
 
         # TODO: Verify every component, if needed
         return await self.hc_db_repo.verify() if settings.HEALTHCHECK_DATABASE else True
+
+    def pool_status(
+        self,
+    ) -> List[Dict[str, Any]]:
+        """Connection pool statistics of every database (with the warnings
+        when the checkout time exceeds POOL_WAIT_WARNING_MS)
+
+        Returns:
+            List[Dict[str, Any]]: _description_
+        """
+        return self.hc_db_repo.pool_status()
@@ -0,0 +1,35 @@
+""" Api definition
+"""
+
+from fastapi import APIRouter, Response, status
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+from starlette.requests import Request
+
+from web_api_template.core.logging import logger
+
+api_router = APIRouter()
+
+
+@api_router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    include_in_schema=False,
+)
+async def get(
+    request: Request,
+) -> Response:
+    """
+    Metrics in the Prometheus exposition format (scraped by Prometheus):
+    requests by route, caches, database connection pools and process
+
+    Returns:
+        Response: _description_
+    """
+
+    logger.debug("Metrics scrape")
+
+    # Content type in the headers: as media_type, a second charset is appended
+    return Response(
+        content=generate_latest(REGISTRY), headers={"Content-Type": CONTENT_TYPE_LATEST}
+    )
@@ -0,0 +1,11 @@
+""" Api Routes
+"""
+
+from fastapi import APIRouter
+
+from . import api
+
+ROUTE_PREFIX: str = "/metrics"
+
+api_router = APIRouter()
+api_router.include_router(api.api_router, prefix=ROUTE_PREFIX, tags=["Metrics"])
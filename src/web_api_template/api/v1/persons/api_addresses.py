@@ -5,13 +5,21 @@
 from typing import List
 
 from auth_middleware.functions import require_groups
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Path, status
 from starlette.requests import Request
 from starlette.responses import Response
 
 from web_api_template.api.v1.addresses.services import ReadService, WriteService
-from web_api_template.core.api import ProblemDetail
+from web_api_template.core.api import (
+    BatchResult,
+    ProblemDetail,
+    conditional_model_response,
+    model_response,
+)
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
 from web_api_template.core.logging import logger
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.settings import settings
 from web_api_template.domain.value_objects import Address, AddressCreate
 
 api_router = APIRouter()
@@ -19,7 +27,7 @@ api_router = APIRouter()
 
 @api_router.get(
     "/{person_id}/addresses",
-    response_model=List[Address],
+    response_model=Page,
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_500_INTERNAL_SERVER_ERROR: {
@@ -34,7 +42,8 @@ async def get_addresses_by_person(
     request: Request,
     response: Response,
     person_id: str = Path(..., description="The ID of the person"),
-) -> List[Address]:
+    pagination: PaginationQueryModel = Depends(),
+) -> Response:
     """Get a list of addresses associated with the person.
 
     Args:
@@ -43,7 +52,7 @@ async def get_addresses_by_person(
         id (str, optional): _description_. Defaults to Path(..., description="The ID of the person").
 
     Returns:
-        List[Address]: _description_
+        Response: Page (JSON)
     """
 
     # TODO: Filter addresses by status
@@ -54,10 +63,10 @@ async def get_addresses_by_person(
     # Check if person exists
     # TODO: create an "exists" method on service
 
-    result: List[Address] = await ReadService().get_list_by_person_id(
-        person_id=person_id
+    result: Page = await ReadService().get_list_by_person_id(
+        person_id=person_id, pagination=pagination
     )
-    return result
+    return conditional_model_response(request, result)
 
 
 @api_router.post(
@@ -112,3 +121,55 @@ async def add_address(
     )
 
     return entity
+
+
+@api_router.post(
+    "/{person_id}/addresses:batch",
+    response_model=BatchResult,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_403_FORBIDDEN: {
+            "model": ProblemDetail,
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ProblemDetail,
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "model": ProblemDetail,
+            "description": "Person not found",
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ProblemDetail,
+        },
+    },
+    dependencies=[
+        Depends(require_groups(["customer"])),
+    ],
+)
+async def create_addresses_batch(
+    request: Request,
+    response: Response,
+    addresses: List[AddressCreate] = Body(
+        ..., min_length=1, max_length=settings.BATCH_MAX_ITEMS
+    ),
+    person_id: str = Path(..., description="The ID of the person"),
+) -> Response:
+    """Create up to BATCH_MAX_ITEMS addresses for the given person in one transaction.
+
+    Args:
+        request (Request): _description_
+        response (Response): _description_
+        addresses (List[AddressCreate]): _description_
+        person_id (str): _description_
+
+    Returns:
+        Response: BatchResult
+    """
+
+    result: BatchResult = await WriteService().create_many_for_person(
+        # current_user=current_user,
+        person_id=person_id,
+        requests=addresses,
+    )
+
+    return model_response(result)
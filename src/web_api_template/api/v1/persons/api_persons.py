@@ -2,21 +2,33 @@
     All validations and mappings should be in the services
 """
 
+from typing import AsyncIterator, List, Optional
+
 from auth_middleware.functions import require_groups, require_user
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Header, Query, status
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
 from web_api_template.api.v1.persons.services import ReadService, WriteService
-from web_api_template.core.api import ProblemDetail
+from web_api_template.core.api import (
+    BatchResult,
+    ExportFormatEnum,
+    ProblemDetail,
+    conditional_model_response,
+    export_response,
+    model_response,
+)
 from web_api_template.core.api.pagination_query_model import PaginationQueryModel
 from web_api_template.core.auth.functions import require_permissions
+from web_api_template.core.http.etag import entity_etag, etag_version
 from web_api_template.core.http.validators import ksuid_path_validator
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.settings import settings
 from web_api_template.domain.entities.person import Person
 from web_api_template.domain.entities.person_create import PersonCreate
 from web_api_template.domain.entities.person_filter import PersonFilter
+from web_api_template.domain.exceptions import PersonAlreadyModifiedException
 
 api_router = APIRouter()
 
@@ -42,7 +54,7 @@ async def get_list(
     response: Response,
     list_filter: PersonFilter = Depends(),
     pagination: PaginationQueryModel = Depends(),
-) -> Page:
+) -> Response:
     """Get a list of persons
 
     Args:
@@ -57,7 +69,55 @@ async def get_list(
         filter=list_filter,
         pagination=pagination,
     )
-    return result
+    return conditional_model_response(request, result)
+
+
+@api_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "All the filtered persons (NDJSON or CSV)",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ProblemDetail,
+            "description": "Invalid filter",
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ProblemDetail,
+            "description": "Internal Server Error",
+        },
+    },
+    dependencies=[
+        Depends(require_permissions(["persons.list", "persons.read"])),
+        Depends(require_groups(["customer", "administrator"])),
+        Depends(require_user()),
+    ],
+)
+async def export(
+    request: Request,
+    response: Response,
+    list_filter: PersonFilter = Depends(),
+    export_format: ExportFormatEnum = Query(
+        default=ExportFormatEnum.NDJSON, alias="format"
+    ),
+) -> StreamingResponse:
+    """Export all the filtered persons.
+    Rows are streamed from a server side cursor as they are recovered.
+
+    Args:
+        request (Request): _description_
+        response (Response): _description_
+        export_format (ExportFormatEnum): ndjson or csv
+
+    Returns:
+        StreamingResponse: _description_
+    """
+
+    items: AsyncIterator[Person] = await ReadService().export(filter=list_filter)
+    return export_response(items, export_format=export_format, filename="persons")
 
 
 @api_router.get(
@@ -65,6 +125,9 @@ async def get_list(
     response_model=Person,
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "Not modified (ETag in If-None-Match)",
+        },
         status.HTTP_404_NOT_FOUND: {
             "model": ProblemDetail,
             "description": "Person not found",
@@ -83,7 +146,7 @@ async def get_by_id(
     request: Request,
     response: Response,
     id: str,
-) -> Person:
+) -> Response:
     """Get a person by id
 
     Args:
@@ -92,11 +155,13 @@ async def get_by_id(
         id (str): _description_
 
     Returns:
-        Person: _description_
+        Response: Person (JSON)
     """
 
     entity: Person = await ReadService().get_by_id(id=id)
-    return entity
+    return conditional_model_response(
+        request, entity, etag=entity_etag(entity.id, entity.version)
+    )
 
 
 @api_router.delete(
@@ -175,15 +240,23 @@ async def update(
     response: Response,
     id: str,
     person: PersonCreate,
+    if_match: Optional[str] = Header(
+        default=None, description="ETag of the person (optimistic lock)"
+    ),
 ) -> Person:
     """Update the person with the given information.
     - Do not allow to dissasociate any active polcies from the person.
+    - If-Match (ETag of GET) is used as the version of the optimistic lock.
 
     Args:
         request (Request): _description_
         response (Response): _description_
         id (str): _description_
         person (PersonCreate): _description_
+        if_match (str, optional): _description_
+
+    Raises:
+        PersonAlreadyModifiedException: If-Match is not the current version
 
     Returns:
         Person: _description_
@@ -191,12 +264,20 @@ async def update(
 
     logger.debug("update request: {}", person)
 
+    if if_match is not None and if_match.strip() != "*":
+        version: Optional[int] = etag_version(if_match, id)
+        if version is None:
+            # Not an ETag of this person: it can not be the current version
+            raise PersonAlreadyModifiedException(id)
+        person = person.model_copy(update={"version": version})
+
     entity: Person = await WriteService().update(
         id=id,
         # current_user=current_user,
         request=person,
     )
 
+    response.headers["ETag"] = entity_etag(entity.id, entity.version)
     return entity
 
 
@@ -249,3 +330,54 @@ async def create(
     )
 
     return entity
+
+
+@api_router.post(
+    ":batch",
+    response_model=BatchResult,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ProblemDetail,
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "model": ProblemDetail,
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ProblemDetail,
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ProblemDetail,
+            "description": "Internal Server Error",
+        },
+    },
+    dependencies=[
+        Depends(require_groups(["customer"])),
+    ],
+)
+async def create_batch(
+    request: Request,
+    response: Response,
+    persons: List[PersonCreate] = Body(
+        ..., min_length=1, max_length=settings.BATCH_MAX_ITEMS
+    ),
+) -> Response:
+    """Create up to BATCH_MAX_ITEMS persons in one transaction.
+    - The result of every person is returned by index: 201 (created) or
+      409 (PersonAlreadyExists, not created).
+
+    Args:
+        request (Request): _description_
+        response (Response): _description_
+        persons (List[PersonCreate]): _description_
+
+    Returns:
+        Response: BatchResult
+    """
+
+    result: BatchResult = await WriteService().create_many(
+        # current_user=current_user,
+        requests=persons,
+    )
+
+    return model_response(result)
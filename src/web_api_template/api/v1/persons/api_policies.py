@@ -5,14 +5,22 @@
 from typing import List
 
 from auth_middleware.functions import require_groups
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Body, Depends, Path, status
 from starlette.requests import Request
 from starlette.responses import Response
 
 from web_api_template.api.v1.policies.services import ReadService as PolicyReadService
 from web_api_template.api.v1.policies.services import WriteService as PolicyWriteService
-from web_api_template.core.api import ProblemDetail
+from web_api_template.core.api import (
+    BatchResult,
+    ProblemDetail,
+    conditional_model_response,
+    model_response,
+)
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
 from web_api_template.core.logging import logger
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.settings import settings
 from web_api_template.domain.aggregates import Policy, PolicyCreate
 
 api_router = APIRouter()
@@ -20,7 +28,7 @@ api_router = APIRouter()
 
 @api_router.get(
     "/{person_id}/policies",
-    response_model=List[Policy],
+    response_model=Page,
     status_code=status.HTTP_200_OK,
     responses={
         status.HTTP_500_INTERNAL_SERVER_ERROR: {
@@ -35,7 +43,8 @@ async def get_policies_by_person(
     request: Request,
     response: Response,
     person_id: str = Path(..., description="The ID of the person"),
-) -> List[Policy]:
+    pagination: PaginationQueryModel = Depends(),
+) -> Response:
     """Get a list of policies associated with the person.
 
     Args:
@@ -44,17 +53,17 @@ async def get_policies_by_person(
         id (str, optional): _description_. Defaults to Path(..., description="The ID of the person").
 
     Returns:
-        List[Policy]: _description_
+        Response: Page (JSON)
     """
 
     # TODO: Filter policies by status
 
     logger.debug("Person id: {}", person_id)
 
-    result: List[Policy] = await PolicyReadService().get_list_by_person_id(
-        person_id=person_id
+    result: Page = await PolicyReadService().get_list_by_person_id(
+        person_id=person_id, pagination=pagination
     )
-    return result
+    return conditional_model_response(request, result)
 
 
 @api_router.post(
@@ -108,3 +117,55 @@ async def create_policy(
     )
 
     return entity
+
+
+@api_router.post(
+    "/{person_id}/policies:batch",
+    response_model=BatchResult,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_403_FORBIDDEN: {
+            "model": ProblemDetail,
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ProblemDetail,
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "model": ProblemDetail,
+            "description": "Person not found",
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ProblemDetail,
+        },
+    },
+    dependencies=[
+        Depends(require_groups(["customer"])),
+    ],
+)
+async def create_policies_batch(
+    request: Request,
+    response: Response,
+    policies: List[PolicyCreate] = Body(
+        ..., min_length=1, max_length=settings.BATCH_MAX_ITEMS
+    ),
+    person_id: str = Path(..., description="The ID of the person"),
+) -> Response:
+    """Create up to BATCH_MAX_ITEMS policies for the given person in one transaction.
+
+    Args:
+        request (Request): _description_
+        response (Response): _description_
+        policies (List[PolicyCreate]): _description_
+        person_id (str): _description_
+
+    Returns:
+        Response: BatchResult
+    """
+
+    result: BatchResult = await PolicyWriteService().create_many_for_person(
+        # current_user=current_user,
+        person_id=person_id,
+        requests=policies,
+    )
+
+    return model_response(result)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from pydilite import inject
 
@@ -40,6 +40,21 @@ class ReadService:
 
         return result
 
+    async def export(self, filter: PersonFilter) -> AsyncIterator[Person]:
+        """
+        Get all the filtered persons as they are recovered from the database
+
+        Args:
+            filter (PersonFilter): Person related filter
+
+        Returns:
+            AsyncIterator[Person]: domain entities to export
+        """
+
+        logger.debug("Entering. filter: {}", filter)
+
+        return await self.person_db_repo.stream_list(filter=filter)
+
     async def get_by_id(self, id: str) -> Optional[Person]:
         """
         Search person by id
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydilite import inject
 
+from web_api_template.core.api import BatchResult, batch_result
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.exceptions import ItemNotFoundException
 from web_api_template.domain.entities.person import Person
@@ -47,6 +48,30 @@ class WriteService:
 
         return response
 
+    async def create_many(
+        self,
+        # current_user: User,
+        requests: List[PersonCreate],
+    ) -> BatchResult:
+        """
+        Create persons in one transaction.
+
+        Args:
+            requests (List[PersonCreate]): The requested persons to create.
+
+        Returns:
+            BatchResult: The result of every person (conflicts by index).
+        """
+
+        logger.debug("Entering. persons: {}", len(requests))
+
+        results: List[Person | Exception] = await self.person_db_repo.create_many(
+            # current_user=current_user,
+            entities=requests
+        )
+
+        return batch_result(results)
+
     async def delete_by_id(self, id: str):
         """
         Delete the Person object with the given ID
@@ -2,51 +2,112 @@
     All validations and mappings should be in the services
 """
 
+from typing import AsyncIterator
+
 from auth_middleware.functions import require_groups
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import Response, StreamingResponse
 
 from web_api_template.api.v1.policies.services import ReadService, WriteService
-from web_api_template.core.api import ProblemDetail
+from web_api_template.core.api import (
+    ExportFormatEnum,
+    ProblemDetail,
+    conditional_model_response,
+    export_response,
+)
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
 from web_api_template.core.http.validators import ksuid_path_validator
 from web_api_template.core.logging import logger
-from web_api_template.domain.aggregates import Policy, PolicyCreate
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.domain.aggregates import Policy, PolicyCreate, PolicyFilter
 
 api_router = APIRouter()
 
 
-# @api_router.get(
-#     "/",
-#     response_model=List[Policy],
-#     status_code=status.HTTP_200_OK,
-#     responses={
-#         status.HTTP_500_INTERNAL_SERVER_ERROR: {
-#             "model": ProblemDetail,
-#         },
-#     },
-#     dependencies=[
-#         Depends(require_groups(["customer"])),
-#     ],
-# )
-# async def get_list(
-#     request: Request,
-#     response: Response,
-#     list_filter: PolicyFilter = Depends(),
-#     query: CommonQueryModel = Depends(),
-# ) -> List[Policy]:
-#     """Get a list of policies
+@api_router.get(
+    "/",
+    response_model=Page,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ProblemDetail,
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ProblemDetail,
+        },
+    },
+    dependencies=[
+        Depends(require_groups(["customer"])),
+    ],
+)
+async def get_list(
+    request: Request,
+    response: Response,
+    list_filter: PolicyFilter = Depends(),
+    pagination: PaginationQueryModel = Depends(),
+) -> Response:
+    """Get a page of policies
 
-#     Args:
-#         request (Request): _description_
-#         response (Response): _description_
+    Args:
+        request (Request): _description_
+        response (Response): _description_
 
-#     Returns:
-#         List[Policy]: _description_
-#     """
+    Returns:
+        Response: Page (JSON)
+    """
 
-#     result: List[Policy] = await ReadService().get_list(filter=list_filter)
-#     return result
+    result: Page = await ReadService().get_list(
+        filter=list_filter,
+        pagination=pagination,
+    )
+    return conditional_model_response(request, result)
+
+
+@api_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "All the filtered policies (NDJSON or CSV)",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ProblemDetail,
+            "description": "Invalid filter",
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {
+            "model": ProblemDetail,
+            "description": "Internal Server Error",
+        },
+    },
+    dependencies=[
+        Depends(require_groups(["customer"])),
+    ],
+)
+async def export(
+    request: Request,
+    response: Response,
+    list_filter: PolicyFilter = Depends(),
+    export_format: ExportFormatEnum = Query(
+        default=ExportFormatEnum.NDJSON, alias="format"
+    ),
+) -> StreamingResponse:
+    """Export all the filtered policies.
+    Rows are streamed from a server side cursor as they are recovered.
+
+    Args:
+        request (Request): _description_
+        response (Response): _description_
+        export_format (ExportFormatEnum): ndjson or csv
+
+    Returns:
+        StreamingResponse: _description_
+    """
+
+    items: AsyncIterator[Policy] = await ReadService().export(filter=list_filter)
+    return export_response(items, export_format=export_format, filename="policies")
 
 
 @api_router.get(
@@ -70,7 +131,7 @@ async def get_by_id(
     request: Request,
     response: Response,
     id: str,
-) -> Policy:
+) -> Response:
     """Get a policy by id
 
     Args:
@@ -79,11 +140,11 @@ async def get_by_id(
         id (str): _description_
 
     Returns:
-        Policy: _description_
+        Response: Policy (JSON)
     """
 
     entity: Policy = await ReadService().get_by_id(id=id)
-    return entity
+    return conditional_model_response(request, entity)
 
 
 @api_router.delete(
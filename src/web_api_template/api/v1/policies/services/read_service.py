@@ -1,9 +1,11 @@
-from typing import List, Optional
+from typing import AsyncIterator, Optional
 
 from pydilite import inject
 
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.exceptions import ItemNotFoundException
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
 from web_api_template.domain.aggregates import Policy, PolicyFilter
 from web_api_template.domain.exceptions import PolicyNotFoundException
 from web_api_template.domain.repository import PolicyReadRepository
@@ -16,22 +18,42 @@ class ReadService:
     def __init__(self, policy_db_repo: PolicyReadRepository):
         self.policy_db_repo = policy_db_repo
 
-    async def get_list(self, filter: PolicyFilter) -> List[Policy]:
+    async def get_list(
+        self, filter: PolicyFilter, pagination: PaginationQueryModel
+    ) -> Page:
         """
-        Get a list of policys
+        Get a page of policies
 
         Args:
             filter (PolicyFilter): Policy related filter
+            pagination (PaginationQueryModel): Pagination and sorting
 
         Returns:
-            List[Policy]: domain entity to return
+            Page: page of domain entities
         """
 
         logger.debug("Entering. filter: {}", filter)
 
-        entities: List[Policy] = await self.policy_db_repo.get_list(filter=filter)
+        result: Page = await self.policy_db_repo.get_paginated_list(
+            filter=filter, pagination=pagination
+        )
+
+        return result
+
+    async def export(self, filter: PolicyFilter) -> AsyncIterator[Policy]:
+        """
+        Get all the filtered policies as they are recovered from the database
+
+        Args:
+            filter (PolicyFilter): Policy related filter
+
+        Returns:
+            AsyncIterator[Policy]: domain entities to export
+        """
+
+        logger.debug("Entering. filter: {}", filter)
 
-        return entities
+        return await self.policy_db_repo.stream_list(filter=filter)
 
     async def get_by_id(self, id: str) -> Optional[Policy]:
         """
@@ -54,21 +76,24 @@ class ReadService:
 
         return entity
 
-    async def get_list_by_person_id(self, person_id: str) -> List[Policy]:
+    async def get_list_by_person_id(
+        self, person_id: str, pagination: PaginationQueryModel
+    ) -> Page:
         """
-        Get a list of policys for a given person
+        Get a page of policies for a given person
 
         Args:
-            id (str): Person id
+            person_id (str): Person id
+            pagination (PaginationQueryModel): Pagination and sorting
 
         Returns:
-            List[Policy]: domain entity to return
+            Page: page of domain entities
         """
 
-        logger.debug("Entering. filter: {}", id)
+        logger.debug("Entering. person: {}", person_id)
 
-        entities: List[Policy] = await self.policy_db_repo.get_list_by_person_id(
-            person_id=person_id
+        result: Page = await self.policy_db_repo.get_paginated_list(
+            filter=PolicyFilter(policy_holder_id=person_id), pagination=pagination
         )
 
-        return entities
+        return result
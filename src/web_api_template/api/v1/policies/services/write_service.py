@@ -1,11 +1,15 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydilite import inject
 
+from web_api_template.core.api import BatchResult, batch_result
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.exceptions import ItemNotFoundException
 from web_api_template.domain.aggregates import Policy, PolicyCreate
-from web_api_template.domain.exceptions import PolicyNotFoundException
+from web_api_template.domain.exceptions import (
+    PersonNotFoundException,
+    PolicyNotFoundException,
+)
 from web_api_template.domain.repository import PolicyWriteRepository
 
 
@@ -48,6 +52,41 @@ class WriteService:
 
         return response
 
+    async def create_many_for_person(
+        self,
+        # current_user: User,
+        person_id: str,
+        requests: List[PolicyCreate],
+    ) -> BatchResult:
+        """
+        Create policies of a person in one transaction.
+
+        Args:
+            person_id (str): The person ID to associate the policies with.
+            requests (List[PolicyCreate]): The requested policies to create.
+
+        Raises:
+            PersonNotFoundException: If the person does not exist
+
+        Returns:
+            BatchResult: The result of every policy.
+        """
+
+        logger.debug("Entering. person_id: {} policies: {}", person_id, len(requests))
+
+        try:
+            results: List[PolicyCreate] = await self.policy_db_repo.create_many(
+                # current_user=current_user,
+                person_id=person_id,
+                entities=requests,
+            )
+
+            return batch_result(results)
+
+        except ItemNotFoundException:
+            # Domain exception raise if person does not exists
+            raise PersonNotFoundException(id=person_id)
+
     async def create(
         self,
         # current_user: User,
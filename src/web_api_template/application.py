@@ -3,22 +3,31 @@ from auth_middleware.providers.cognito.cognito_provider import CognitoProvider
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry import metrics, trace
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from pydilite import Provider, configure
 from transaction_middleware import TransactionMiddleware
 
+from web_api_template.core.api import FastJSONResponse
+from web_api_template.core.cache_metrics import instrument_caches
 from web_api_template.core.logging import logger
-from web_api_template.core.middleware import TraceIDMiddleware
+from web_api_template.core.middleware import (
+    RequestMetricsMiddleware,
+    TraceIDMiddleware,
+    UnitOfWorkMiddleware,
+)
+from web_api_template.core.repository.exceptions import InvalidArgumentException
 from web_api_template.core.settings import settings
+from web_api_template.core.tracing import create_tracer_provider
 from web_api_template.di import include_di
 from web_api_template.exception_handlers import (
     general_exception_handler,
     http_exception_handler,
+    invalid_argument_exception_handler,
     validation_exception_handler,
 )
 from web_api_template.lifespan import lifespan
@@ -36,17 +45,36 @@ def start_application(app: FastAPI):
 
     logger.debug("Initializing OpenTelemetry")
     resource = Resource.create(attributes={"service.name": settings.OTEL_SERVICE_NAME})
-    trace_provider = TracerProvider(resource=resource)
-    trace.set_tracer_provider(trace_provider)
 
-    otlp_exporter = OTLPSpanExporter(
-        endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT, insecure=True
+    # Traces (sampling and exporter tuned by settings). Without tracer
+    # provider, the global one is a no-op: nothing is recorded nor exported
+    trace_provider = create_tracer_provider(resource)
+    if trace_provider:
+        trace.set_tracer_provider(trace_provider)
+    else:
+        logger.info("Tracing disabled")
+
+    # Metrics (i.e. requests, caches and database connection pools)
+    metric_readers = []
+    if settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        metric_readers.append(
+            PeriodicExportingMetricReader(
+                OTLPMetricExporter(
+                    endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT, insecure=True
+                )
+            )
+        )
+    # Prometheus exposition (scraped in /metrics)
+    if settings.METRICS_ENABLED:
+        # Only imported when enabled
+        from opentelemetry.exporter.prometheus import PrometheusMetricReader
+
+        metric_readers.append(PrometheusMetricReader())
+        instrument_caches()
+    metrics.set_meter_provider(
+        MeterProvider(resource=resource, metric_readers=metric_readers)
     )
-    span_processor = BatchSpanProcessor(otlp_exporter)
-    trace_provider.add_span_processor(span_processor)
 
-    # FastAPI instrumentation
-    FastAPIInstrumentor.instrument_app(app)
     logger.debug("OpenTelemetry initialized")
 
     # ----------------------------------------
@@ -56,11 +84,21 @@ def start_application(app: FastAPI):
     include_di(provider=provider)
     configure(provider=provider)
 
+    # ----------------------------------------
+    # Responses
+    # ----------------------------------------
+
+    # Default response class of the routes (faster JSON encoder)
+    app.router.default_response_class = FastJSONResponse
+
     # ----------------------------------------
     # Exception handling
     # ----------------------------------------
     app.add_exception_handler(Exception, general_exception_handler)
     app.add_exception_handler(HTTPException, http_exception_handler)
+    app.add_exception_handler(
+        InvalidArgumentException, invalid_argument_exception_handler
+    )
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
     # ----------------------------------------
@@ -69,6 +107,12 @@ def start_application(app: FastAPI):
 
     # Add middlewares (in order of desired execution)
 
+    # Unit of work (one session and one commit by write request). The innermost
+    # middleware: it must run in the task of the endpoint
+    if settings.UNIT_OF_WORK_ENABLED:
+        app.add_middleware(UnitOfWorkMiddleware)
+        logger.debug("Unit of work middleware initialized")
+
     # Tracing middleware (for logging)
     app.add_middleware(TraceIDMiddleware)
     logger.debug("TraceID middleware initialized")
@@ -91,6 +135,18 @@ def start_application(app: FastAPI):
     app.add_middleware(TransactionMiddleware)
     logger.debug("Transaction middleware initialized")
 
+    # RED metrics by route (the whole chain but the instrumentation)
+    if settings.METRICS_ENABLED:
+        app.add_middleware(RequestMetricsMiddleware)
+        logger.debug("Request metrics middleware initialized")
+
+    # FastAPI instrumentation: the outermost middleware, the request span
+    # covers the whole chain (and TraceIDMiddleware logs its trace id). Its
+    # HTTP metrics are disabled: the request metrics middleware records them
+    # by route template, without host, port or server name attributes
+    FastAPIInstrumentor.instrument_app(app, meter_provider=metrics.NoOpMeterProvider())
+    logger.debug("FastAPI instrumentation initialized")
+
     # ----------------------------------------
     # Lifespan (startup/shutdown async actions)
     # ----------------------------------------
@@ -1,7 +1,12 @@
+from .batch_result import BatchItemResult, BatchResult, batch_result
 from .common_query_model import CommonQueryModel
+from .export_format_enum import ExportFormatEnum
+from .fast_json_response import FastJSONResponse
+from .model_response import conditional_model_response, model_response
 from .pagination_query_model import PaginationQueryModel
 from .problem_detail import ProblemDetail
 from .sorting_query_model import SortingQueryModel
+from .streaming_export import export_response
 from .utils import generate_slug, get_content_type
 from .validation_error_detail import ValidationErrorDetail
 
@@ -13,4 +18,12 @@ __all__ = [
     "ValidationErrorDetail",
     "SortingQueryModel",
     "PaginationQueryModel",
+    "ExportFormatEnum",
+    "export_response",
+    "model_response",
+    "conditional_model_response",
+    "FastJSONResponse",
+    "BatchItemResult",
+    "BatchResult",
+    "batch_result",
 ]
@@ -0,0 +1,99 @@
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, Field
+
+
+class BatchItemResult(BaseModel):
+    """Result of an item of a batch request"""
+
+    index: int = Field(
+        ...,
+        ge=0,
+        json_schema_extra={
+            "description": "Index of the item in the request",
+            "example": "0",
+        },
+    )
+    status: int = Field(
+        ...,
+        json_schema_extra={
+            "description": "HTTP status code of the item (as in the single item endpoint)",
+            "example": "201",
+        },
+    )
+    item: Optional[Any] = Field(
+        default=None,
+        json_schema_extra={"description": "Created item (only on success)"},
+    )
+    error: Optional[str] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Error code (X-Error header of the single item endpoint)",
+            "example": "PersonAlreadyExists",
+        },
+    )
+    detail: Optional[str] = Field(
+        default=None,
+        json_schema_extra={"description": "Error detail"},
+    )
+
+
+class BatchResult(BaseModel):
+    """Results of a batch request (one by item, in the request order)"""
+
+    succeeded: int = Field(
+        default=0,
+        ge=0,
+        json_schema_extra={"description": "Successful items", "example": "99"},
+    )
+    failed: int = Field(
+        default=0,
+        ge=0,
+        json_schema_extra={"description": "Failed items", "example": "1"},
+    )
+    items: List[BatchItemResult] = Field(
+        default=[],
+        json_schema_extra={"description": "Result of every item"},
+    )
+
+
+def batch_result(
+    results: List[Any], success_status: int = status.HTTP_201_CREATED
+) -> BatchResult:
+    """Builds the batch result from the result of every item: the item itself
+    or the (HTTP) exception the single item endpoint would raise
+
+    Args:
+        results (List[Any]): item or exception, by index
+        success_status (int, optional): status of the items. Defaults to 201.
+
+    Returns:
+        BatchResult: _description_
+    """
+    items: List[BatchItemResult] = []
+    for index, result in enumerate(results):
+        if isinstance(result, HTTPException):
+            items.append(
+                BatchItemResult(
+                    index=index,
+                    status=result.status_code,
+                    error=(result.headers or {}).get("X-Error"),
+                    detail=result.detail,
+                )
+            )
+        elif isinstance(result, Exception):
+            items.append(
+                BatchItemResult(
+                    index=index,
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=str(result),
+                )
+            )
+        else:
+            items.append(
+                BatchItemResult(index=index, status=success_status, item=result)
+            )
+
+    failed: int = sum(1 for item in items if item.status >= 400)
+    return BatchResult(succeeded=len(items) - failed, failed=failed, items=items)
@@ -0,0 +1,15 @@
+import enum
+
+
+class ExportFormatEnum(enum.Enum):
+    """Formats supported by the export endpoints
+
+    Args:
+        enum (_type_): _description_
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    def __str__(self):
+        return self.value
@@ -0,0 +1,126 @@
+import enum
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Callable, Dict
+from uuid import UUID
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from web_api_template.core.logging import logger
+from web_api_template.core.settings import settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+def _default(value: Any) -> Any:
+    """Converts the values not natively supported by the encoders
+
+    Args:
+        value (Any): value to convert
+
+    Raises:
+        TypeError: type not supported
+
+    Returns:
+        Any: JSON compatible value
+    """
+    if isinstance(value, BaseModel):
+        # i.e. ProblemDetail (including its extensions)
+        return value.model_dump(mode="json")
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _json_encoder() -> Callable[[Any], bytes]:
+    """Standard library encoder (same output format as JSONResponse)"""
+
+    def encode(content: Any) -> bytes:
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+            default=_default,
+        ).encode("utf-8")
+
+    return encode
+
+
+def _orjson_encoder() -> Callable[[Any], bytes]:
+    """orjson encoder (dates and enums are supported natively)"""
+
+    def encode(content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+    return encode
+
+
+def _msgspec_encoder() -> Callable[[Any], bytes]:
+    """msgspec encoder (dates and enums are supported natively)"""
+    return msgspec.json.Encoder(enc_hook=_default).encode
+
+
+ENCODERS: Dict[str, Callable[[], Callable[[Any], bytes]]] = {
+    "orjson": _orjson_encoder,
+    "msgspec": _msgspec_encoder,
+    "json": _json_encoder,
+}
+
+
+def _available(name: str) -> bool:
+    return {"orjson": orjson, "msgspec": msgspec}.get(name, json) is not None
+
+
+def get_json_encoder(name: str = "auto") -> Callable[[Any], bytes]:
+    """Gets the JSON encoder.
+    "auto" uses the fastest installed library (orjson, msgspec) and falls back
+    to the standard library when none of them is installed.
+
+    Args:
+        name (str, optional): auto, orjson, msgspec or json. Defaults to "auto".
+
+    Returns:
+        Callable[[Any], bytes]: encoder
+    """
+    name = name.lower()
+    if name == "auto":
+        name = next(encoder for encoder in ENCODERS if _available(encoder))
+
+    if name not in ENCODERS or not _available(name):
+        logger.warning("JSON encoder {} not available, using json", name)
+        name = "json"
+
+    logger.debug("JSON encoder: {}", name)
+    return ENCODERS[name]()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with the configured encoder (settings.JSON_ENCODER)
+
+    Args:
+        JSONResponse (_type_): _description_
+    """
+
+    encode: Callable[[Any], bytes] = staticmethod(
+        get_json_encoder(settings.JSON_ENCODER)
+    )
+
+    def render(self, content: Any) -> bytes:
+        return self.encode(content)
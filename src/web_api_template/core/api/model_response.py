@@ -0,0 +1,62 @@
+from typing import Optional
+
+from fastapi import status
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+
+from web_api_template.core.http.etag import content_etag, etag_matches
+
+from .fast_json_response import FastJSONResponse
+
+
+def model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serializes a (trusted) model to JSON with the configured encoder
+    (settings.JSON_ENCODER, same as FastJSONResponse).
+    FastAPI returns a Response as it is: the response_model of the endpoint
+    is only used for the documentation (no re-validation and no
+    jsonable_encoder pass over the content).
+
+    Args:
+        model (BaseModel): model to return (i.e. Page or an entity)
+        status_code (int, optional): HTTP status code. Defaults to 200.
+
+    Returns:
+        Response: _description_
+    """
+    return FastJSONResponse(content=model.model_dump(), status_code=status_code)
+
+
+def conditional_model_response(
+    request: Request, model: BaseModel, etag: Optional[str] = None
+) -> Response:
+    """model_response with an ETag: 304 Not Modified (without body) when the
+    ETag is in the If-None-Match header of the request.
+
+    Args:
+        request (Request): _description_
+        model (BaseModel): model to return (i.e. Page or an entity)
+        etag (str, optional): ETag of the model (i.e. entity_etag). Defaults to
+            the ETag of the serialized model.
+
+    Returns:
+        Response: _description_
+    """
+    if_none_match: Optional[str] = request.headers.get("if-none-match")
+
+    # Known ETag: the model is not serialized if it has not been modified
+    if etag is not None and etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    response: Response = model_response(model)
+    if etag is None:
+        etag = content_etag(response.body)
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
+
+    response.headers["ETag"] = etag
+    return response
@@ -2,6 +2,11 @@ from typing import Optional
 
 from pydantic import Field
 
+from web_api_template.core.repository.manager.sqlalchemy.count_mode_enum import (
+    CountModeEnum,
+)
+from web_api_template.core.settings import settings
+
 from .sorting_query_model import SortingQueryModel
 
 
@@ -16,8 +21,26 @@ class PaginationQueryModel(SortingQueryModel):
     size: Optional[int] = Field(
         default=10,
         ge=1,
+        le=settings.PAGINATION_MAX_SIZE,
         json_schema_extra={"description": "Page Size", "example": "10"},
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        max_length=2048,
+        json_schema_extra={
+            "description": "Cursor returned in next_cursor/prev_cursor of a previous page. "
+            "When present the page number is ignored (keyset pagination)",
+            "example": "eyJkIjoibiIsImsiOlsiMnBYM3VtNlk3c2lTMWJDeVp4NUJ3OEU4ZFd2Il19",
+        },
+    )
+    count: CountModeEnum = Field(
+        default=CountModeEnum.EXACT,
+        json_schema_extra={
+            "description": "Total count mode: exact, none (total is not calculated) "
+            "or estimate (from database statistics)",
+            "example": "exact",
+        },
+    )
 
     class Config:
         extra = "forbid"
@@ -0,0 +1,88 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict
+
+from pydantic import BaseModel
+from starlette.responses import StreamingResponse
+
+from .export_format_enum import ExportFormatEnum
+
+MEDIA_TYPES: Dict[ExportFormatEnum, str] = {
+    ExportFormatEnum.NDJSON: "application/x-ndjson",
+    ExportFormatEnum.CSV: "text/csv",
+}
+
+# Serialized rows are sent in chunks of (about) this size
+CHUNK_SIZE: int = 64 * 1024
+
+
+async def _ndjson(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    """One JSON document per line"""
+    buffer = io.StringIO()
+    async for item in items:
+        buffer.write(item.model_dump_json())
+        buffer.write("\n")
+
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+async def _csv(items: AsyncIterator[BaseModel]) -> AsyncIterator[str]:
+    """Header (fields of the first item) and one line per item.
+    Nested values are written as JSON."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header: bool = False
+
+    async for item in items:
+        row: Dict[str, Any] = item.model_dump(mode="json")
+        if not header:
+            writer.writerow(row.keys())
+            header = True
+
+        writer.writerow(
+            [
+                json.dumps(value) if isinstance(value, (dict, list)) else value
+                for value in row.values()
+            ]
+        )
+
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def export_response(
+    items: AsyncIterator[BaseModel], export_format: ExportFormatEnum, filename: str
+) -> StreamingResponse:
+    """Streams the items as they are recovered (they are never accumulated)
+
+    Args:
+        items (AsyncIterator[BaseModel]): items to export (i.e. from a server side cursor)
+        export_format (ExportFormatEnum): output format
+        filename (str): name of the downloaded file (without extension)
+
+    Returns:
+        StreamingResponse: _description_
+    """
+    content: AsyncIterator[str] = (
+        _csv(items) if export_format == ExportFormatEnum.CSV else _ndjson(items)
+    )
+
+    return StreamingResponse(
+        content,
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+        },
+    )
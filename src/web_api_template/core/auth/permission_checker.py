@@ -22,7 +22,6 @@ class PermissionChecker:
         self.__allowed_permissions = allowed_permissions
 
     async def __call__(self, request: Request):
-
         if settings.AUTH_MIDDLEWARE_DISABLED:
             return
 
@@ -40,7 +39,9 @@ class PermissionChecker:
             permission in self.__allowed_permissions for permission in user_permissions
         ):
             logger.debug(
-                f"User with permissions {user_permissions} not in {self.__allowed_permissions}"
+                "User with permissions {} not in {}",
+                user_permissions,
+                self.__allowed_permissions,
             )
             raise HTTPException(status_code=403, detail="Operation not allowed")
 
@@ -35,3 +35,15 @@ class PermissionsReadService:
         )
 
         return result
+
+    async def invalidate_permissions(self, username: str) -> None:
+        """
+        Invalidates the cached permissions (call it when the permissions change)
+
+        Args:
+            username (str): username of the person
+        """
+
+        logger.debug("Entering. username: {}", username)
+
+        await self.permissions_db_repo.invalidate_permissions(username=username)
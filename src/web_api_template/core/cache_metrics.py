@@ -0,0 +1,106 @@
+from typing import Any, Dict, Iterable, Tuple
+
+from aiocache import caches
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from .settings import settings
+
+meter = metrics.get_meter(__name__)
+
+_instrumented: bool = False
+
+
+def _caches() -> Iterable[Tuple[str, Any]]:
+    """Configured aiocache caches"""
+    if not settings.CACHE_ENABLED:
+        return
+
+    for alias in settings.CACHE_CONFIG:
+        try:
+            cache: Any = caches.get(alias)
+        except Exception:
+            # Configuration not loaded yet (before the startup)
+            continue
+        yield alias, cache
+
+
+def _observe_requests(options: CallbackOptions) -> Iterable[Observation]:
+    for alias, cache in _caches():
+        # HitMissRatioPlugin (after the first get)
+        ratio: Dict[str, Any] = getattr(cache, "hit_miss_ratio", {})
+        if ratio:
+            hits: int = ratio["hits"]
+            yield Observation(hits, {"cache.name": alias, "result": "hit"})
+            yield Observation(
+                ratio["total"] - hits, {"cache.name": alias, "result": "miss"}
+            )
+
+
+def _observe_hit_ratio(options: CallbackOptions) -> Iterable[Observation]:
+    for alias, cache in _caches():
+        ratio: Dict[str, Any] = getattr(cache, "hit_miss_ratio", {})
+        if ratio:
+            yield Observation(ratio["hit_ratio"], {"cache.name": alias})
+
+
+def _profiling(cache: Any) -> Iterable[Tuple[str, int, float]]:
+    """Operation, count and mean time in seconds (TimingPlugin)"""
+    profiling: Dict[str, Any] = getattr(cache, "profiling", {})
+    for key, count in list(profiling.items()):
+        if key.endswith("_total"):
+            operation: str = key[: -len("_total")]
+            yield operation, count, profiling.get(f"{operation}_avg", 0)
+
+
+def _observe_operations(options: CallbackOptions) -> Iterable[Observation]:
+    for alias, cache in _caches():
+        for operation, count, _ in _profiling(cache):
+            yield Observation(
+                count, {"cache.name": alias, "cache.operation": operation}
+            )
+
+
+def _observe_operation_time(options: CallbackOptions) -> Iterable[Observation]:
+    for alias, cache in _caches():
+        for operation, count, mean in _profiling(cache):
+            yield Observation(
+                count * mean * 1000, {"cache.name": alias, "cache.operation": operation}
+            )
+
+
+def instrument_caches() -> None:
+    """Metrics of the aiocache caches, read from the HitMissRatioPlugin and
+    TimingPlugin statistics when the metrics are collected (nothing is
+    recorded by cache operation)
+    """
+    global _instrumented
+
+    if _instrumented:
+        return
+    _instrumented = True
+
+    meter.create_observable_counter(
+        "cache.requests",
+        callbacks=[_observe_requests],
+        unit="{request}",
+        description="Cache gets by result (hit or miss)",
+    )
+    meter.create_observable_gauge(
+        "cache.hit_ratio",
+        callbacks=[_observe_hit_ratio],
+        unit="1",
+        description="Cache gets that found the key",
+    )
+    meter.create_observable_counter(
+        "cache.operations",
+        callbacks=[_observe_operations],
+        unit="{operation}",
+        description="Cache operations (get, set, delete...)",
+    )
+    meter.create_observable_counter(
+        "cache.operation.time",
+        callbacks=[_observe_operation_time],
+        unit="ms",
+        description="Total time of the cache operations",
+    )
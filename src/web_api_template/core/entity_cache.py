@@ -0,0 +1,140 @@
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from aiocache import caches
+
+from web_api_template.core.logging import logger
+from web_api_template.core.selective_cache import is_cache_enabled
+from web_api_template.core.single_flight import SingleFlight
+
+
+class EntityCache:
+    """In-process cache of entities by id (bounded LRU with ttl).
+
+    Every id has a version token in the shared cache (aiocache alias, i.e.
+    Redis) and the local entries are only valid for the token they were
+    loaded with. The writes replace the token (in every process the next read
+    goes to the database), so a write is never followed by a stale read.
+    Reading the token is a single cache round trip instead of a database query.
+    """
+
+    _local: "OrderedDict[str, Tuple[str, float, Any]]"
+    _flight: SingleFlight
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        alias: str = "default",
+        ttl: float = 0,
+        maxsize: int = 1024,
+    ):
+        """Initialize the cache
+
+        Args:
+            name (str): entity name (prefix of the version token keys)
+            alias (str, optional): aiocache alias of the tokens. Defaults to "default".
+            ttl (float, optional): entries ttl in seconds (0: disabled). Defaults to 0.
+            maxsize (int, optional): maximum entries. Defaults to 1024.
+        """
+        self.name = name
+        self.alias = alias
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self._local = OrderedDict()
+        self._flight = SingleFlight()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and is_cache_enabled()
+
+    async def get(self, id: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Gets the entity from the cache or from the loader (concurrent misses
+        of the same id share one load)
+
+        Args:
+            id (str): entity id
+            loader (Callable[[], Awaitable[Any]]): loads the entity (None if not found)
+
+        Returns:
+            Any: entity
+        """
+        if not self.enabled:
+            # Could have been switched off: not valid when switched on again
+            self._local.clear()
+            return await loader()
+
+        token: Optional[str] = await self._get_token(id)
+        if token is None:
+            return await loader()
+
+        entry: Optional[Tuple[str, float, Any]] = self._local.get(id)
+        if entry is not None:
+            entry_token, expires_at, entity = entry
+            if entry_token == token and expires_at >= time.monotonic():
+                self._local.move_to_end(id)
+                return entity
+
+        return await self._flight.do(
+            f"{id}:{token}", lambda: self._load(id, token, loader)
+        )
+
+    async def invalidate(self, id: str) -> None:
+        """Replaces the version token of the entity (call it on every write)
+
+        Args:
+            id (str): entity id
+        """
+        if self.ttl <= 0:
+            return
+
+        logger.debug("Invalidating {}: {}", self.name, id)
+
+        self._local.pop(id, None)
+        try:
+            await caches.get(self.alias).set(
+                self._key(id), uuid.uuid4().hex, ttl=self._token_ttl
+            )
+        except Exception:
+            logger.exception("Cache error invalidating {}: {}", self.name, id)
+
+    @property
+    def _token_ttl(self) -> int:
+        # Longer than the entries: an expired token only causes a reload
+        return int(self.ttl) * 10 + 1
+
+    def _key(self, id: str) -> str:
+        return f"entity_{self.name}_{id}_version"
+
+    async def _get_token(self, id: str) -> Optional[str]:
+        """Gets (or creates) the version token. None on cache errors"""
+        remote: Any = caches.get(self.alias)
+        try:
+            token: Optional[str] = await remote.get(self._key(id))
+            if token is None:
+                token = uuid.uuid4().hex
+                try:
+                    await remote.add(self._key(id), token, ttl=self._token_ttl)
+                except ValueError:
+                    # Created by another process
+                    token = await remote.get(self._key(id))
+            return token
+
+        except Exception:
+            logger.exception("Cache error getting {}: {}", self.name, id)
+            return None
+
+    async def _load(
+        self, id: str, token: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Loads the entity. It is at least as recent as the token"""
+        entity: Any = await loader()
+        if entity is not None:
+            self._local[id] = (token, time.monotonic() + self.ttl, entity)
+            self._local.move_to_end(id)
+            while len(self._local) > self.maxsize:
+                self._local.popitem(last=False)
+        return entity
@@ -0,0 +1,3 @@
+from .etag import content_etag, entity_etag, etag_matches, etag_version
+
+__all__ = ["content_etag", "entity_etag", "etag_matches", "etag_version"]
@@ -0,0 +1,73 @@
+import hashlib
+from typing import Optional
+
+WEAK_PREFIX: str = "W/"
+
+
+def entity_etag(id: str, version: int) -> str:
+    """Weak ETag of a versioned entity (no need to serialize it)
+
+    Args:
+        id (str): entity id
+        version (int): entity version
+
+    Returns:
+        str: ETag (W/"<id>-<version>")
+    """
+    return f'{WEAK_PREFIX}"{id}-{version}"'
+
+
+def content_etag(content: bytes) -> str:
+    """Weak ETag of a serialized content (i.e. a page)
+
+    Args:
+        content (bytes): response body
+
+    Returns:
+        str: ETag
+    """
+    return f'{WEAK_PREFIX}"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """If-None-Match / If-Match header contains the ETag (weak comparison)
+
+    Args:
+        header (str, optional): header value (comma separated ETags or *)
+        etag (str): current ETag
+
+    Returns:
+        bool: _description_
+    """
+    if not header:
+        return False
+
+    opaque: str = etag.removeprefix(WEAK_PREFIX)
+    return any(
+        value == "*" or value.removeprefix(WEAK_PREFIX) == opaque
+        for value in (item.strip() for item in header.split(","))
+    )
+
+
+def etag_version(header: Optional[str], id: str) -> Optional[int]:
+    """Version of the entity in an If-Match header (built with entity_etag)
+
+    Args:
+        header (str, optional): If-Match header value
+        id (str): entity id
+
+    Returns:
+        Optional[int]: version. None if the header does not contain an ETag of the entity
+    """
+    if not header:
+        return None
+
+    prefix: str = f'"{id}-'
+    for value in (item.strip().removeprefix(WEAK_PREFIX) for item in header.split(",")):
+        if value.startswith(prefix) and value.endswith('"'):
+            try:
+                return int(value.removeprefix(prefix).removesuffix('"'))
+            except ValueError:
+                return None
+
+    return None
@@ -0,0 +1,113 @@
+import queue
+import threading
+from typing import Any, List, Optional, TextIO
+
+from opentelemetry import metrics, trace
+
+meter = metrics.get_meter(__name__)
+
+dropped_counter = meter.create_counter(
+    "log.records.dropped",
+    unit="{record}",
+    description="Log records dropped because the sink queue was full",
+)
+
+
+class BackgroundSink:
+    """Loguru stream sink written by a background thread: the logging call only
+    enqueues the formatted message. The queue is bounded: under backpressure
+    (the stream is slower than the records) the new records are dropped and
+    counted instead of blocking the event loop.
+    """
+
+    _STOP: Any = object()
+
+    def __init__(
+        self,
+        stream: TextIO,
+        name: str = "stderr",
+        max_queue_size: int = 10000,
+        batch_size: int = 512,
+    ):
+        """Initialize the sink (starts the writer thread)
+
+        Args:
+            stream (TextIO): destination (i.e. sys.stderr)
+            name (str, optional): sink name (dropped counter attribute).
+                Defaults to "stderr".
+            max_queue_size (int, optional): records waiting to be written.
+                Defaults to 10000.
+            batch_size (int, optional): records by write. Defaults to 512.
+        """
+        self.name = name
+        self.dropped: int = 0
+        self._stream = stream
+        self._batch_size = batch_size
+        self._attributes = {"sink": name}
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(
+            target=self._run, name=f"log-sink-{name}", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+            dropped_counter.add(1, self._attributes)
+
+    def _run(self) -> None:
+        while True:
+            batch: List[str] = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop: bool = batch[-1] is self._STOP
+            if stop:
+                batch.pop()
+
+            if batch:
+                self._stream.write("".join(batch))
+                self._stream.flush()
+
+            if stop:
+                return
+
+    def stop(self) -> None:
+        """Writes the queued records and stops the thread (logger.remove)"""
+        # Blocking put: the stop marker must not be dropped
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+
+class SpanEventSink:
+    """Loguru sink that attaches the records to the current span (i.e. the
+    request span) as "log" events: no span nor export work by record. Records
+    out of a sampled span are ignored (they are still in the stream sinks).
+    """
+
+    def __call__(self, message: Any) -> None:
+        span = trace.get_current_span()
+        if not span.is_recording():
+            return
+
+        record = message.record
+        span.add_event(
+            "log",
+            attributes={
+                "log.severity": record["level"].name,
+                "log.message": record["message"],
+                "code.namespace": record["name"] or "",
+                "code.function": record["function"],
+                "code.lineno": record["line"],
+            },
+            timestamp=int(record["time"].timestamp() * 1e9),
+        )
+
+        exception: Optional[Any] = record["exception"]
+        if exception is not None and exception.value is not None:
+            span.record_exception(exception.value)
@@ -3,14 +3,8 @@ import logging
 import sys
 
 from loguru import logger
-from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.trace import SpanKind
-from opentelemetry.trace.status import Status, StatusCode
 
+from .log_sinks import BackgroundSink, SpanEventSink
 from .settings import settings
 
 # Create a context variable to store the trace_id
@@ -28,25 +22,15 @@ def add_trace_id(record) -> bool:
     return True  # Return True to indicate the filter passed
 
 
-# Create a handler to send the logs to OpenTelemetry
-class OpenTelemetryHandler(logging.Handler):
-    def emit(self, record) -> None:
-        tracer = trace.get_tracer(__name__)
-        with tracer.start_as_current_span(
-            "loguru-span", kind=SpanKind.INTERNAL
-        ) as span:
-            span.set_attribute("loguru.message", record.getMessage())
-            span.set_status(Status(StatusCode.OK))
-            if record.exc_info:
-                span.record_exception(record.exc_info[1])
-
-
 # Configure the logger
 logger.remove()
 
-# stderr Logger
+# stderr Logger (written by a background thread, bounded queue)
+stderr_sink: BackgroundSink = BackgroundSink(
+    sys.stderr, name="stderr", max_queue_size=settings.LOG_QUEUE_SIZE
+)
 logger.add(
-    sink=sys.stderr,
+    sink=stderr_sink,
     level=settings.LOG_LEVEL,
     format=settings.LOG_FORMAT,
     filter=add_trace_id,
@@ -54,16 +38,16 @@ logger.add(
     serialize=False,
     backtrace=True,
     diagnose=True,
-    enqueue=True,
 )
 
-# OpenTelemetry Logger
-logger.add(
-    OpenTelemetryHandler(),
-    level=settings.LOG_LEVEL,
-    format=settings.LOG_FORMAT,
-    filter=add_trace_id,
-)
+# OpenTelemetry Logger (records as events of the current span)
+if settings.LOG_SPAN_EVENTS:
+    logger.add(
+        SpanEventSink(),
+        level=settings.LOG_LEVEL,
+        format="{message}",
+        filter=add_trace_id,
+    )
 
 
 __all__ = [
@@ -88,4 +72,7 @@ class InterceptHandler(logging.Handler):
 
 # Configure the logging level for sqlalchemy
 logging.basicConfig(handlers=[InterceptHandler()], level=logging.INFO)
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+# Statements are traced by QueryTracer: only logged on demand
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if settings.SQL_LOG_STATEMENTS else logging.WARNING
+)
@@ -1,5 +1,11 @@
+from .asgi_middleware import ASGIMiddleware
+from .request_metrics_middleware import RequestMetricsMiddleware
 from .trace_id_middleware import TraceIDMiddleware
+from .unit_of_work_middleware import UnitOfWorkMiddleware
 
 __all__ = [
+    "ASGIMiddleware",
+    "RequestMetricsMiddleware",
     "TraceIDMiddleware",
+    "UnitOfWorkMiddleware",
 ]
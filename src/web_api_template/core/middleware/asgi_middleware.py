@@ -0,0 +1,36 @@
+from typing import Set
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ASGIMiddleware:
+    """Base of the middlewares: pure ASGI (no BaseHTTPMiddleware). The request
+    runs in the task of the server, without an extra task nor wrapping the
+    response stream, so context variables set here reach the endpoint and the
+    streaming responses are not buffered.
+
+    Subclasses implement handle(); the other scope types (i.e. lifespan) are
+    passed through.
+    """
+
+    scope_types: Set[str] = {"http", "websocket"}
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in self.scope_types:
+            await self.app(scope, receive, send)
+            return
+
+        await self.handle(scope, receive, send)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Processes a request (call self.app to continue with the chain)
+
+        Args:
+            scope (Scope): _description_
+            receive (Receive): _description_
+            send (Send): _description_
+        """
+        raise NotImplementedError()
@@ -0,0 +1,111 @@
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+from starlette.types import Message, Receive, Scope, Send
+
+from .asgi_middleware import ASGIMiddleware
+
+meter = metrics.get_meter(__name__)
+
+# Request count: the count of the duration histogram
+duration_histogram = meter.create_histogram(
+    "http.server.duration",
+    unit="ms",
+    description="Duration of the HTTP requests",
+)
+errors_counter = meter.create_counter(
+    "http.server.errors",
+    unit="{request}",
+    description="HTTP requests answered with a server error (status >= 500)",
+)
+
+# Known methods: any other one is recorded as _OTHER (bounded cardinality)
+METHODS: Set[str] = {
+    "CONNECT",
+    "DELETE",
+    "GET",
+    "HEAD",
+    "OPTIONS",
+    "PATCH",
+    "POST",
+    "PUT",
+    "TRACE",
+}
+
+
+class _InFlight:
+    """Requests in progress. Lock free: only updated from the event loop"""
+
+    value: int = 0
+
+
+def _observe_in_flight(options: CallbackOptions) -> Iterable[Observation]:
+    yield Observation(_InFlight.value)
+
+
+meter.create_observable_up_down_counter(
+    "http.server.active_requests",
+    callbacks=[_observe_in_flight],
+    unit="{request}",
+    description="HTTP requests in progress",
+)
+
+
+def get_route(scope: Scope) -> Optional[str]:
+    """Route template of the request (i.e. /api/v1/persons/{id}), None if no
+    route matched. Set by the router in the scope.
+
+    Args:
+        scope (Scope): _description_
+
+    Returns:
+        Optional[str]: _description_
+    """
+    route: Any = scope.get("route")
+    path_format: Optional[str] = getattr(route, "path_format", None)
+    if path_format is None:
+        return None
+    return f"{scope.get('root_path', '')}{path_format}"
+
+
+class RequestMetricsMiddleware(ASGIMiddleware):
+    """RED metrics of the HTTP requests (rate, errors and duration) by method,
+    route template and status code: never the path, so the number of series
+    is bounded by the routes.
+    """
+
+    scope_types: Set[str] = {"http"}
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Unhandled errors do not send a response
+        status_code: int = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        _InFlight.value += 1
+        start: float = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed_ms: float = (time.perf_counter() - start) * 1000
+            _InFlight.value -= 1
+
+            method: str = scope["method"]
+            attributes: Dict[str, Any] = {
+                "http.request.method": method if method in METHODS else "_OTHER",
+                "http.response.status_code": status_code,
+            }
+            route: Optional[str] = get_route(scope)
+            if route is not None:
+                attributes["http.route"] = route
+
+            duration_histogram.record(elapsed_ms, attributes)
+            if status_code >= 500:
+                errors_counter.add(1, attributes)
@@ -1,23 +1,57 @@
-from fastapi import FastAPI, Request
+from typing import Optional
+
 from ksuid import Ksuid
-from starlette.middleware.base import BaseHTTPMiddleware
+from opentelemetry import trace
+from opentelemetry.trace import format_trace_id
+from opentelemetry.trace.propagation.tracecontext import (
+    TraceContextTextMapPropagator,
+)
+from starlette.types import Receive, Scope, Send
 
 from web_api_template.core.logging import trace_id_context
 
-app = FastAPI()
+from .asgi_middleware import ASGIMiddleware
+
+_propagator: TraceContextTextMapPropagator = TraceContextTextMapPropagator()
+
+
+def get_trace_id(scope: Scope) -> str:
+    """Trace id of the request: the one of the active OpenTelemetry span, the
+    one of the W3C traceparent header or a new one
+
+    Args:
+        scope (Scope): _description_
+
+    Returns:
+        str: trace id
+    """
+    span_context = trace.get_current_span().get_span_context()
+    if span_context.is_valid:
+        return format_trace_id(span_context.trace_id)
 
+    traceparent: Optional[str] = next(
+        (
+            value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+            if name == b"traceparent"
+        ),
+        None,
+    )
+    if traceparent:
+        context = _propagator.extract({"traceparent": traceparent})
+        span_context = trace.get_current_span(context).get_span_context()
+        if span_context.is_valid:
+            return format_trace_id(span_context.trace_id)
 
-class TraceIDMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Generar un UUID como trace_id
-        trace_id = str(Ksuid())
-        # Asignar el trace_id al contexto
-        trace_id_context.set(trace_id)
+    return str(Ksuid())
 
-        # Continuar con el manejo de la solicitud
-        response = await call_next(request)
 
-        # Limpiar el contexto al finalizar la solicitud
-        trace_id_context.set(None)
+class TraceIDMiddleware(ASGIMiddleware):
+    """Sets the trace id of the request (trace_id_context) for the logs"""
 
-        return response
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        token = trace_id_context.set(get_trace_id(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            trace_id_context.reset(token)
@@ -0,0 +1,70 @@
+from typing import Callable, Set
+
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from web_api_template.core.logging import logger
+from web_api_template.core.repository.manager.sqlalchemy.async_database import (
+    AsyncDatabase,
+)
+from web_api_template.core.repository.manager.sqlalchemy.unit_of_work import (
+    UnitOfWorkSession,
+    unit_of_work,
+)
+
+from .asgi_middleware import ASGIMiddleware
+
+
+class UnitOfWorkMiddleware(ASGIMiddleware):
+    """Request scoped unit of work for the write requests: the repositories
+    share one session (and one transaction) by database, committed once
+    before the response is sent (status < 400) or rolled back.
+
+    Must be the innermost middleware: the unit of work belongs to the task
+    that runs the endpoint.
+    """
+
+    scope_types: Set[str] = {"http"}
+    methods: Set[str] = {"POST", "PUT", "PATCH", "DELETE"}
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        session_factory: Callable[[str], UnitOfWorkSession] = (
+            AsyncDatabase.unit_of_work_session
+        ),
+    ):
+        super().__init__(app)
+        self.session_factory = session_factory
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["method"] not in self.methods:
+            await self.app(scope, receive, send)
+            return
+
+        async with unit_of_work(self.session_factory) as work:
+            committed: bool = True
+
+            async def send_after_commit(message: Message) -> None:
+                nonlocal committed
+
+                if message["type"] == "http.response.start":
+                    if message["status"] < 400:
+                        try:
+                            await work.commit()
+                        except Exception:
+                            logger.exception("Unit of work commit error")
+                            committed = False
+                            await work.rollback()
+                            response = PlainTextResponse(
+                                "Internal Server Error", status_code=500
+                            )
+                            await response(scope, receive, send)
+                            return
+                    else:
+                        await work.rollback()
+
+                if committed:
+                    await send(message)
+
+            await self.app(scope, receive, send_after_commit)
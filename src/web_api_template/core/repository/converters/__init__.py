@@ -0,0 +1,3 @@
+from .converter_registry import ConverterRegistry
+
+__all__ = ["ConverterRegistry"]
@@ -0,0 +1,122 @@
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, get_type_hints
+
+from pydantic import BaseModel
+
+
+class ConverterRegistry:
+    """Registry of model -> entity (and entity -> model) converters.
+    The field list (and renames) of every (model, entity) pair is resolved
+    once, when the pair is registered, instead of on every mapped row.
+    Intended for flat models (values are passed to the entity as they are).
+    """
+
+    _converters: Dict[Tuple[type, type], Callable[[Any], Any]]
+
+    def __init__(self):
+        self._converters = {}
+
+    def register(
+        self,
+        source_class: type,
+        target_class: Type[BaseModel],
+        renames: Optional[Dict[str, str]] = None,
+        validate: bool = True,
+    ) -> Callable[[Any], Any]:
+        """Builds and registers the converter for a pair of classes
+
+        Args:
+            source_class (type): source class (i.e. SQLAlchemy model)
+            target_class (Type[BaseModel]): pydantic entity. For entity -> model
+                converters (the source is the pydantic entity) the target is
+                built with its constructor (i.e. SQLAlchemy model).
+            renames (Dict[str, str], optional): source field -> target field. Defaults to None.
+            validate (bool, optional): validate the entity. Use False only for trusted
+                sources (i.e. rows from our own database): the entity is built with
+                model_construct. Defaults to True.
+
+        Returns:
+            Callable[[Any], Any]: converter
+        """
+        renames = renames or {}
+        fields: List[Tuple[str, str]]
+        if issubclass(target_class, BaseModel):
+            sources: Dict[str, str] = {
+                target: source for source, target in renames.items()
+            }
+            # Annotated fields and class attributes (i.e. SQLAlchemy columns)
+            available: Set[str] = set(get_type_hints(source_class)) | set(
+                dir(source_class)
+            )
+            fields = [
+                (name, sources.get(name, name))
+                for name in target_class.model_fields
+                if sources.get(name, name) in available
+            ]
+        else:
+            # Entity -> model: the entity fields the model has (i.e. columns)
+            fields = [
+                (renames.get(name, name), name)
+                for name in source_class.model_fields
+                if renames.get(name, name) in dir(target_class)
+            ]
+
+        names: Tuple[str, ...] = tuple(name for name, _ in fields)
+        attributes: List[str] = [source for _, source in fields]
+
+        getter: Callable[[Any], Tuple[Any, ...]]
+        if len(attributes) > 1:
+            getter = attrgetter(*attributes)
+        else:
+            # attrgetter returns a value (not a tuple) for a single attribute
+            def getter(item: Any) -> Tuple[Any, ...]:
+                return tuple(getattr(item, name) for name in attributes)
+
+        build: Callable[..., Any] = (
+            target_class
+            if validate or not issubclass(target_class, BaseModel)
+            else target_class.model_construct
+        )
+
+        def convert(item: Any) -> Any:
+            if item is None:
+                return None
+            return build(**dict(zip(names, getter(item))))
+
+        self._converters[(source_class, target_class)] = convert
+        return convert
+
+    def get(self, source_class: type, target_class: type) -> Callable[[Any], Any]:
+        """Gets the converter for a pair of classes
+
+        Args:
+            source_class (type): source class
+            target_class (type): target class
+
+        Raises:
+            KeyError: the pair has not been registered
+
+        Returns:
+            Callable[[Any], Any]: converter
+        """
+        try:
+            return self._converters[(source_class, target_class)]
+        except KeyError:
+            raise KeyError(
+                f"No converter registered from {source_class.__name__} "
+                f"to {target_class.__name__}"
+            )
+
+    def convert(self, item: Any, target_class: type) -> Any:
+        """Converts an item to the target class
+
+        Args:
+            item (Any): source object (None is returned as None)
+            target_class (type): target class
+
+        Returns:
+            Any: target object
+        """
+        if item is None:
+            return None
+        return self.get(type(item), target_class)(item)
@@ -1,3 +1,4 @@
+from .read_repository_base import ReadRepositoryBase
 from .repository_base import RepositoryBase
 
-__all__ = ["RepositoryBase"]
+__all__ = ["RepositoryBase", "ReadRepositoryBase"]
@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
-from typing import Dict, Optional
+from functools import partial
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Set
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
@@ -9,8 +10,13 @@ from web_api_template.core.repository.manager.sqlalchemy.engine_settings import
     EngineSettings,
 )
 from web_api_template.core.repository.model.sqlalchemy import metadata
+from web_api_template.core.settings import settings as core_settings
 
+from .pool_metrics import PoolMetrics
+from .query_tracing import QueryTracer
+from .replica_router import ReplicaRouter, is_primary_pinned, pin_primary
 from .settings import settings
+from .unit_of_work import UnitOfWork, UnitOfWorkSession, current_unit_of_work
 
 
 class AsyncDatabase:
@@ -20,6 +26,8 @@ class AsyncDatabase:
 
     _engines: Dict[str, AsyncEngine] = {}
     _sessions: Dict[str, AsyncSession] = {}
+    _routers: Dict[str, ReplicaRouter] = {}
+    _pool_metrics: Dict[str, PoolMetrics] = {}
 
     def __new__(cls, *args, **kwargs):
         if cls._instance is None:
@@ -49,12 +57,17 @@ class AsyncDatabase:
         if not self._engines:
             self._engines = {}
             self._sessions = {}
+            self._pool_metrics = {}
             for label in settings.labels:
+                self._pool_metrics[label] = PoolMetrics(
+                    label=label,
+                    wait_warning_ms=settings.get_settings(label).POOL_WAIT_WARNING_MS,
+                )
                 self._engines[label] = create_async_engine(
                     settings.get_settings(label).DATABASE_URI,
                     pool_pre_ping=settings.get_settings(label).POOL_PRE_PING,
                     pool_size=settings.get_settings(label).POOL_SIZE,
-                    echo=settings.get_settings(label).ECHO_POOL,
+                    echo=settings.get_settings(label).ECHO,
                     max_overflow=settings.get_settings(label).MAX_OVERFLOW,
                     pool_recycle=settings.get_settings(label).POOL_RECYCLE_IN_SECONDS,
                     echo_pool=settings.get_settings(label).ECHO_POOL,
@@ -63,10 +76,27 @@ class AsyncDatabase:
                     ).POOL_RESET_ON_RETURN,
                     pool_timeout=settings.get_settings(label).POOL_TIMEOUT_IN_SECONDS,
                 )
+                self._pool_metrics[label].register(self._engines[label])
+                if core_settings.SQL_TRACING_ENABLED:
+                    QueryTracer(label).instrument(self._engines[label])
                 self._sessions[label] = sessionmaker(
                     self._engines[label], class_=AsyncSession, expire_on_commit=False
                 )
 
+            # Read replicas (labels configured as the primary ones)
+            self._routers = {}
+            for label in settings.labels:
+                engine_settings: EngineSettings = settings.get_settings(label)
+                if engine_settings.replica_labels:
+                    self._routers[label] = ReplicaRouter(
+                        replicas={
+                            replica: self._sessions[replica]
+                            for replica in engine_settings.replica_labels
+                        },
+                        strategy=engine_settings.REPLICA_STRATEGY,
+                        eject_seconds=engine_settings.REPLICA_EJECT_SECONDS,
+                    )
+
     def async_session(self, label: str = "DEFAULT"):
         if not self._sessions:
             self.init_engines()
@@ -93,16 +123,134 @@ class AsyncDatabase:
 
     @staticmethod
     @asynccontextmanager
-    async def get_session(label: str = "DEFAULT"):
-        """Gets a session from database
+    async def get_session(label: str = "DEFAULT", shared: bool = True):
+        """Gets a session from database (the primary: for writes).
+        Inside a unit of work (i.e. a write request) the session of the unit of
+        work is shared: its commit is deferred to the end of the unit of work.
+
+        Args:
+            label (str, optional): _description_. Defaults to "DEFAULT".
+            shared (bool, optional): use the session of the current unit of
+                work (if any). Defaults to True.
 
         Yields:
             _type_: _description_
         """
+        # The following reads of the request go to the primary
+        pin_primary()
+
+        async with AsyncDatabase._primary_session(label, shared) as session:
+            yield session
+
+    @staticmethod
+    @asynccontextmanager
+    async def get_primary_read_session(label: str = "DEFAULT"):
+        """Gets a read session from the primary, never from a replica nor from
+        the unit of work (i.e. to load a cache shared by every request: lagging
+        or uncommitted rows must not be cached). Unlike get_session the
+        following reads of the request are not pinned to the primary.
+
+        Args:
+            label (str, optional): _description_. Defaults to "DEFAULT".
+
+        Yields:
+            _type_: _description_
+        """
+        async with AsyncDatabase._primary_session(label, shared=False) as session:
+            yield session
+
+    @staticmethod
+    @asynccontextmanager
+    async def _primary_session(label: str, shared: bool):
+        work: Optional[UnitOfWork] = current_unit_of_work() if shared else None
+        if work is not None:
+            # Closed by the unit of work
+            yield work.get_session(label)
+            return
+
         # Async session returns a sessión factory (sessionmaker) and it needs () to create a session
         async with AsyncDatabase().async_session(label)() as session:
             yield session
 
+    @staticmethod
+    @asynccontextmanager
+    async def get_read_session(label: str = "DEFAULT", shared: bool = True):
+        """Gets a read only session: from a replica of the label (if any).
+        The primary is used inside a unit of work, after a write of the
+        current request or when no replica is available.
+
+        Args:
+            label (str, optional): _description_. Defaults to "DEFAULT".
+            shared (bool, optional): use the session of the current unit of
+                work (if any). Defaults to True.
+
+        Yields:
+            _type_: _description_
+        """
+        database: AsyncDatabase = AsyncDatabase()
+        if not database._sessions:
+            database.init_engines()
+
+        router: Optional[ReplicaRouter] = database._routers.get(label)
+        session: Optional[AsyncSession] = None
+        if (
+            router is not None
+            and current_unit_of_work() is None
+            and not is_primary_pinned()
+        ):
+            session = await router.connect()
+
+        if session is None:
+            async with AsyncDatabase._primary_session(label, shared) as session:
+                yield session
+            return
+
+        async with session:
+            yield session
+
+    @staticmethod
+    def unit_of_work_session(label: str = "DEFAULT") -> UnitOfWorkSession:
+        """Creates the session of a unit of work (same engine and options as
+        the sessions of the label)
+
+        Args:
+            label (str, optional): _description_. Defaults to "DEFAULT".
+
+        Returns:
+            UnitOfWorkSession: _description_
+        """
+        return UnitOfWorkSession(**AsyncDatabase().async_session(label).kw)
+
+    @staticmethod
+    def get_count_session_factory(
+        label: str = "DEFAULT",
+    ) -> Optional[Callable[[], AsyncContextManager[AsyncSession]]]:
+        """Gets the session factory used by AsyncPaginator to run the page count
+        on a second pooled connection, concurrently with the items query.
+
+        Args:
+            label (str, optional): engine label. Defaults to "DEFAULT".
+
+        Returns:
+            Optional[Callable]: session factory, None if CONCURRENT_COUNT is disabled for the label
+        """
+        if not settings.get_settings(label).CONCURRENT_COUNT:
+            return None
+        # Runs next to the items query: never the (shared) unit of work session
+        return partial(AsyncDatabase.get_read_session, label, shared=False)
+
+    @staticmethod
+    def pool_status() -> List[Dict[str, Any]]:
+        """Statistics of the connection pool of every label (i.e. for the
+        health detail)
+
+        Returns:
+            List[Dict[str, Any]]: _description_
+        """
+        return [
+            metrics.snapshot() for metrics in AsyncDatabase()._pool_metrics.values()
+        ]
+
     @staticmethod
     async def initialize(label: Optional[str] = None):
         """Initialize database (if active in settings)
@@ -111,8 +259,17 @@ class AsyncDatabase:
             label (str, optional): _description_. Defaults to None.
         """
 
+        # Replicas are read only copies of their primary
+        replicas: Set[str] = {
+            replica
+            for primary in settings.labels
+            for replica in settings.get_settings(primary).replica_labels
+        }
+
         labels = [label] if label else settings.labels
         for label in labels:
+            if label in replicas:
+                continue
             if label is not None:
                 settings_by_label: EngineSettings = settings.get_settings(label)
                 if (
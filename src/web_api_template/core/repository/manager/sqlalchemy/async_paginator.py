@@ -1,17 +1,42 @@
+import asyncio
 import math
-from typing import Any, List
-from uuid import UUID
+from functools import partial
+from typing import (
+    Any,
+    AsyncContextManager,
+    Awaitable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+)
 
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import and_, asc, desc, false, func, or_, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import InstrumentedAttribute, Query
 
 from web_api_template.core.logging import logger
+from web_api_template.core.repository.exceptions import InvalidArgumentException
+from web_api_template.core.repository.manager.sqlalchemy.count_mode_enum import (
+    CountModeEnum,
+)
+from web_api_template.core.repository.manager.sqlalchemy.cursor import (
+    CURSOR_NEXT,
+    CURSOR_PREV,
+    decode_cursor,
+    encode_cursor,
+)
 from web_api_template.core.repository.manager.sqlalchemy.page import Page
 
 
 class AsyncPaginator:
     """SQLAlchemy Async Paginator
+    Supports two modes:
+        - offset: OFFSET/LIMIT over the requested page number
+        - keyset: seek method over the sort columns (+ id tiebreaker) using
+          the opaque cursors returned in Page.next_cursor/Page.prev_cursor
+    When a count session factory is given, the total is calculated on a second
+    pooled connection at the same time the items are fetched.
 
     Returns:
         _type_: _description_
@@ -20,73 +45,257 @@ class AsyncPaginator:
     _session: AsyncSession
     _model: Any
     _query: Query
+    _conditions: List[Any]
+    _sort_columns: List[Tuple[Any, bool]]
+    _count_session_factory: Optional[Callable[[], AsyncContextManager[AsyncSession]]]
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        count_session_factory: Optional[
+            Callable[[], AsyncContextManager[AsyncSession]]
+        ] = None,
+    ):
+        """Initialize the paginator
+
+        Args:
+            session (AsyncSession): session used to fetch the items
+            count_session_factory (Callable, optional): factory of the sessions
+                used to count concurrently (i.e. AsyncDatabase.get_count_session_factory).
+                Defaults to None (count and fetch run one after the other).
+        """
         self._session = session
+        self._count_session_factory = count_session_factory
 
-    async def count(self) -> int:
+    async def count(self, session: Optional[AsyncSession] = None) -> int:
         """Counts the number of elements in the model
 
         Args:
-            model (Any): SQLAlchemy model
+            session (AsyncSession, optional): session to use. Defaults to the paginator session.
 
         Returns:
             int: Number of elements
         """
-        query = select(func.count(self._model.id))
-        result = await self._session.execute(query)
+        session = session or self._session
+        query = select(func.count(self._model.id)).where(*self._conditions)
+        result = await session.execute(query)
         return result.scalar()
 
+    async def estimate(self, session: Optional[AsyncSession] = None) -> Optional[int]:
+        """Estimates the number of elements in the model using the planner
+        statistics of the database (no table scan).
+        Supported on PostgreSQL (pg_class.reltuples) and MySQL/MariaDB
+        (information_schema.tables.table_rows).
+
+        Args:
+            session (AsyncSession, optional): session to use. Defaults to the paginator session.
+
+        Returns:
+            Optional[int]: Estimated number of elements (None if not available)
+        """
+        # Table statistics do not apply to a filtered subset
+        if self._conditions:
+            return None
+
+        session = session or self._session
+        dialect: str = session.get_bind().dialect.name
+        table: Any = self._model.__table__
+
+        if dialect == "postgresql":
+            query = text(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"
+            )
+            name: str = f"{table.schema}.{table.name}" if table.schema else table.name
+            result = await session.execute(query, {"name": name})
+        elif dialect in ("mysql", "mariadb"):
+            query = text(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = COALESCE(:schema, DATABASE()) AND table_name = :name"
+            )
+            result = await session.execute(
+                query, {"schema": table.schema, "name": table.name}
+            )
+        else:
+            return None
+
+        estimated: Optional[int] = result.scalar()
+
+        # reltuples is -1 for tables that have never been analyzed
+        return int(estimated) if estimated is not None and estimated >= 0 else None
+
+    async def _total(
+        self, count_mode: CountModeEnum, session: Optional[AsyncSession] = None
+    ) -> Tuple[Optional[int], bool]:
+        """Gets the total number of elements using the requested count mode.
+        Estimation falls back to an exact count when no statistics are available
+        or the query is filtered.
+
+        Args:
+            count_mode (CountModeEnum): count mode
+            session (AsyncSession, optional): session to use. Defaults to the paginator session.
+
+        Returns:
+            Tuple[Optional[int], bool]: total (None if not counted) and estimated flag
+        """
+        if count_mode == CountModeEnum.NONE:
+            return None, False
+
+        if count_mode == CountModeEnum.ESTIMATE:
+            estimated: Optional[int] = await self.estimate(session)
+            if estimated is not None:
+                return estimated, True
+
+        return await self.count(session), False
+
+    def _is_concurrent(self, count_mode: CountModeEnum) -> bool:
+        """The total is calculated at the same time the items are fetched"""
+        return (
+            self._count_session_factory is not None and count_mode != CountModeEnum.NONE
+        )
+
+    async def _total_and_items(
+        self, count_mode: CountModeEnum, fetch: Callable[[], Awaitable[List[Any]]]
+    ) -> Tuple[Tuple[Optional[int], bool], List[Any]]:
+        """Runs the count on its own pooled connection concurrently with the
+        items query (on the paginator session)
+
+        Args:
+            count_mode (CountModeEnum): count mode
+            fetch (Callable[[], Awaitable[List[Any]]]): fetches the items (the
+                coroutine is only created once the count session is ready)
+
+        Returns:
+            Tuple[Tuple[Optional[int], bool], List[Any]]: total, estimated flag and items
+        """
+        async with self._count_session_factory() as count_session:
+            tasks: List[asyncio.Task] = [
+                asyncio.ensure_future(self._total(count_mode, count_session)),
+                asyncio.ensure_future(fetch()),
+            ]
+            try:
+                await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            finally:
+                # If a query fails (or the request is cancelled) the other one
+                # is cancelled and awaited before its session is released
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        for task in tasks:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+        total, items = [task.result() for task in tasks]
+        return total, items
+
+    async def _fetch_offset(self, page: int, size: int, limit: int) -> List[Any]:
+        """Fetches the items of the given page with OFFSET/LIMIT
+
+        Args:
+            page (int): Page number
+            size (int): Page size
+            limit (int): Number of rows to fetch
+
+        Returns:
+            List[Any]: SQLAlchemy model instances
+        """
+        result = await self._session.execute(
+            self._query.distinct().offset((page - 1) * size).limit(limit)
+        )
+
+        # It is done this way while I am creating the unit tests
+        scalars = result.scalars()
+        return list(scalars.all())
+
     async def list(
         self,
         *,
         model: Any,
-        # filter_by: dict = {},
+        filter_by: Optional[List[Any]] = None,
         order_by: list = [],
         page: int = 1,
         size: int = 10,
+        cursor: Optional[str] = None,
+        count_mode: CountModeEnum = CountModeEnum.EXACT,
     ) -> Page:
         """Makes pagination query and returns a paginated object
-        TODO: Change return parameter to an object
+        If a cursor is given the page is recovered using keyset pagination
+        and page number is ignored.
 
         Args:
             model (Any, optional): SQLAlchemy model.
-            filter_by (dict, optional): Dictionary with field, value to filter on (uses AND). Defaults to {}.
+            filter_by (List[Any], optional): SQLAlchemy conditions (uses AND), i.e. built with QueryFilter. Defaults to None.
             order_by (list, optional): Array with sorting columns (- desc, nothing asc). Defaults to [].
             page (int, optional): Page number. Defaults to 1.
             size (int, optional): Page size. Defaults to 10.
+            cursor (str, optional): Cursor returned by a previous page. Defaults to None.
+            count_mode (CountModeEnum, optional): How the total is calculated. Defaults to EXACT.
 
         Returns:
-            dict: _description_
+            Page: page with the items and the cursors to the adjacent pages
         """
-        items: list[model] = []
         self._model = model
         self._query = select(self._model)
 
-        # self._filter(filter_by)
+        self._filter(filter_by or [])
         self._sort(order_by)
 
-        # Get number of elements
-        count: int = await self.count()
+        if cursor:
+            return await self._keyset_list(
+                cursor=cursor, size=size, count_mode=count_mode
+            )
 
-        # Calculate offset and limit
-        # Pages, round up
-        pages: int = 0 if count == 0 else int(math.ceil(count / size))
+        return await self._offset_list(page=page, size=size, count_mode=count_mode)
 
-        if count > 0:
-            # If requested page > page set the last page
-            if page > pages:
-                page = pages
+    async def _offset_list(
+        self, *, page: int, size: int, count_mode: CountModeEnum
+    ) -> Page:
+        """Recovers a page using OFFSET/LIMIT
 
-            offset = (page - 1) * size
+        Args:
+            page (int): Page number
+            size (int): Page size
+            count_mode (CountModeEnum): How the total is calculated
+
+        Returns:
+            Page: _description_
+        """
+        # Exact totals tell if there is a next page, otherwise fetch one more row
+        limit: int = size if count_mode == CountModeEnum.EXACT else size + 1
 
-            result = await self._session.execute(
-                self._query.distinct().offset(offset).limit(size)
+        if self._is_concurrent(count_mode):
+            (count, estimated), items = await self._total_and_items(
+                count_mode, partial(self._fetch_offset, page, size, limit)
             )
+            pages: Optional[int] = self._pages(count, size)
+
+            # If requested page > page fetch the last page
+            if count and not estimated and page > pages:
+                page = pages
+                items = await self._fetch_offset(page, size, limit)
+
+        else:
+            # Get number of elements
+            count, estimated = await self._total(count_mode)
+
+            # Calculate offset and limit
+            # Pages, round up
+            pages = self._pages(count, size)
+
+            if count == 0 and not estimated:
+                items = []
+            else:
+                # If requested page > page set the last page
+                if count and not estimated and page > pages:
+                    page = pages
+
+                items = await self._fetch_offset(page, size, limit)
 
-            # It is done this way while I am creating the unit tests
-            scalars = result.scalars()
-            items: List[Any] = scalars.all()
+        if count is None or estimated:
+            # Total is unknown or approximate: the extra row tells if there is a next page
+            has_next: bool = len(items) > size
+        else:
+            has_next = page < pages
+        items = items[:size]
 
         # Build the return object
         return Page(
@@ -95,33 +304,199 @@ class AsyncPaginator:
             page=page,
             items=items,
             size=size,
+            has_next=has_next,
+            estimated=estimated,
+            next_cursor=self._cursor_for(items[-1], CURSOR_NEXT) if has_next else None,
+            prev_cursor=(
+                self._cursor_for(items[0], CURSOR_PREV) if items and page > 1 else None
+            ),
         )
 
-    def _filter(self, filter_by: dict = {}):
-        """Builds the filter object for SQLAlchemy
+    async def _keyset_list(
+        self, *, cursor: str, size: int, count_mode: CountModeEnum
+    ) -> Page:
+        """Recovers the page after (or before) the given cursor.
+        The cost does not depend on the position of the page.
 
         Args:
-            model (Any): _description_
-            filter_by (dict, optional): _description_. Defaults to {}.
+            cursor (str): Cursor returned by a previous page
+            size (int): Page size
+            count_mode (CountModeEnum): How the total is calculated
 
         Returns:
-            list: _description_
+            Page: _description_
+        """
+        direction, values = decode_cursor(
+            cursor, [self._python_type(column) for column, _ in self._sort_columns]
+        )
+        backwards: bool = direction == CURSOR_PREV
+
+        query = select(self._model).where(
+            *self._conditions, self._seek(values, backwards)
+        )
+        query = query.order_by(
+            *[
+                clause
+                for column, is_desc in self._sort_columns
+                # Reverse the ordering when going backwards
+                for clause in self._order(column, is_desc != backwards)
+            ]
+        )
+
+        async def fetch() -> List[Any]:
+            # Fetch one more row to know if there are more pages in this direction
+            result = await self._session.execute(query.limit(size + 1))
+            return list(result.scalars().all())
+
+        if self._is_concurrent(count_mode):
+            (count, estimated), items = await self._total_and_items(count_mode, fetch)
+        else:
+            items = await fetch()
+            count, estimated = await self._total(count_mode)
+
+        has_more: bool = len(items) > size
+        items = items[:size]
+
+        if backwards:
+            items.reverse()
+
+        has_next: bool = bool(items) and (backwards or has_more)
+
+        return Page(
+            total=count,
+            pages=self._pages(count, size),
+            page=None,
+            items=items,
+            size=size,
+            has_next=has_next,
+            estimated=estimated,
+            next_cursor=self._cursor_for(items[-1], CURSOR_NEXT) if has_next else None,
+            prev_cursor=(
+                self._cursor_for(items[0], CURSOR_PREV)
+                if items and (not backwards or has_more)
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _pages(count: Optional[int], size: int) -> Optional[int]:
+        """Number of pages for the given total (None if total is unknown)"""
+        if count is None:
+            return None
+        return 0 if count == 0 else int(math.ceil(count / size))
+
+    def _seek(self, values: List[Any], backwards: bool) -> Any:
+        """Builds the keyset condition to get the rows after the given values.
+        NULL is the greatest value (see _order), so nullable columns get
+        explicit IS NULL branches: a comparison with NULL is never true.
+
+        Args:
+            values (List[Any]): sort column values of the cursor row
+            backwards (bool): True to get the rows before the cursor row
+
+        Returns:
+            Any: SQLAlchemy condition
+        """
+
+        def after(column: Any, is_desc: bool, value: Any) -> Any:
+            greater: bool = is_desc == backwards
+            if value is None:
+                # Nothing is greater than NULL, every value is lower
+                return false() if greater else column.is_not(None)
+            if not greater:
+                return column < value
+            if self._nullable(column):
+                return or_(column > value, column.is_(None))
+            return column > value
+
+        def equals(column: Any, value: Any) -> Any:
+            return column.is_(None) if value is None else column == value
+
+        directions = {is_desc for _, is_desc in self._sort_columns}
+        if len(directions) == 1 and not any(
+            self._nullable(column) for column, _ in self._sort_columns
+        ):
+            # Same direction on every column: row value comparison (index friendly)
+            columns = [column for column, _ in self._sort_columns]
+            return after(tuple_(*columns), directions.pop(), tuple(values))
+
+        # Mixed directions or nullable columns: (c1 > v1) OR (c1 = v1 AND c2 > v2) OR ...
+        conditions: List[Any] = []
+        for position, (column, is_desc) in enumerate(self._sort_columns):
+            previous_equal = [
+                equals(previous, values[index])
+                for index, (previous, _) in enumerate(self._sort_columns[:position])
+            ]
+            conditions.append(
+                and_(*previous_equal, after(column, is_desc, values[position]))
+            )
+        return or_(*conditions)
+
+    def _cursor_for(self, item: Any, direction: str) -> str:
+        """Builds the cursor pointing to the given item
+
+        Args:
+            item (Any): SQLAlchemy model instance
+            direction (str): CURSOR_NEXT or CURSOR_PREV
+
+        Returns:
+            str: cursor token
         """
-        logger.debug(filter_by)
-        # Add filter deleted
-        self._query = self._query.filter(getattr(self._model, "deleted").is_not(True))
-
-        for key, value in filter_by.items():
-            if type(value) == str:
-                self._query = self._query.filter(
-                    getattr(self._model, key).ilike(f"%{value}%")
-                )
-            elif type(value) == int or type(value) == UUID:
-                column: Any = getattr(self._model, key, None)
-                self._query = self._query.filter(getattr(self._model, key) == value)
+        return encode_cursor(
+            [getattr(item, column.key) for column, _ in self._sort_columns],
+            direction,
+        )
+
+    @staticmethod
+    def _nullable(column: Any) -> bool:
+        """Checks if a sort column accepts NULL values"""
+        return bool(getattr(column.expression, "nullable", False))
+
+    def _order(self, column: Any, is_desc: bool) -> List[Any]:
+        """Builds the ORDER BY clauses of a sort column. NULL is sorted as the
+        greatest value on every database (PostgreSQL default), so the keyset
+        conditions match the ordering. MySQL does not support NULLS FIRST/LAST:
+        it is emulated sorting by column IS NULL first.
+
+        Args:
+            column (Any): SQLAlchemy column
+            is_desc (bool): descending order
+
+        Returns:
+            List[Any]: SQLAlchemy order by clauses
+        """
+        direction: Callable[[Any], Any] = desc if is_desc else asc
+        if not self._nullable(column):
+            return [direction(column)]
+        if self._session.get_bind().dialect.name in ("mysql", "mariadb"):
+            return [direction(column.is_(None)), direction(column)]
+        return [desc(column).nulls_first() if is_desc else asc(column).nulls_last()]
+
+    @staticmethod
+    def _python_type(column: Any) -> Any:
+        """Gets the python type of a column (None if not available)"""
+        try:
+            return column.type.python_type
+        except NotImplementedError:
+            return None
+
+    def _filter(self, filter_by: List[Any] = []):
+        """Adds the filter conditions to the query
+        The same conditions are applied to the count and keyset queries.
+
+        Args:
+            filter_by (List[Any], optional): SQLAlchemy conditions. Defaults to [].
+        """
+        logger.debug("Filter conditions: {}", filter_by)
+
+        self._conditions = list(filter_by)
+        if self._conditions:
+            self._query = self._query.where(*self._conditions)
 
     def _sort(self, order_by: List = []):
         """Builds the sort object for SQLAlchemy
+        The id is always added as the last sort column (tiebreaker) so the
+        ordering is deterministic and can be used for keyset pagination.
 
         Args:
             order_by (dict, optional): _description_. Defaults to {}.
@@ -130,10 +505,24 @@ class AsyncPaginator:
             list: _description_
         """
 
+        self._sort_columns = []
+
         # Improved to sort by the main object and ignore joins
-        for sort_column in order_by:
-            self._query = self._query.order_by(
-                desc(getattr(self._model, sort_column[1:]))
-                if sort_column[:1] == "-"
-                else asc(getattr(self._model, sort_column))
-            )
+        for sort_column in [column.strip() for column in order_by if column.strip()]:
+            is_desc: bool = sort_column[:1] == "-"
+            name: str = sort_column[1:] if is_desc else sort_column
+            column: Any = getattr(self._model, name, None)
+            if not isinstance(column, InstrumentedAttribute):
+                raise InvalidArgumentException(f"Invalid sort column: {name}")
+            self._sort_columns.append((column, is_desc))
+
+        if not any(column.key == "id" for column, _ in self._sort_columns):
+            self._sort_columns.append((self._model.id, False))
+
+        self._query = self._query.order_by(
+            *[
+                clause
+                for column, is_desc in self._sort_columns
+                for clause in self._order(column, is_desc)
+            ]
+        )
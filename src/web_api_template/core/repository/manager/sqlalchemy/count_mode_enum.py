@@ -0,0 +1,16 @@
+import enum
+
+
+class CountModeEnum(enum.Enum):
+    """How the total number of items is calculated on paginated queries
+
+    Args:
+        enum (_type_): _description_
+    """
+
+    EXACT = "exact"
+    NONE = "none"
+    ESTIMATE = "estimate"
+
+    def __str__(self):
+        return self.value
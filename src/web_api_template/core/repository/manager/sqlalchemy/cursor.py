@@ -0,0 +1,99 @@
+import base64
+import enum
+import json
+from datetime import date, datetime
+from typing import Any, List, Tuple
+
+from web_api_template.core.repository.exceptions import InvalidArgumentException
+
+# Cursor directions
+CURSOR_NEXT: str = "n"
+CURSOR_PREV: str = "p"
+
+
+def _encode_value(value: Any) -> Any:
+    """Converts a column value into a json compatible value
+
+    Args:
+        value (Any): column value
+
+    Returns:
+        Any: json compatible value
+    """
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any, python_type: Any) -> Any:
+    """Converts a json value back to the python type of the column
+
+    Args:
+        value (Any): json value
+        python_type (Any): python type of the column
+
+    Returns:
+        Any: column value
+    """
+    if value is None or python_type is None:
+        return value
+    if issubclass(python_type, enum.Enum):
+        return python_type(value)
+    if issubclass(python_type, datetime):
+        return datetime.fromisoformat(value)
+    if issubclass(python_type, date):
+        return date.fromisoformat(value)
+    return value
+
+
+def encode_cursor(values: List[Any], direction: str = CURSOR_NEXT) -> str:
+    """Builds an opaque cursor token from the sort column values of a row
+
+    Args:
+        values (List[Any]): values of the sort columns (id tiebreaker included)
+        direction (str, optional): CURSOR_NEXT or CURSOR_PREV. Defaults to CURSOR_NEXT.
+
+    Returns:
+        str: url safe cursor token
+    """
+    payload: str = json.dumps(
+        {"d": direction, "k": [_encode_value(value) for value in values]},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, python_types: List[Any]) -> Tuple[str, List[Any]]:
+    """Decodes a cursor token built by encode_cursor
+
+    Args:
+        token (str): cursor token
+        python_types (List[Any]): python types of the sort columns, in order
+
+    Raises:
+        InvalidArgumentException: if the token is malformed or does not match the sort
+
+    Returns:
+        Tuple[str, List[Any]]: direction and sort column values
+    """
+    try:
+        padding: str = "=" * (-len(token) % 4)
+        payload: Any = json.loads(base64.urlsafe_b64decode(token + padding))
+        direction: str = payload["d"]
+        values: List[Any] = payload["k"]
+    except (ValueError, KeyError, TypeError):
+        # binascii.Error is a ValueError
+        raise InvalidArgumentException("Invalid pagination cursor")
+
+    if direction not in (CURSOR_NEXT, CURSOR_PREV) or len(values) != len(python_types):
+        raise InvalidArgumentException("Pagination cursor does not match the sort")
+
+    try:
+        return direction, [
+            _decode_value(value, python_type)
+            for value, python_type in zip(values, python_types)
+        ]
+    except (ValueError, TypeError):
+        raise InvalidArgumentException("Invalid pagination cursor")
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from starlette.config import Config
 
@@ -24,6 +24,13 @@ class EngineSettings(Settings):
         "POOL_RESET_ON_RETURN": "rollback",
         "POOL_TIMEOUT_IN_SECONDS": 30,
         "POOL": "~sqlalchemy.pool.QueuePool",
+        "CONCURRENT_COUNT": False,
+        # Checkout time (p95) that raises a warning in the health detail
+        "POOL_WAIT_WARNING_MS": 100,
+        # Read replicas: comma separated labels (configured as any other label)
+        "REPLICAS": "",
+        "REPLICA_STRATEGY": "round_robin",
+        "REPLICA_EJECT_SECONDS": 30,
     }
 
     def __init__(self, label: str, prefix: str = "SQLALCHEMY__"):
@@ -40,3 +47,12 @@ class EngineSettings(Settings):
                 key,
                 config(f"{prefix}{label}__{key}", cast=type(value), default=value),
             )
+
+    @property
+    def replica_labels(self) -> List[str]:
+        """Labels of the read replicas of the database
+
+        Returns:
+            List[str]: _description_
+        """
+        return [label.strip() for label in self.REPLICAS.split(",") if label.strip()]
@@ -0,0 +1,19 @@
+import enum
+
+
+class FilterOperatorEnum(enum.Enum):
+    """Operators supported by the query filters
+
+    Args:
+        enum (_type_): _description_
+    """
+
+    EQ = "eq"
+    PREFIX = "prefix"
+    IN = "in"
+    # Range: one filter field for each bound
+    GTE = "gte"
+    LTE = "lte"
+
+    def __str__(self):
+        return self.value
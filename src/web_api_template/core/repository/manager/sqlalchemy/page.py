@@ -17,13 +17,23 @@ class Page(BaseModel):
     )
     pages: Optional[int] = Field(
         default=1,
-        ge=1,
+        ge=0,
         json_schema_extra={"description": "Total pages", "example": "100"},
     )
     total: Optional[int] = Field(
         default=0,
         ge=0,
-        json_schema_extra={"description": "Total items", "example": "1000"},
+        json_schema_extra={
+            "description": "Total items (null when the count is not requested)",
+            "example": "1000",
+        },
+    )
+    estimated: bool = Field(
+        default=False,
+        json_schema_extra={
+            "description": "True when total/pages are estimated from database statistics",
+            "example": "false",
+        },
     )
     size: Optional[int] = Field(
         default=10,
@@ -36,5 +46,25 @@ class Page(BaseModel):
         json_schema_extra={"description": "Items in the page", "example": "[]"},
     )
 
+    has_next: Optional[bool] = Field(
+        default=None,
+        json_schema_extra={"description": "There is a next page", "example": "true"},
+    )
+
+    next_cursor: Optional[str] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Cursor to recover the next page (keyset pagination)",
+            "example": "eyJkIjoibiIsImsiOlsiMnBYM3VtNlk3c2lTMWJDeVp4NUJ3OEU4ZFd2Il19",
+        },
+    )
+    prev_cursor: Optional[str] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Cursor to recover the previous page (keyset pagination)",
+            "example": "eyJkIjoicCIsImsiOlsiMnBYM3VtNlk3c2lTMWJDeVp4NUJ3OEU4ZFd2Il19",
+        },
+    )
+
     class Config:
         extra = "forbid"
@@ -0,0 +1,213 @@
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Type
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import Pool, QueuePool
+
+# Checkout times kept by pool for the percentiles of the health detail
+WAIT_WINDOW: int = 1000
+
+meter = metrics.get_meter(__name__)
+
+# OpenTelemetry database client semantic conventions (db.client.connections.*)
+wait_time_histogram = meter.create_histogram(
+    "db.client.connections.wait_time",
+    unit="ms",
+    description="Time to obtain an open connection from the pool",
+)
+create_time_histogram = meter.create_histogram(
+    "db.client.connections.create_time",
+    unit="ms",
+    description="Time to create a new connection",
+)
+timeouts_counter = meter.create_counter(
+    "db.client.connections.timeouts",
+    unit="{timeout}",
+    description="Connections that could not be obtained before pool_timeout",
+)
+invalidations_counter = meter.create_counter(
+    "db.client.connections.invalidations",
+    unit="{connection}",
+    description="Connections invalidated (i.e. disconnected or pre ping failed)",
+)
+
+_pools: Dict[str, "PoolMetrics"] = {}
+
+
+def _observe_usage(options: CallbackOptions) -> Iterable[Observation]:
+    for label, pool_metrics in _pools.items():
+        pool: Optional[QueuePool] = pool_metrics.queue_pool
+        if pool is not None:
+            yield Observation(pool.checkedout(), {"pool.name": label, "state": "used"})
+            yield Observation(pool.checkedin(), {"pool.name": label, "state": "idle"})
+
+
+def _observe_overflow(options: CallbackOptions) -> Iterable[Observation]:
+    for label, pool_metrics in _pools.items():
+        pool: Optional[QueuePool] = pool_metrics.queue_pool
+        if pool is not None:
+            yield Observation(max(pool.overflow(), 0), {"pool.name": label})
+
+
+meter.create_observable_up_down_counter(
+    "db.client.connections.usage",
+    callbacks=[_observe_usage],
+    unit="{connection}",
+    description="Connections by state (used: checked out, idle: in the pool)",
+)
+meter.create_observable_up_down_counter(
+    "db.client.connections.overflow",
+    callbacks=[_observe_overflow],
+    unit="{connection}",
+    description="Connections open over pool_size",
+)
+
+
+def _instrumented_pool_class(
+    pool_class: Type[Pool], pool_metrics: "PoolMetrics"
+) -> Type[Pool]:
+    """Subclass of the pool class chosen by the engine that times the
+    checkouts (queue wait, plus pre ping or connect)
+    """
+
+    def connect(self):
+        start: float = time.perf_counter()
+        try:
+            return pool_class.connect(self)
+        except TimeoutError:
+            pool_metrics.on_timeout()
+            raise
+        finally:
+            pool_metrics.on_checkout((time.perf_counter() - start) * 1000)
+
+    return type(
+        f"Instrumented{pool_class.__name__}",
+        (pool_class,),
+        {"connect": connect, "_metrics": pool_metrics},
+    )
+
+
+class PoolMetrics:
+    """Statistics of the connection pool of a database label, from the pool
+    events. Exported through OpenTelemetry and shown in the health detail.
+    """
+
+    _engine: Optional[AsyncEngine]
+    _wait_times: Deque[float]
+
+    def __init__(self, label: str, wait_warning_ms: float = 100):
+        """Initialize the pool statistics
+
+        Args:
+            label (str): database label
+            wait_warning_ms (float, optional): checkout time (p95) that raises
+                a warning. Defaults to 100.
+        """
+        self.label = label
+        self.wait_warning_ms = wait_warning_ms
+        self._engine = None
+        self._attributes: Dict[str, str] = {"pool.name": label}
+
+        self.checkouts: int = 0
+        self.connects: int = 0
+        self.invalidations: int = 0
+        self.timeouts: int = 0
+        self.connect_time_ms: float = 0
+        self._wait_times = deque(maxlen=WAIT_WINDOW)
+
+    @property
+    def pool(self) -> Pool:
+        return self._engine.sync_engine.pool
+
+    @property
+    def queue_pool(self) -> Optional[QueuePool]:
+        """The pool when it has a size (i.e. not NullPool nor StaticPool)"""
+        if self._engine is None or not isinstance(self.pool, QueuePool):
+            return None
+        return self.pool
+
+    def register(self, engine: AsyncEngine) -> None:
+        """Starts exporting the statistics of the engine. The pool class
+        chosen by the engine (dialect default or poolclass) is kept: it is
+        only extended to time the checkouts.
+
+        Args:
+            engine (AsyncEngine): _description_
+        """
+        self._engine = engine
+        _pools[self.label] = self
+
+        # Kept when the pool is recreated (recreate uses the pool class)
+        if getattr(self.pool, "_metrics", None) is not self:
+            self.pool.__class__ = _instrumented_pool_class(type(self.pool), self)
+
+        # Engine level pool events (kept when the pool is recreated)
+        event.listen(engine.sync_engine, "connect", self._on_connect)
+        event.listen(engine.sync_engine, "invalidate", self._on_invalidate)
+        event.listen(engine.sync_engine, "soft_invalidate", self._on_invalidate)
+
+    def on_checkout(self, elapsed_ms: float) -> None:
+        self.checkouts += 1
+        self._wait_times.append(elapsed_ms)
+        wait_time_histogram.record(elapsed_ms, self._attributes)
+
+    def on_timeout(self) -> None:
+        self.timeouts += 1
+        timeouts_counter.add(1, self._attributes)
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        # The record start time is taken just before creating the connection
+        self.connects += 1
+        self.connect_time_ms = (time.time() - connection_record.starttime) * 1000
+        create_time_histogram.record(self.connect_time_ms, self._attributes)
+
+    def _on_invalidate(
+        self, dbapi_connection: Any, connection_record: Any, exception: Any
+    ) -> None:
+        self.invalidations += 1
+        invalidations_counter.add(1, self._attributes)
+
+    def _percentile(self, values: List[float], percentile: float) -> float:
+        if not values:
+            return 0
+        return values[min(len(values) - 1, int(len(values) * percentile))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current statistics of the pool
+
+        Returns:
+            Dict[str, Any]: _description_
+        """
+        wait_times: List[float] = sorted(self._wait_times)
+        wait_p95_ms: float = self._percentile(wait_times, 0.95)
+
+        warnings: List[str] = []
+        if wait_p95_ms > self.wait_warning_ms:
+            warnings.append(
+                f"Checkout time p95 {wait_p95_ms:.1f} ms over {self.wait_warning_ms} ms: "
+                "pool saturated or database slow to connect"
+            )
+        if self.timeouts:
+            warnings.append(f"{self.timeouts} checkouts timed out (pool_timeout)")
+
+        pool: Optional[QueuePool] = self.queue_pool
+        return {
+            "label": self.label,
+            "size": pool.size() if pool is not None else 0,
+            "checked_out": pool.checkedout() if pool is not None else 0,
+            "overflow": max(pool.overflow(), 0) if pool is not None else 0,
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_p50_ms": self._percentile(wait_times, 0.5),
+            "wait_p95_ms": wait_p95_ms,
+            "wait_max_ms": wait_times[-1] if wait_times else 0,
+            "connect_time_ms": self.connect_time_ms,
+            "warnings": warnings,
+        }
@@ -0,0 +1,143 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy.orm import InstrumentedAttribute
+
+from web_api_template.core.repository.exceptions import InvalidArgumentException
+from web_api_template.core.repository.manager.sqlalchemy.filter_operator_enum import (
+    FilterOperatorEnum,
+)
+
+
+class FilterField:
+    """Column and operator used by a field of a filter model"""
+
+    column: InstrumentedAttribute
+    operator: FilterOperatorEnum
+
+    def __init__(
+        self,
+        column: InstrumentedAttribute,
+        operator: FilterOperatorEnum = FilterOperatorEnum.EQ,
+    ):
+        """Initialize the filter field
+
+        Args:
+            column (InstrumentedAttribute): SQLAlchemy model column (i.e. PersonModel.name)
+            operator (FilterOperatorEnum, optional): Operator. Defaults to EQ.
+        """
+        self.column = column
+        self.operator = operator
+
+
+class QueryFilter:
+    """Builds the SQL WHERE conditions from a domain filter model.
+    Only the whitelisted fields can be used and every whitelisted column
+    must be indexed, so filtered queries never scan the whole table.
+
+    Returns:
+        _type_: _description_
+    """
+
+    _fields: Dict[str, FilterField]
+
+    def __init__(self, fields: Dict[str, FilterField]):
+        """Initialize the query filter
+
+        Args:
+            fields (Dict[str, FilterField]): whitelist of filter model fields
+
+        Raises:
+            ValueError: a whitelisted column is not indexed
+        """
+        for name, field in fields.items():
+            if not self._is_indexed(field.column):
+                raise ValueError(
+                    f"Filter field {name}: column {field.column} is not indexed"
+                )
+
+        self._fields = fields
+
+    def build(self, filter: Optional[BaseModel]) -> List[Any]:
+        """Builds the conditions (joined with AND) for the informed filter fields
+
+        Args:
+            filter (BaseModel, optional): domain filter model
+
+        Raises:
+            InvalidArgumentException: field not allowed or invalid value
+
+        Returns:
+            List[Any]: SQLAlchemy conditions
+        """
+        if filter is None:
+            return []
+
+        conditions: List[Any] = []
+        for name, value in filter.model_dump(exclude_none=True).items():
+            field: Optional[FilterField] = self._fields.get(name)
+            if field is None:
+                raise InvalidArgumentException(f"Filter by {name} is not allowed")
+
+            conditions.append(self._condition(field, value))
+
+        return conditions
+
+    def _condition(self, field: FilterField, value: Any) -> Any:
+        """Builds the condition for a field
+
+        Args:
+            field (FilterField): filter field
+            value (Any): filter value
+
+        Returns:
+            Any: SQLAlchemy condition
+        """
+        column: InstrumentedAttribute = field.column
+
+        if field.operator == FilterOperatorEnum.PREFIX:
+            # LIKE 'value%' can use the index (% and _ in the value are escaped)
+            return column.startswith(str(value), autoescape=True)
+
+        if field.operator == FilterOperatorEnum.IN:
+            # Query string friendly: comma separated values
+            values: List[Any] = (
+                [item.strip() for item in value.split(",") if item.strip()]
+                if isinstance(value, str)
+                else list(value)
+            )
+            return column.in_([self._coerce(column, item) for item in values])
+
+        if field.operator == FilterOperatorEnum.GTE:
+            return column >= value
+
+        if field.operator == FilterOperatorEnum.LTE:
+            return column <= value
+
+        return column == value
+
+    @staticmethod
+    def _coerce(column: InstrumentedAttribute, value: Any) -> Any:
+        """Converts a value to the enum type of the column (if any)"""
+        enum_class: Any = getattr(column.type, "enum_class", None)
+        if enum_class is None or isinstance(value, enum_class):
+            return value
+
+        try:
+            return enum_class(value)
+        except ValueError as ex:
+            raise InvalidArgumentException(
+                f"Invalid value for {column.key}: {value}"
+            ) from ex
+
+    @staticmethod
+    def _is_indexed(column: InstrumentedAttribute) -> bool:
+        """The column is the primary key, unique, indexed or the first column of an index"""
+        table_column: Any = column.property.columns[0]
+        if table_column.primary_key or table_column.index or table_column.unique:
+            return True
+
+        return any(
+            list(index.columns)[0] is table_column
+            for index in table_column.table.indexes
+        )
@@ -0,0 +1,214 @@
+import re
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind, Status, StatusCode, TracerProvider
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from web_api_template.core.settings import settings
+
+# Queries in flight by connection (connection.info key)
+_IN_FLIGHT: str = "query_tracing"
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+# Bind parameters: qmark, numeric ($1), pyformat (%(name)s, %s) and named (:name)
+_PARAMETERS = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+")
+# IN lists and multi row VALUES: (?, ?, ?) or (?, ?), (?, ?) (with casts: ?::TYPE)
+_PARAMETER_TUPLE: str = r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)*\s*\)"
+_PARAMETER_LIST = re.compile(rf"{_PARAMETER_TUPLE}(?:\s*,\s*{_PARAMETER_TUPLE})*")
+_SPACES = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Normalized statement: without literals, comments or repeated bind
+    parameters (the same query with different values has the same fingerprint)
+
+    Args:
+        statement (str): SQL statement
+
+    Returns:
+        str: fingerprint
+    """
+    statement = _COMMENTS.sub(" ", statement)
+    statement = _STRINGS.sub("?", statement)
+    statement = _PARAMETERS.sub("?", statement)
+    statement = _NUMBERS.sub("?", statement)
+    statement = _PARAMETER_LIST.sub("(...)", statement)
+    return _SPACES.sub(" ", statement).strip()
+
+
+class QueryStats:
+    """Statistics of a fingerprint"""
+
+    __slots__ = ("label", "fingerprint", "count", "total_ms", "max_ms", "rows")
+
+    def __init__(self, label: str, fingerprint: str):
+        self.label = label
+        self.fingerprint = fingerprint
+        self.count: int = 0
+        self.total_ms: float = 0
+        self.max_ms: float = 0
+        self.rows: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "label": self.label,
+            "fingerprint": self.fingerprint,
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "mean_ms": self.total_ms / self.count if self.count else 0,
+            "max_ms": self.max_ms,
+            "rows": self.rows,
+        }
+
+
+class SlowQueryTable:
+    """In process statistics by fingerprint (and database label), to find the
+    slowest queries. Bounded: when full, the fingerprint with the lowest total
+    time is dropped.
+    """
+
+    ORDER_BY: Tuple[str, ...] = ("total_ms", "max_ms", "mean_ms", "count")
+
+    _stats: Dict[Tuple[str, str], QueryStats]
+
+    def __init__(self, max_size: int = 500):
+        """Initialize the table
+
+        Args:
+            max_size (int, optional): fingerprints kept. Defaults to 500.
+        """
+        self.max_size = max_size
+        self._stats = {}
+
+    def record(self, label: str, fingerprint: str, elapsed_ms: float, rows: int):
+        """Adds an execution of the fingerprint
+
+        Args:
+            label (str): database label
+            fingerprint (str): statement fingerprint
+            elapsed_ms (float): duration
+            rows (int): rows returned or affected (-1 if unknown)
+        """
+        key: Tuple[str, str] = (label, fingerprint)
+        stats: QueryStats | None = self._stats.get(key)
+        if stats is None:
+            if len(self._stats) >= self.max_size:
+                del self._stats[
+                    min(self._stats, key=lambda key: self._stats[key].total_ms)
+                ]
+            stats = QueryStats(label, fingerprint)
+            self._stats[key] = stats
+
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        if rows > 0:
+            stats.rows += rows
+
+    def top(self, limit: int = 20, order_by: str = "total_ms") -> List[Dict[str, Any]]:
+        """Slowest fingerprints
+
+        Args:
+            limit (int, optional): _description_. Defaults to 20.
+            order_by (str, optional): total_ms, max_ms, mean_ms or count.
+                Defaults to total_ms.
+
+        Returns:
+            List[Dict[str, Any]]: statistics, slowest first
+        """
+        if order_by not in self.ORDER_BY:
+            raise ValueError(f"Invalid order: {order_by}")
+
+        stats: List[Dict[str, Any]] = [
+            stats.as_dict() for stats in self._stats.values()
+        ]
+        return sorted(stats, key=lambda item: item[order_by], reverse=True)[:limit]
+
+    def clear(self) -> None:
+        self._stats = {}
+
+
+slow_query_table: SlowQueryTable = SlowQueryTable(
+    max_size=settings.SQL_SLOW_QUERY_TABLE_SIZE
+)
+
+
+class QueryTracer:
+    """Traces the statements of an engine (cursor execute events): an
+    OpenTelemetry span by statement (fingerprint, duration, rows and
+    database label) and the slow query table.
+    """
+
+    def __init__(
+        self,
+        label: str,
+        table: SlowQueryTable = slow_query_table,
+        tracer_provider: Optional[TracerProvider] = None,
+    ):
+        """Initialize the tracer
+
+        Args:
+            label (str): database label
+            table (SlowQueryTable, optional): _description_.
+                Defaults to slow_query_table.
+            tracer_provider (TracerProvider, optional): Defaults to the global one.
+        """
+        self.label = label
+        self.table = table
+        self._tracer = trace.get_tracer(__name__, tracer_provider=tracer_provider)
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """Listens to the statements of the engine
+
+        Args:
+            engine (AsyncEngine): _description_
+        """
+        self._system = engine.dialect.name
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after)
+        event.listen(engine.sync_engine, "handle_error", self._error)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        query: str = fingerprint(statement)
+        span = self._tracer.start_span(
+            f"{query.split(' ', 1)[0].upper()} {self.label}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": self._system,
+                "db.statement": query,
+                "pool.name": self.label,
+            },
+        )
+        conn.info.setdefault(_IN_FLIGHT, []).append((span, query, time.perf_counter()))
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        span, query, start = conn.info[_IN_FLIGHT].pop()
+        elapsed_ms: float = (time.perf_counter() - start) * 1000
+
+        # Rows returned or affected, if the driver knows it (-1 otherwise)
+        rows: int = cursor.rowcount
+        if rows >= 0:
+            span.set_attribute("db.response.returned_rows", rows)
+        span.end()
+
+        self.table.record(self.label, query, elapsed_ms, rows)
+
+    def _error(self, exception_context) -> None:
+        conn = exception_context.connection
+        if conn is None or not conn.info.get(_IN_FLIGHT):
+            # i.e. connection errors (no statement in flight)
+            return
+
+        span, query, start = conn.info[_IN_FLIGHT].pop()
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+
+        self.table.record(self.label, query, (time.perf_counter() - start) * 1000, -1)
@@ -0,0 +1,132 @@
+from typing import Any, AsyncIterator, Callable, List
+
+from sqlalchemy import select
+
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
+from web_api_template.core.logging import logger
+from web_api_template.core.settings import settings
+
+from .async_database import AsyncDatabase
+from .async_paginator import AsyncPaginator
+from .page import Page
+from .query_filter import QueryFilter
+from .repository_base import RepositoryBase
+
+
+class ReadRepositoryBase(RepositoryBase):
+    """
+    Abstract class for database read repository: pagination and streaming of
+    the filtered rows of a model, mapped to entities with a converter
+
+    Raises:
+        NotImplementedError: _description_
+    """
+
+    async def _get_paginated_list(
+        self,
+        *,
+        model: Any,
+        convert: Callable[[Any], Any],
+        query_filter: QueryFilter,
+        filter: Any,
+        pagination: PaginationQueryModel,
+    ) -> Page:
+        """Gets a page of the filtered rows (read replica)
+
+        Args:
+            model (Any): SQLAlchemy model
+            convert (Callable[[Any], Any]): converter from the model to the entity
+            query_filter (QueryFilter): allowed filter fields
+            filter (Any): parameter to search
+            pagination (PaginationQueryModel): parameter in pagination(page, size, sort, cursor, count)
+
+        Returns:
+            Page: page of entities
+        """
+
+        logger.debug("filter: {}", filter)
+
+        async with AsyncDatabase.get_read_session(self._label) as session:
+            try:
+                result: Page = await AsyncPaginator(
+                    session,
+                    count_session_factory=AsyncDatabase.get_count_session_factory(
+                        self._label
+                    ),
+                ).list(
+                    model=model,
+                    filter_by=query_filter.build(filter),
+                    page=pagination.page,
+                    size=pagination.size,
+                    order_by=pagination.sort.split(",") if pagination.sort else [],
+                    cursor=pagination.cursor,
+                    count_mode=pagination.count,
+                )
+
+                result.items = [convert(item) for item in result.items]
+                return result
+
+            except Exception as ex:
+                logger.exception("AsyncDatabase error")
+                raise ex
+
+    async def _stream_list(
+        self,
+        *,
+        model: Any,
+        convert: Callable[[Any], Any],
+        query_filter: QueryFilter,
+        filter: Any,
+    ) -> AsyncIterator[Any]:
+        """Gets all the filtered rows using a server side cursor.
+        Rows are recovered in batches of EXPORT_BATCH_SIZE and mapped one by
+        one as they arrive (they are never accumulated).
+
+        Args:
+            model (Any): SQLAlchemy model
+            convert (Callable[[Any], Any]): converter from the model to the entity
+            query_filter (QueryFilter): allowed filter fields
+            filter (Any): parameter to search
+
+        Raises:
+            InvalidArgumentException: invalid filter (before streaming starts)
+
+        Returns:
+            AsyncIterator[Any]: entities
+        """
+
+        logger.debug("filter: {}", filter)
+
+        # Validated here, so errors are raised before the response starts
+        conditions: List[Any] = query_filter.build(filter)
+
+        return self.__stream(model, convert, conditions)
+
+    async def __stream(
+        self, model: Any, convert: Callable[[Any], Any], conditions: List[Any]
+    ) -> AsyncIterator[Any]:
+        """Streams the rows that match the conditions
+
+        Args:
+            model (Any): SQLAlchemy model
+            convert (Callable[[Any], Any]): converter from the model to the entity
+            conditions (List[Any]): SQLAlchemy conditions
+
+        Yields:
+            Any: entity
+        """
+        async with AsyncDatabase.get_read_session(self._label) as session:
+            try:
+                result = await session.stream_scalars(
+                    select(model)
+                    .where(*conditions)
+                    .order_by(model.id)
+                    .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+                )
+
+                async for item in result:
+                    yield convert(item)
+
+            except Exception as ex:
+                logger.exception("AsyncDatabase error")
+                raise ex
@@ -0,0 +1,148 @@
+import itertools
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from web_api_template.core.logging import logger
+
+ROUND_ROBIN: str = "round_robin"
+LEAST_CONNECTIONS: str = "least_connections"
+
+# Set by the first write of the request (task): its next reads go to the primary
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+
+def pin_primary() -> None:
+    """The following reads of the current request (task) go to the primary
+    (read your own writes: the replicas may lag behind)
+    """
+    _primary_pinned.set(True)
+
+
+def is_primary_pinned() -> bool:
+    """The current request (task) has written on the primary
+
+    Returns:
+        bool: _description_
+    """
+    return _primary_pinned.get()
+
+
+class ReplicaRouter:
+    """Routes the read sessions across the replicas of a database (round robin
+    or least checked out connections).
+
+    A replica that can not give a connection (pool_pre_ping and reconnection
+    failed, or no connection available in the pool before pool_timeout) is
+    ejected for eject_seconds; the next replica is tried instead.
+    """
+
+    _ejected: Dict[str, float]
+
+    def __init__(
+        self,
+        replicas: Dict[str, sessionmaker],
+        strategy: str = ROUND_ROBIN,
+        eject_seconds: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the router
+
+        Args:
+            replicas (Dict[str, sessionmaker]): session factory by replica label
+            strategy (str, optional): round_robin or least_connections.
+                Defaults to round_robin.
+            eject_seconds (float, optional): time out of the rotation of a
+                failed replica. Defaults to 30.
+            clock (Callable[[], float], optional): _description_.
+                Defaults to time.monotonic.
+        """
+        if strategy not in (ROUND_ROBIN, LEAST_CONNECTIONS):
+            raise ValueError(f"Unknown replica strategy: {strategy}")
+
+        self._replicas = replicas
+        self._labels = list(replicas)
+        self._strategy = strategy
+        self._eject_seconds = eject_seconds
+        self._clock = clock
+        self._ejected = {}
+        self._next = itertools.count()
+
+    @property
+    def labels(self) -> List[str]:
+        return self._labels
+
+    def is_ejected(self, label: str) -> bool:
+        """The replica is out of the rotation
+
+        Args:
+            label (str): replica label
+
+        Returns:
+            bool: _description_
+        """
+        until: Optional[float] = self._ejected.get(label)
+        if until is None:
+            return False
+        if self._clock() >= until:
+            # Back to the rotation: the next connection checks it again
+            del self._ejected[label]
+            return False
+        return True
+
+    def eject(self, label: str) -> None:
+        """Takes the replica out of the rotation for eject_seconds
+
+        Args:
+            label (str): replica label
+        """
+        logger.warning("Replica {} ejected for {}s", label, self._eject_seconds)
+        self._ejected[label] = self._clock() + self._eject_seconds
+
+    def _checked_out(self, label: str) -> int:
+        pool = self._replicas[label].kw["bind"].pool
+        # Pools without checked out connections count (i.e. NullPool)
+        return pool.checkedout() if hasattr(pool, "checkedout") else 0
+
+    def candidates(self) -> List[str]:
+        """Replicas in the rotation, in the order they should be tried
+
+        Returns:
+            List[str]: replica labels
+        """
+        labels: List[str] = [
+            label for label in self._labels if not self.is_ejected(label)
+        ]
+        if not labels:
+            return []
+
+        if self._strategy == LEAST_CONNECTIONS:
+            return sorted(labels, key=self._checked_out)
+
+        start: int = next(self._next) % len(labels)
+        return labels[start:] + labels[:start]
+
+    async def connect(self) -> Optional[AsyncSession]:
+        """Session of a replica, already connected
+
+        Returns:
+            Optional[AsyncSession]: None if no replica is available
+        """
+        for label in self.candidates():
+            session: AsyncSession = self._replicas[label]()
+            try:
+                # Checks out (and pings) the connection
+                await session.connection()
+                logger.debug("Read session on replica: {}", label)
+                return session
+            except (DBAPIError, OSError, PoolTimeoutError):
+                logger.exception("Replica {} connection error", label)
+                await session.close()
+                self.eject(label)
+
+        return None
@@ -0,0 +1,156 @@
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from web_api_template.core.logging import logger
+
+
+class UnitOfWorkSession(AsyncSession):
+    """Session shared by the repositories of a unit of work.
+    commit() only flushes (the statements are sent, the errors raised where
+    they are now): the unit of work commits once, at the end.
+    """
+
+    async def commit(self) -> None:
+        await self.flush()
+
+    async def commit_unit_of_work(self) -> None:
+        await super().commit()
+
+
+class UnitOfWork:
+    """One session (and one transaction) by database label, shared by every
+    repository call of the task that created it (i.e. a request).
+
+    Other tasks (i.e. concurrent queries, cache loads shared with other
+    requests) get their own sessions: a session can not be used concurrently.
+    """
+
+    _sessions: Dict[str, UnitOfWorkSession]
+    _after_commit: List[Callable[[], Awaitable[None]]]
+
+    def __init__(self, session_factory: Callable[[str], UnitOfWorkSession]):
+        """Initialize the unit of work
+
+        Args:
+            session_factory (Callable[[str], UnitOfWorkSession]): creates the
+                session of a database label
+        """
+        self._session_factory = session_factory
+        self._sessions = {}
+        self._after_commit = []
+        self._task = asyncio.current_task()
+
+    @property
+    def is_owner(self) -> bool:
+        """Called from the task that created the unit of work"""
+        return asyncio.current_task() is self._task
+
+    def get_session(self, label: str) -> UnitOfWorkSession:
+        """Gets (or creates) the session of the label
+
+        Args:
+            label (str): database label
+
+        Returns:
+            UnitOfWorkSession: _description_
+        """
+        session: Optional[UnitOfWorkSession] = self._sessions.get(label)
+        if session is None:
+            session = self._session_factory(label)
+            self._sessions[label] = session
+        return session
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Runs the callback after the commit (discarded on rollback)
+
+        Args:
+            callback (Callable[[], Awaitable[None]]): _description_
+        """
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        """Commits every session (one transaction by label: the labels are
+        committed one after the other, not atomically)
+        """
+        for label, session in self._sessions.items():
+            logger.debug("Committing unit of work: {}", label)
+            await session.commit_unit_of_work()
+
+        callbacks: List[Callable[[], Awaitable[None]]] = self._after_commit
+        self._after_commit = []
+        for callback in callbacks:
+            await callback()
+
+    async def rollback(self) -> None:
+        """Rolls back every session"""
+        self._after_commit = []
+        for session in self._sessions.values():
+            await session.rollback()
+
+    async def close(self) -> None:
+        """Closes every session (rolling back what has not been committed)"""
+        self._after_commit = []
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions = {}
+
+
+_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar(
+    "unit_of_work", default=None
+)
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """Unit of work of the current task
+
+    Returns:
+        Optional[UnitOfWork]: None out of a unit of work (or in another task)
+    """
+    unit_of_work: Optional[UnitOfWork] = _unit_of_work.get()
+    if unit_of_work is not None and unit_of_work.is_owner:
+        return unit_of_work
+    return None
+
+
+@asynccontextmanager
+async def unit_of_work(
+    session_factory: Callable[[str], UnitOfWorkSession]
+) -> AsyncIterator[UnitOfWork]:
+    """Starts a unit of work in the current task. The caller commits it;
+    it is rolled back on errors and its sessions are always closed.
+
+    Args:
+        session_factory (Callable[[str], UnitOfWorkSession]): creates the
+            session of a database label
+
+    Yields:
+        UnitOfWork: _description_
+    """
+    work: UnitOfWork = UnitOfWork(session_factory)
+    token = _unit_of_work.set(work)
+    try:
+        yield work
+    except BaseException:
+        await work.rollback()
+        raise
+    finally:
+        _unit_of_work.reset(token)
+        await work.close()
+
+
+async def on_commit(callback: Callable[[], Awaitable[None]]) -> None:
+    """Runs the callback after the commit of the current unit of work, or
+    now when there is none (i.e. invalidate a cache once the change is visible)
+
+    Args:
+        callback (Callable[[], Awaitable[None]]): _description_
+    """
+    unit_of_work: Optional[UnitOfWork] = current_unit_of_work()
+    if unit_of_work is None:
+        await callback()
+    else:
+        unit_of_work.after_commit(callback)
@@ -1,29 +1,117 @@
+import functools
+import time
+from typing import Any, Optional
+
 from aiocache import cached
 
+from web_api_template.core.logging import logger
 from web_api_template.core.settings import settings
+from web_api_template.core.single_flight import SingleFlight
+
+# Runtime switch (initialized from the settings)
+_cache_enabled: bool = settings.CACHE_ENABLED
+
+# Keys of the stale-while-revalidate entries ({"value": ..., "expires_at": ...})
+STALE_VALUE: str = "value"
+STALE_EXPIRES_AT: str = "expires_at"
+
+
+def set_cache_enabled(enabled: bool) -> None:
+    """Enables or disables the cache of the selective_cache functions at runtime
+
+    Args:
+        enabled (bool): cache enabled
+    """
+    global _cache_enabled
+    _cache_enabled = enabled
+
+
+def is_cache_enabled() -> bool:
+    """Cache of the selective_cache functions enabled
+
+    Returns:
+        bool: _description_
+    """
+    return _cache_enabled
+
+
+def _log_refresh_error(refresh: Any) -> None:
+    """Logs the error of a background refresh (the stale value is kept)"""
+    if not refresh.cancelled() and refresh.exception() is not None:
+        logger.opt(exception=refresh.exception()).error("Cache refresh error")
 
 
-def selective_cache(ttl=60, key_builder=None, alias="default"):
-    """Custom cache decorator that allows to selectively enable or disable the cache
+def selective_cache(ttl=60, key_builder=None, alias="default", stale_ttl=0):
+    """Custom cache decorator that allows to selectively enable or disable the cache.
+    Concurrent misses of the same key are coalesced (one call of the function).
+
+    With stale_ttl, an expired value is still returned during stale_ttl seconds
+    while a single background task refreshes it.
 
     Args:
         ttl (int, optional): Default ttl in seconds. Defaults to 60.
         key_builder (_type_, optional): key builder for the cache. Defaults to None.
         alias (str, optional): cache to use. Defaults to "default".
+        stale_ttl (int, optional): stale-while-revalidate window in seconds. Defaults to 0.
     """
 
     def decorator(func):
-        async def wrapper(*args, **kwargs):
-            # Enters every time the function is called
-            if settings.CACHE_ENABLED:
-                # Caching is enabled, so it caches the function
-                return await cached(ttl=ttl, key_builder=key_builder, alias=alias)(
-                    func
-                )(*args, **kwargs)
+        # aiocache decorator, built once (on the first cached call: the
+        # configuration of the alias is loaded on startup)
+        cache: Optional[cached] = None
+        flight: SingleFlight = SingleFlight()
+
+        async def load(key: str, args, kwargs) -> Any:
+            """Calls the function and stores the result"""
+            result: Any = await func(*args, **kwargs)
+            if stale_ttl:
+                await cache.set_in_cache(
+                    key,
+                    {STALE_VALUE: result, STALE_EXPIRES_AT: time.time() + ttl},
+                )
             else:
+                await cache.set_in_cache(key, result)
+            return result
+
+        async def load_once(key: str, args, kwargs) -> Any:
+            """Load of the in flight key (the value could be in the cache already)"""
+            entry: Any = await cache.get_from_cache(key)
+            if entry is None or (stale_ttl and entry[STALE_EXPIRES_AT] < time.time()):
+                return await load(key, args, kwargs)
+
+            return entry[STALE_VALUE] if stale_ttl else entry
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            nonlocal cache
+
+            if not _cache_enabled:
                 # Caching disabled, so it calls the function without caching
                 return await func(*args, **kwargs)
 
+            if cache is None:
+                cache = cached(
+                    ttl=ttl + stale_ttl, key_builder=key_builder, alias=alias
+                )
+                cache(func)
+
+            key: str = cache.get_cache_key(func, args, kwargs)
+            entry: Any = await cache.get_from_cache(key)
+
+            if entry is None:
+                return await flight.do(key, lambda: load_once(key, args, kwargs))
+
+            if not stale_ttl:
+                return entry
+
+            if entry[STALE_EXPIRES_AT] < time.time():
+                # Stale: refreshed by a single background task
+                logger.debug("Revalidating key: {}", key)
+                refresh = flight.start(key, lambda: load_once(key, args, kwargs))
+                refresh.add_done_callback(_log_refresh_error)
+
+            return entry[STALE_VALUE]
+
         return wrapper
 
     return decorator
@@ -21,6 +21,10 @@ class Settings:
     )
 
     LOGGER_NAME: str = config("LOGGER_NAME", cast=str, default="")
+    # Records waiting to be written to stderr (dropped when the queue is full)
+    LOG_QUEUE_SIZE = config("LOG_QUEUE_SIZE", cast=int, default=10000)
+    # Records as events of the current (request) span
+    LOG_SPAN_EVENTS = config("LOG_SPAN_EVENTS", cast=bool, default=True)
 
     # CORS Related configurations
     CORS_ALLOWED_ORIGINS: List[str] = json.loads(
@@ -36,9 +40,45 @@ class Settings:
     # Database basic configuration
     INITIALIZE_DATABASE = config("INITIALIZE_DATABASE", cast=bool, default=True)
     HEALTHCHECK_DATABASE = config("HEALTHCHECK_DATABASE", cast=bool, default=False)
+    # Write requests share one session and one transaction (committed at the end)
+    UNIT_OF_WORK_ENABLED = config("UNIT_OF_WORK_ENABLED", cast=bool, default=True)
+
+    # SQL statements: OpenTelemetry spans and slow query table (by fingerprint)
+    SQL_TRACING_ENABLED = config("SQL_TRACING_ENABLED", cast=bool, default=True)
+    SQL_SLOW_QUERY_TABLE_SIZE = config(
+        "SQL_SLOW_QUERY_TABLE_SIZE", cast=int, default=500
+    )
+    # Every statement as a log line (sqlalchemy.engine INFO): expensive
+    SQL_LOG_STATEMENTS = config("SQL_LOG_STATEMENTS", cast=bool, default=False)
+
+    # Pagination: maximum page size accepted on list endpoints
+    PAGINATION_MAX_SIZE = config("PAGINATION_MAX_SIZE", cast=int, default=100)
+
+    # Export: rows fetched per round trip by the server side cursor
+    EXPORT_BATCH_SIZE = config("EXPORT_BATCH_SIZE", cast=int, default=1000)
+
+    # Batch endpoints (:batch): maximum items accepted by request
+    BATCH_MAX_ITEMS = config("BATCH_MAX_ITEMS", cast=int, default=1000)
+
+    # JSON responses encoder: auto (fastest installed), orjson, msgspec or json
+    # Used by the default response class and by model_response
+    JSON_ENCODER: str = config("JSON_ENCODER", cast=str, default="auto")
 
     # Cache settings
     CACHE_ENABLED = config("CACHE_ENABLED", cast=bool, default=True)
+    # Permissions near cache (in-process LRU in front of the cache alias)
+    PERMISSIONS_CACHE_TTL = config("PERMISSIONS_CACHE_TTL", cast=int, default=600)
+    PERMISSIONS_LOCAL_CACHE_TTL = config(
+        "PERMISSIONS_LOCAL_CACHE_TTL", cast=float, default=5
+    )
+    PERMISSIONS_LOCAL_CACHE_SIZE = config(
+        "PERMISSIONS_LOCAL_CACHE_SIZE", cast=int, default=1024
+    )
+    # get_by_id entity cache by entity (persons, policies, addresses), i.e.
+    # {"persons": {"ttl": 60, "maxsize": 10000, "alias": "default"}}. Disabled if not present
+    ENTITY_CACHE_CONFIG: Dict[str, Dict[str, Any]] = json.loads(
+        config("ENTITY_CACHE_CONFIG", cast=str, default="{}")
+    )
     CACHE_CONFIG: Dict[str, Any] = json.loads(
         config(
             "CACHE_CONFIG",
@@ -81,5 +121,31 @@ class Settings:
         "OTEL_EXPORTER_OTLP_ENDPOINT", cast=str, default="http://otel-collector:4317"
     )
 
+    # Metrics: RED metrics by route, cache and pool metrics in /metrics
+    # (Prometheus exposition)
+    METRICS_ENABLED = config("METRICS_ENABLED", cast=bool, default=True)
+
+    # Traces: no-op (nothing recorded nor exported) if disabled or without
+    # collector endpoint
+    OTEL_TRACES_ENABLED = config("OTEL_TRACES_ENABLED", cast=bool, default=True)
+    # Parent based: the traces started here are sampled with this ratio, the
+    # ones with a remote parent follow its decision
+    OTEL_TRACES_SAMPLER_RATIO = config(
+        "OTEL_TRACES_SAMPLER_RATIO", cast=float, default=1.0
+    )
+    # Traces not sampled but kept anyway: with an error, or with a local root
+    # span (i.e. the request) slower than the threshold (0: disabled)
+    OTEL_TRACES_KEEP_ERRORS = config("OTEL_TRACES_KEEP_ERRORS", cast=bool, default=True)
+    OTEL_TRACES_SLOW_THRESHOLD_MS = config(
+        "OTEL_TRACES_SLOW_THRESHOLD_MS", cast=int, default=1000
+    )
+    # Batch span processor (the OpenTelemetry SDK defaults)
+    OTEL_BSP_MAX_QUEUE_SIZE = config("OTEL_BSP_MAX_QUEUE_SIZE", cast=int, default=2048)
+    OTEL_BSP_MAX_EXPORT_BATCH_SIZE = config(
+        "OTEL_BSP_MAX_EXPORT_BATCH_SIZE", cast=int, default=512
+    )
+    OTEL_BSP_SCHEDULE_DELAY = config("OTEL_BSP_SCHEDULE_DELAY", cast=int, default=5000)
+    OTEL_BSP_EXPORT_TIMEOUT = config("OTEL_BSP_EXPORT_TIMEOUT", cast=int, default=30000)
+
 
 settings = Settings()
@@ -0,0 +1,69 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """Request coalescing: concurrent loads of the same key share a single
+    execution of the loader (i.e. only one database query when a popular
+    cache key expires).
+    """
+
+    _pending: Dict[str, "asyncio.Future[Any]"]
+
+    def __init__(self):
+        self._pending = {}
+
+    def start(
+        self, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> "asyncio.Future[Any]":
+        """Starts the load of the key (if it is not in flight yet)
+
+        Args:
+            key (str): key (i.e. cache key)
+            loader (Callable[[], Awaitable[Any]]): loads the value
+
+        Returns:
+            asyncio.Future[Any]: load in flight
+        """
+        pending: Any = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(loader())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda future: self._done(key, future))
+        return pending
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Waits for the load of the key (started by this or another caller)
+
+        Args:
+            key (str): key (i.e. cache key)
+            loader (Callable[[], Awaitable[Any]]): loads the value
+
+        Returns:
+            Any: value
+        """
+        # A cancelled caller does not cancel the load of the other callers
+        return await asyncio.shield(self.start(key, loader))
+
+    def forget(self, key: str) -> None:
+        """The next call starts a new load (i.e. the value has been invalidated)
+
+        Args:
+            key (str): key
+        """
+        self._pending.pop(key, None)
+
+    def is_current(self, key: str) -> bool:
+        """Called from a loader: the load has not been forgotten
+
+        Args:
+            key (str): key
+
+        Returns:
+            bool: _description_
+        """
+        return self._pending.get(key) is asyncio.current_task()
+
+    def _done(self, key: str, future: "asyncio.Future[Any]") -> None:
+        if self._pending.get(key) is future:
+            del self._pending[key]
@@ -0,0 +1,220 @@
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+from opentelemetry.context import Context
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import Link, SpanContext, SpanKind, TraceFlags, TraceState
+from opentelemetry.trace.status import StatusCode
+from opentelemetry.util.types import Attributes
+
+from .logging import logger
+from .settings import settings
+
+
+class TailSampler(Sampler):
+    """Parent based ratio sampler. With record_unsampled, the spans that are
+    not sampled are still recorded (not exported): TailSpanProcessor exports
+    them if the trace ends with an error or is slow.
+    """
+
+    def __init__(self, ratio: float, record_unsampled: bool = False):
+        """Initialize the sampler
+
+        Args:
+            ratio (float): traces started here that are sampled (0 to 1)
+            record_unsampled (bool, optional): record the spans not sampled.
+                Defaults to False.
+        """
+        self.record_unsampled = record_unsampled
+        self._sampler: Sampler = ParentBased(TraceIdRatioBased(ratio))
+
+    def should_sample(
+        self,
+        parent_context: Optional[Context],
+        trace_id: int,
+        name: str,
+        kind: Optional[SpanKind] = None,
+        attributes: Attributes = None,
+        links: Optional[Sequence[Link]] = None,
+        trace_state: Optional[TraceState] = None,
+    ) -> SamplingResult:
+        result: SamplingResult = self._sampler.should_sample(
+            parent_context, trace_id, name, kind, attributes, links, trace_state
+        )
+        if result.decision == Decision.DROP and self.record_unsampled:
+            return SamplingResult(
+                Decision.RECORD_ONLY, result.attributes, result.trace_state
+            )
+        return result
+
+    def get_description(self) -> str:
+        return f"TailSampler{{{self._sampler.get_description()}}}"
+
+
+class _Trace:
+    __slots__ = ("spans", "keep")
+
+    def __init__(self):
+        self.spans: List[ReadableSpan] = []
+        self.keep: bool = False
+
+
+def _is_local_root(span: ReadableSpan) -> bool:
+    return span.parent is None or span.parent.is_remote
+
+
+def _as_sampled(span: ReadableSpan) -> ReadableSpan:
+    """Copy of a recorded span flagged as sampled (the span processors only
+    export the sampled spans)
+    """
+    context: SpanContext = span.context
+    return ReadableSpan(
+        name=span.name,
+        context=SpanContext(
+            context.trace_id,
+            context.span_id,
+            context.is_remote,
+            TraceFlags(TraceFlags.SAMPLED),
+            context.trace_state,
+        ),
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+class TailSpanProcessor(SpanProcessor):
+    """Sends the sampled spans to the processor. The recorded spans that are
+    not sampled (TailSampler with record_unsampled) are held by trace until
+    its local root span ends (i.e. the request span): sent if the trace has an
+    error or the root span is slow, dropped otherwise.
+    """
+
+    def __init__(
+        self,
+        processor: SpanProcessor,
+        keep_errors: bool = True,
+        slow_threshold_ms: float = 0,
+        max_traces: int = 1000,
+    ):
+        """Initialize the processor
+
+        Args:
+            processor (SpanProcessor): i.e. a BatchSpanProcessor
+            keep_errors (bool, optional): keep the traces with an error span.
+                Defaults to True.
+            slow_threshold_ms (float, optional): keep the traces with a slower
+                local root span (0: disabled). Defaults to 0.
+            max_traces (int, optional): traces held (the oldest one is dropped).
+                Defaults to 1000.
+        """
+        self.processor = processor
+        self.keep_errors = keep_errors
+        self.slow_threshold_ns: int = int(slow_threshold_ms * 1e6)
+        self.max_traces = max_traces
+        self._traces: "OrderedDict[int, _Trace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        self.processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.context.trace_flags.sampled:
+            self.processor.on_end(span)
+            return
+
+        trace_id: int = span.context.trace_id
+        with self._lock:
+            held: Optional[_Trace] = self._traces.get(trace_id)
+            if held is None:
+                if len(self._traces) >= self.max_traces:
+                    self._traces.popitem(last=False)
+                held = _Trace()
+                self._traces[trace_id] = held
+
+            held.spans.append(span)
+            if self.keep_errors and span.status.status_code == StatusCode.ERROR:
+                held.keep = True
+
+            if not _is_local_root(span):
+                return
+            del self._traces[trace_id]
+
+        slow: bool = bool(self.slow_threshold_ns) and (
+            span.end_time - span.start_time >= self.slow_threshold_ns
+        )
+        if held.keep or slow:
+            for held_span in held.spans:
+                self.processor.on_end(_as_sampled(held_span))
+
+    def shutdown(self) -> None:
+        self.processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.processor.force_flush(timeout_millis)
+
+
+def create_tracer_provider(resource: Resource) -> Optional[TracerProvider]:
+    """Tracer provider configured by the settings (sampling, tail rules and
+    batch span processor)
+
+    Args:
+        resource (Resource): _description_
+
+    Returns:
+        Optional[TracerProvider]: None if tracing is disabled (no-op)
+    """
+    if not settings.OTEL_TRACES_ENABLED or not settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        return None
+
+    keep_errors: bool = settings.OTEL_TRACES_KEEP_ERRORS
+    slow_threshold_ms: int = settings.OTEL_TRACES_SLOW_THRESHOLD_MS
+    # Tail rules: only if some traces are not sampled
+    tail: bool = settings.OTEL_TRACES_SAMPLER_RATIO < 1 and (
+        keep_errors or slow_threshold_ms > 0
+    )
+
+    provider: TracerProvider = TracerProvider(
+        resource=resource,
+        sampler=TailSampler(settings.OTEL_TRACES_SAMPLER_RATIO, record_unsampled=tail),
+    )
+
+    processor: SpanProcessor = BatchSpanProcessor(
+        OTLPSpanExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT, insecure=True),
+        max_queue_size=settings.OTEL_BSP_MAX_QUEUE_SIZE,
+        schedule_delay_millis=settings.OTEL_BSP_SCHEDULE_DELAY,
+        max_export_batch_size=settings.OTEL_BSP_MAX_EXPORT_BATCH_SIZE,
+        export_timeout_millis=settings.OTEL_BSP_EXPORT_TIMEOUT,
+    )
+    if tail:
+        processor = TailSpanProcessor(
+            processor,
+            keep_errors=keep_errors,
+            slow_threshold_ms=slow_threshold_ms,
+        )
+    provider.add_span_processor(processor)
+
+    logger.debug(
+        "Tracing: sampler ratio {}, tail rules {}",
+        settings.OTEL_TRACES_SAMPLER_RATIO,
+        tail,
+    )
+    return provider
@@ -0,0 +1,167 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from aiocache import caches
+
+from web_api_template.core.logging import logger
+from web_api_template.core.selective_cache import is_cache_enabled
+from web_api_template.core.single_flight import SingleFlight
+
+
+class CacheTierStats:
+    """Hits and misses of a cache tier"""
+
+    hits: int
+    misses: int
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total: int = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": self.hit_ratio}
+
+
+class TwoTierCache:
+    """Near cache: a bounded in-process LRU (short ttl) in front of an aiocache
+    alias (i.e. Redis). Concurrent misses of the same key are coalesced: only
+    one of them reads the remote tier and calls the loader, the rest wait for
+    its result.
+
+    The local tier of the other processes is not invalidated: keep its ttl
+    short (it is the maximum staleness after an invalidation).
+    """
+
+    _local: "OrderedDict[str, Tuple[float, Any]]"
+    _flight: SingleFlight
+
+    def __init__(
+        self,
+        *,
+        alias: str = "default",
+        ttl: int = 600,
+        local_ttl: float = 5,
+        local_maxsize: int = 1024,
+    ):
+        """Initialize the cache
+
+        Args:
+            alias (str, optional): aiocache alias of the remote tier. Defaults to "default".
+            ttl (int, optional): remote tier ttl in seconds. Defaults to 600.
+            local_ttl (float, optional): local tier ttl in seconds. Defaults to 5.
+            local_maxsize (int, optional): local tier maximum entries. Defaults to 1024.
+        """
+        self.alias = alias
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.local_maxsize = local_maxsize
+
+        self.local_stats = CacheTierStats()
+        self.remote_stats = CacheTierStats()
+
+        self._local = OrderedDict()
+        self._flight = SingleFlight()
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Gets the value from the local tier, the remote tier or the loader
+        (and stores it in both tiers)
+
+        Args:
+            key (str): cache key
+            loader (Callable[[], Awaitable[Any]]): loads the value on a miss
+
+        Returns:
+            Any: value
+        """
+        if not is_cache_enabled():
+            return await loader()
+
+        value: Optional[Any] = self._get_local(key)
+        if value is not None:
+            self.local_stats.hits += 1
+            return value
+
+        self.local_stats.misses += 1
+
+        return await self._flight.do(key, lambda: self._load(key, loader))
+
+    async def invalidate(self, key: str) -> None:
+        """Removes the key from both tiers (i.e. the value has changed)
+
+        Args:
+            key (str): cache key
+        """
+        logger.debug("Invalidating key: {}", key)
+
+        self._local.pop(key, None)
+        # A load in progress must not store the previous value
+        self._flight.forget(key)
+        try:
+            await caches.get(self.alias).delete(key)
+        except Exception:
+            logger.exception("Cache error deleting {}", key)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hits, misses and hit ratio of each tier
+
+        Returns:
+            Dict[str, Dict[str, Any]]: _description_
+        """
+        return {
+            "local": self.local_stats.to_dict(),
+            "remote": self.remote_stats.to_dict(),
+        }
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Gets the value from the remote tier or from the loader"""
+        # The alias configuration is loaded on startup
+        remote: Any = caches.get(self.alias)
+
+        value: Optional[Any] = None
+        try:
+            value = await remote.get(key)
+        except Exception:
+            logger.exception("Cache error getting {}", key)
+
+        if value is not None:
+            self.remote_stats.hits += 1
+        else:
+            self.remote_stats.misses += 1
+            value = await loader()
+            if not self._flight.is_current(key):
+                # Invalidated while loading
+                return value
+
+            try:
+                await remote.set(key, value, ttl=self.ttl)
+            except Exception:
+                logger.exception("Cache error setting {}", key)
+
+        if self._flight.is_current(key):
+            self._set_local(key, value)
+        return value
+
+    def _get_local(self, key: str) -> Optional[Any]:
+        entry: Optional[Tuple[float, Any]] = self._local.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._local[key]
+            return None
+
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: Any) -> None:
+        self._local[key] = (time.monotonic() + self.local_ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_maxsize:
+            self._local.popitem(last=False)
@@ -1,3 +1,4 @@
+from datetime import date
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -8,7 +9,6 @@ from web_api_template.domain.types import PolicyStatusEnum
 class PolicyFilter(BaseModel):
     """
     Represents a data structure for filtering policies.
-    TODO: Filter by person_id
 
     Args:
         BaseModel (BaseModel): Inherited properties.
@@ -22,11 +22,19 @@ class PolicyFilter(BaseModel):
         },
     )
 
+    policy_holder_id: Optional[str] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Policy holder ID (ksuid)",
+            "example": "0ujsswThIGTUYm2K8FjOOfXtY1K",
+        },
+    )
+
     policy_number: Optional[str] = Field(
         default=None,
         max_length=500,
         json_schema_extra={
-            "description": "Policy number",
+            "description": "Policy number (starts with)",
             "example": "1234GFDG1234",
         },
     )
@@ -38,3 +46,28 @@ class PolicyFilter(BaseModel):
             "example": "inactive",
         },
     )
+
+    statuses: Optional[str] = Field(
+        default=None,
+        max_length=500,
+        json_schema_extra={
+            "description": "Comma separated policy statuses (any of them)",
+            "example": "active,inactive",
+        },
+    )
+
+    start_date_from: Optional[date] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Policy start date from (included)",
+            "example": "2024-01-01",
+        },
+    )
+
+    start_date_to: Optional[date] = Field(
+        default=None,
+        json_schema_extra={
+            "description": "Policy start date to (included)",
+            "example": "2024-12-31",
+        },
+    )
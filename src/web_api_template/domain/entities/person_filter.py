@@ -23,7 +23,7 @@ class PersonFilter(BaseModel):
         default=None,
         max_length=500,
         json_schema_extra={
-            "description": "Person name",
+            "description": "Person name (starts with)",
             "example": "John",
         },
     )
@@ -32,7 +32,7 @@ class PersonFilter(BaseModel):
         default=None,
         max_length=500,
         json_schema_extra={
-            "description": "Person surname/s",
+            "description": "Person surname/s (starts with)",
             "example": "Doe",
         },
     )
@@ -1,13 +1,15 @@
 from abc import abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Optional
 
-from web_api_template.core.repository.manager.sqlalchemy.repository_base import (
-    RepositoryBase,
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.repository.manager.sqlalchemy.read_repository_base import (
+    ReadRepositoryBase,
 )
 from web_api_template.domain.value_objects import Address, AddressFilter
 
 
-class AddressReadRepository(RepositoryBase):
+class AddressReadRepository(ReadRepositoryBase):
     """
     Abstract class for database address repository
 
@@ -20,9 +22,11 @@ class AddressReadRepository(RepositoryBase):
         raise NotImplementedError()
 
     @abstractmethod
-    async def get_list(self, *, filter: AddressFilter) -> List[Address]:
+    async def get_paginated_list(
+        self, *, filter: AddressFilter, pagination: PaginationQueryModel
+    ) -> Page:
         raise NotImplementedError()
 
     @abstractmethod
-    async def get_list_by_person_id(self, *, person_id: str) -> List[Address]:
+    async def stream_list(self, *, filter: AddressFilter) -> AsyncIterator[Address]:
         raise NotImplementedError()
@@ -1,10 +1,10 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from web_api_template.core.repository.manager.sqlalchemy.repository_base import (
     RepositoryBase,
 )
-from web_api_template.domain.value_objects import Address, AddressBase
+from web_api_template.domain.value_objects import Address, AddressBase, AddressCreate
 
 
 class AddressWriteRepository(RepositoryBase):
@@ -19,6 +19,12 @@ class AddressWriteRepository(RepositoryBase):
     async def create(self, *, person_id: str, entity: Address) -> Optional[Address]:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def create_many(
+        self, *, person_id: str, entities: List[AddressCreate]
+    ) -> List[Address]:
+        raise NotImplementedError()
+
     @abstractmethod
     async def update(self, *, id: str, address: AddressBase) -> Optional[AddressBase]:
         raise NotImplementedError()
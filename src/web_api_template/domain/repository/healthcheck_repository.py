@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import Any, Dict, List
 
 from web_api_template.core.repository.manager.sqlalchemy.repository_base import (
     RepositoryBase,
@@ -16,3 +17,7 @@ class HealthcheckRepository(RepositoryBase):
     @abstractmethod
     async def verify(self) -> bool:
         raise NotImplementedError()
+
+    @abstractmethod
+    def pool_status(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError()
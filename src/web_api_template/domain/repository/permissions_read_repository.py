@@ -17,3 +17,7 @@ class PermissionsReadRepository(RepositoryBase):
     @abstractmethod
     async def get_permissions_by_username(self, *, username: str) -> List[str]:
         raise NotImplementedError()
+
+    @abstractmethod
+    async def invalidate_permissions(self, *, username: str) -> None:
+        raise NotImplementedError()
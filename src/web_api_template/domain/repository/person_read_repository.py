@@ -1,16 +1,16 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from web_api_template.core.api.pagination_query_model import PaginationQueryModel
 from web_api_template.core.repository.manager.sqlalchemy.page import Page
-from web_api_template.core.repository.manager.sqlalchemy.repository_base import (
-    RepositoryBase,
+from web_api_template.core.repository.manager.sqlalchemy.read_repository_base import (
+    ReadRepositoryBase,
 )
 from web_api_template.domain.entities.person import Person
 from web_api_template.domain.entities.person_filter import PersonFilter
 
 
-class PersonReadRepository(RepositoryBase):
+class PersonReadRepository(ReadRepositoryBase):
     """
     Abstract class for database person repository
 
@@ -28,6 +28,10 @@ class PersonReadRepository(RepositoryBase):
     ) -> Page:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def stream_list(self, *, filter: PersonFilter) -> AsyncIterator[Person]:
+        raise NotImplementedError()
+
     # @abstractmethod
     # async def get_list(self, *, filter: PersonsFilter, query: CommonQueryModel) -> dict:
     #     raise NotImplementedError()
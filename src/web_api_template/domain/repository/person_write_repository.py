@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from web_api_template.core.repository.manager.sqlalchemy.repository_base import (
     RepositoryBase,
@@ -20,6 +20,12 @@ class PersonWriteRepository(RepositoryBase):
     async def create(self, *, entity: PersonCreate) -> Optional[Person]:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def create_many(
+        self, *, entities: List[PersonCreate]
+    ) -> List[Person | Exception]:
+        raise NotImplementedError()
+
     @abstractmethod
     async def update(self, *, id: str, person: Person) -> Optional[Person]:
         raise NotImplementedError()
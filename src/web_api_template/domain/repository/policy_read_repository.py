@@ -1,13 +1,15 @@
 from abc import abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Optional
 
-from web_api_template.core.repository.manager.sqlalchemy.repository_base import (
-    RepositoryBase,
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.repository.manager.sqlalchemy.read_repository_base import (
+    ReadRepositoryBase,
 )
 from web_api_template.domain.aggregates import Policy, PolicyFilter
 
 
-class PolicyReadRepository(RepositoryBase):
+class PolicyReadRepository(ReadRepositoryBase):
     """
     Abstract class for database policy repository
 
@@ -20,9 +22,11 @@ class PolicyReadRepository(RepositoryBase):
         raise NotImplementedError()
 
     @abstractmethod
-    async def get_list(self, *, filter: PolicyFilter) -> List[Policy]:
+    async def get_paginated_list(
+        self, *, filter: PolicyFilter, pagination: PaginationQueryModel
+    ) -> Page:
         raise NotImplementedError()
 
     @abstractmethod
-    async def get_list_by_person_id(self, *, person_id: str) -> List[Policy]:
+    async def stream_list(self, *, filter: PolicyFilter) -> AsyncIterator[Policy]:
         raise NotImplementedError()
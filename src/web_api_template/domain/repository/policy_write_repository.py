@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from web_api_template.core.repository.manager.sqlalchemy.repository_base import (
     RepositoryBase,
@@ -21,6 +21,12 @@ class PolicyWriteRepository(RepositoryBase):
     ) -> Optional[PolicyCreate]:
         raise NotImplementedError()
 
+    @abstractmethod
+    async def create_many(
+        self, *, person_id: str, entities: List[PolicyCreate]
+    ) -> List[PolicyCreate]:
+        raise NotImplementedError()
+
     @abstractmethod
     async def update(self, *, id: str, policy: Policy) -> Optional[Policy]:
         raise NotImplementedError()
@@ -7,7 +7,7 @@ from web_api_template.core.domain.validators import ksuid_validator
 
 class AddressFilter(BaseModel):
     """
-    Represents a data structure for an address.
+    Represents a data structure for filtering addresses.
     """
 
     id: Optional[str] = Field(
@@ -18,38 +18,31 @@ class AddressFilter(BaseModel):
         },
     )
 
-    street: Optional[str] = Field(
-        ...,
-        max_length=250,
+    person_id: Optional[str] = Field(
+        default=None,
         json_schema_extra={
-            "description": "Street name",
-            "example": "1234 Sesame Street",
+            "description": "Person ID (ksuid)",
+            "example": "0ujsswThIGTUYm2K8FjOOfXtY1K",
         },
     )
 
     city: Optional[str] = Field(
-        ...,
+        default=None,
         max_length=150,
-        json_schema_extra={"description": "City name", "example": "Anytown"},
+        json_schema_extra={
+            "description": "City name (starts with)",
+            "example": "Anytown",
+        },
     )
 
     postal_code: Optional[str] = Field(
-        ...,
+        default=None,
         max_length=150,
         json_schema_extra={"description": "Postal code", "example": "12345"},
     )
 
-    province: Optional[str] = Field(
-        ...,
-        max_length=150,
-        json_schema_extra={
-            "description": "Province/State/Department",
-            "example": "Anyprovince",
-        },
-    )
-
     country: Optional[str] = Field(
-        ...,
+        default=None,
         max_length=150,
         json_schema_extra={"description": "Country name", "example": "USA"},
     )
@@ -1,9 +1,13 @@
 from fastapi import HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 
-from web_api_template.core.api import ProblemDetail, ValidationErrorDetail
+from web_api_template.core.api import (
+    FastJSONResponse,
+    ProblemDetail,
+    ValidationErrorDetail,
+)
 from web_api_template.core.logging import logger
+from web_api_template.core.repository.exceptions import InvalidArgumentException
 
 
 async def http_exception_handler(request: Request, exc: HTTPException):
@@ -18,8 +22,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     """
 
     logger.error(
-        f"HTTPException: {exc.status_code} - {exc.detail} - {exc.headers} - {
-            exc.detail}"
+        "HTTPException: {} - {} - {}", exc.status_code, exc.detail, exc.headers
     )
 
     problem_detail = ProblemDetail(
@@ -28,9 +31,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         detail=exc.detail,
         instance=str(request.url),
     )
-    return JSONResponse(
-        status_code=exc.status_code, content=problem_detail.model_dump()
-    )
+    return FastJSONResponse(status_code=exc.status_code, content=problem_detail)
 
 
 async def general_exception_handler(request: Request, exc: Exception):
@@ -44,7 +45,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         _type_: _description_
     """
 
-    logger.exception(f"Exception: {exc}")
+    logger.exception("Exception: {}", exc)
 
     problem_detail = ProblemDetail(
         title="Internal Server Error",
@@ -52,8 +53,31 @@ async def general_exception_handler(request: Request, exc: Exception):
         detail="An unexpected error occurred.",
         instance=str(request.url),
     )
-    return JSONResponse(status_code=500, content=problem_detail.model_dump())
+    return FastJSONResponse(status_code=500, content=problem_detail)
+
+
+async def invalid_argument_exception_handler(
+    request: Request, exc: InvalidArgumentException
+):
+    """Invalid argument exception handler (i.e. malformed pagination cursor)
 
+    Args:
+        request (Request): _description_
+        exc (InvalidArgumentException): _description_
+
+    Returns:
+        _type_: _description_
+    """
+
+    logger.debug("InvalidArgumentException: {}", exc)
+
+    problem_detail = ProblemDetail(
+        title="Invalid argument",
+        status=400,
+        detail=str(exc),
+        instance=str(request.url),
+    )
+    return FastJSONResponse(status_code=400, content=problem_detail)
 
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -67,7 +91,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         _type_: _description_
     """
 
-    logger.exception(f"Exception: {exc}")
+    logger.exception("Exception: {}", exc)
 
     errors = [
         ValidationErrorDetail(
@@ -75,8 +99,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             loc=error["loc"],
             msg=error["msg"],
             input=error["input"],
-            ctx={k: str(v) for k, v in error.get("ctx", {}).items()} if error.get("ctx") else None,
-            url=error.get("url")
+            ctx={k: str(v) for k, v in error.get("ctx", {}).items()}
+            if error.get("ctx")
+            else None,
+            url=error.get("url"),
         )
         for error in exc.errors()
     ]
@@ -89,7 +115,4 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         errors=errors,
     )
 
-    return JSONResponse(status_code=422, content=problem_detail.model_dump())
-
-
-
+    return FastJSONResponse(status_code=422, content=problem_detail)
@@ -1,6 +1,5 @@
-
 from ksuid import Ksuid
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from web_api_template.core.repository.model.sqlalchemy import Base, BaseModel
@@ -15,6 +14,13 @@ class AddressModel(Base, BaseModel):
     """
 
     __tablename__ = "addresses"
+    # Prefix filters (LIKE 'value%') need pattern ops indexes on PostgreSQL
+    # when the collation is not C
+    __table_args__ = (
+        Index(
+            "ix_addresses_city", "city", postgresql_ops={"city": "varchar_pattern_ops"}
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(27),
@@ -27,12 +33,12 @@ class AddressModel(Base, BaseModel):
 
     street: Mapped[str] = mapped_column(String(500), nullable=False)
     city: Mapped[str] = mapped_column(String(500), nullable=False)
-    postal_code: Mapped[str] = mapped_column(String(500), nullable=False)
+    postal_code: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     province: Mapped[str] = mapped_column(String(500), nullable=False)
-    country: Mapped[str] = mapped_column(String(500), nullable=False)
+    country: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
 
     person_id: Mapped[str] = mapped_column(
-        String(27), ForeignKey("persons.id"), nullable=False
+        String(27), ForeignKey("persons.id"), nullable=False, index=True
     )
 
     # person = relationship("PersonModel", back_populates="addresses")
@@ -4,7 +4,7 @@ from __future__ import annotations
 from typing import List
 
 from ksuid import Ksuid
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from web_api_template.core.repository.model.sqlalchemy import Base, BaseModel, Versioned
@@ -19,6 +19,18 @@ class PersonModel(BaseModel, Base, Versioned):
     """
 
     __tablename__ = "persons"
+    # Prefix filters (LIKE 'value%') need pattern ops indexes on PostgreSQL
+    # when the collation is not C
+    __table_args__ = (
+        Index(
+            "ix_persons_name", "name", postgresql_ops={"name": "varchar_pattern_ops"}
+        ),
+        Index(
+            "ix_persons_surname",
+            "surname",
+            postgresql_ops={"surname": "varchar_pattern_ops"},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(27),
@@ -29,7 +41,7 @@ class PersonModel(BaseModel, Base, Versioned):
 
     name: Mapped[str] = mapped_column(String(500), nullable=False)
     surname: Mapped[str] = mapped_column(String(500), nullable=False)
-    email: Mapped[str] = mapped_column(String(500), nullable=False)
+    email: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
     identification_number: Mapped[str] = mapped_column(
         String(500), nullable=False, unique=True
     )
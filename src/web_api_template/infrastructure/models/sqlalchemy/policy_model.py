@@ -1,7 +1,7 @@
 from datetime import date
 
 from ksuid import Ksuid
-from sqlalchemy import Column, Date, Enum, Float, ForeignKey, String
+from sqlalchemy import Column, Date, Enum, Float, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql.sqltypes import Enum as SQLAEnum
 
@@ -20,6 +20,15 @@ class PolicyModel(Base, BaseModel):
     """
 
     __tablename__ = "policies"
+    # Prefix filters (LIKE 'value%') need pattern ops indexes on PostgreSQL
+    # when the collation is not C
+    __table_args__ = (
+        Index(
+            "ix_policies_policy_number",
+            "policy_number",
+            postgresql_ops={"policy_number": "varchar_pattern_ops"},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(27),
@@ -29,7 +38,7 @@ class PolicyModel(Base, BaseModel):
     )
 
     holder_id: Mapped[str] = mapped_column(
-        String(27), ForeignKey("persons.id"), nullable=False
+        String(27), ForeignKey("persons.id"), nullable=False, index=True
     )
 
     # Uncomment if you are using related objects
@@ -39,14 +48,17 @@ class PolicyModel(Base, BaseModel):
 
     policy_number: Mapped[str] = mapped_column(String(500), nullable=False)
     status: Mapped[Column[SQLAEnum]] = mapped_column(
-        Enum(PolicyStatusEnum), nullable=False, default=PolicyStatusEnum.INACTIVE
+        Enum(PolicyStatusEnum),
+        nullable=False,
+        default=PolicyStatusEnum.INACTIVE,
+        index=True,
     )
 
     policy_type: Mapped[Column[SQLAEnum]] = mapped_column(
         Enum(PolicyTypeEnum), nullable=False
     )
 
-    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
     end_date: Mapped[date] = mapped_column(Date, nullable=False)
 
     premium: Mapped[float] = mapped_column(Float, nullable=False)
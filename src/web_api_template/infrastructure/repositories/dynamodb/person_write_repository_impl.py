@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from automapper import mapper
 
@@ -38,6 +38,35 @@ class PersonWriteRepositoryImpl(PersonWriteRepository):
             logger.exception("Saving error")
             raise ex
 
+    async def create_many(
+        self,
+        *,
+        # current_user: User,
+        entities: List[PersonCreate],
+    ) -> List[Person | Exception]:
+        """
+        Create persons on DB (batch write)
+
+        Args:
+            entities (List[PersonCreate]): persons to create
+        Returns:
+            List[Person | Exception]: persons created
+        """
+
+        entity_models: List[PersonModel] = [
+            PersonModel(**entity.model_dump(exclude_none=True, exclude_defaults=True))
+            for entity in entities
+        ]
+
+        try:
+            with PersonModel.batch_write() as batch:
+                for entity_model in entity_models:
+                    batch.save(entity_model)
+            return [mapper.map(entity_model, Person) for entity_model in entity_models]
+        except Exception as ex:
+            logger.exception("Saving error")
+            raise ex
+
     async def __get_by_id(self, id: str) -> PersonModel | None:
         """Get person model by ID
 
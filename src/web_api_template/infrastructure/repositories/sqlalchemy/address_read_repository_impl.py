@@ -1,93 +1,87 @@
-from typing import List, Optional
+from typing import AsyncIterator, Optional
 
-from automapper import mapper
 from sqlalchemy import select
 
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.exceptions import ItemNotFoundException
 from web_api_template.core.repository.manager.sqlalchemy.async_database import (
     AsyncDatabase,
 )
+from web_api_template.core.repository.manager.sqlalchemy.filter_operator_enum import (
+    FilterOperatorEnum,
+)
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.repository.manager.sqlalchemy.query_filter import (
+    FilterField,
+    QueryFilter,
+)
 from web_api_template.domain.repository import AddressReadRepository
 from web_api_template.domain.value_objects import Address, AddressFilter
 from web_api_template.infrastructure.models.sqlalchemy import AddressModel
+from web_api_template.infrastructure.repositories.sqlalchemy.converters import (
+    converters,
+)
+from web_api_template.infrastructure.repositories.sqlalchemy.entity_caches import (
+    address_cache,
+)
+
+# Allowed AddressFilter fields (indexed columns)
+ADDRESS_FILTER: QueryFilter = QueryFilter(
+    {
+        "id": FilterField(AddressModel.id),
+        "person_id": FilterField(AddressModel.person_id),
+        "city": FilterField(AddressModel.city, FilterOperatorEnum.PREFIX),
+        "postal_code": FilterField(AddressModel.postal_code),
+        "country": FilterField(AddressModel.country),
+    }
+)
 
 
 class AddressReadRepositoryImpl(AddressReadRepository):
     """Repository implementation for Address"""
 
-    async def get_list(
+    async def get_paginated_list(
         self,
         *,
         filter: AddressFilter,
-        # query: CommonQueryModel,
-        # current_user: User,
-    ) -> List[Address]:
-        """Gets filtered policies
+        pagination: PaginationQueryModel,
+    ) -> Page:
+        """Gets a page of filtered addresses
 
         Args:
-            request (Request): request (from fastAPI)
-            current_user (AuthUser, optional): Current user who makes the request
-            filter: parameter to search (owner_id)
-            query: parameter in pagination(page, size, sort)
+            filter: parameter to search
+            pagination: parameter in pagination(page, size, sort, cursor, count)
 
         Returns:
-            dict
+            Page
         """
+        return await self._get_paginated_list(
+            model=AddressModel,
+            convert=converters.get(AddressModel, Address),
+            query_filter=ADDRESS_FILTER,
+            filter=filter,
+            pagination=pagination,
+        )
 
-        logger.debug("filter: {}", filter)
-        # logger.debug("query: %s", query)
-
-        async with AsyncDatabase.get_session(self._label) as session:
-            try:
-                # TODO: Apply filters
-
-                result = await session.execute(select(AddressModel))
-                # It is done this way while I am creating the unit tests
-                scalars = result.scalars()
-                items = scalars.all()
-                return [mapper.map(item, Address) for item in items]
-
-            except Exception as ex:
-                logger.exception("AsyncDatabase error")
-                raise ex
-
-    async def get_list_by_person_id(
-        self,
-        *,
-        person_id: str,
-        # query: CommonQueryModel,
-        # current_user: User,
-    ) -> List[Address]:
-        """Gets filtered policies
+    async def stream_list(self, *, filter: AddressFilter) -> AsyncIterator[Address]:
+        """Gets all the filtered addresses using a server side cursor
 
         Args:
-            request (Request): request (from fastAPI)
-            current_user (AuthUser, optional): Current user who makes the request
-            id: person id
-            query: parameter in pagination(page, size, sort)
+            filter: parameter to search
+
+        Raises:
+            InvalidArgumentException: invalid filter (before streaming starts)
 
         Returns:
-            dict
+            AsyncIterator[Address]
         """
-
-        logger.debug("Person id: {}", person_id)
-        # logger.debug("query: %s", query)
-
-        async with AsyncDatabase.get_session(self._label) as session:
-            try:
-
-                result = await session.execute(
-                    select(AddressModel).where(AddressModel.person_id == person_id)
-                )
-                # It is done this way while I am creating the unit tests
-                scalars = result.scalars()
-                items = scalars.all()
-                return [mapper.map(item, Address) for item in items]
-
-            except Exception as ex:
-                logger.exception("AsyncDatabase error")
-                raise ex
+        return await self._stream_list(
+            model=AddressModel,
+            convert=converters.get(AddressModel, Address),
+            query_filter=ADDRESS_FILTER,
+            filter=filter,
+        )
 
     async def __get_by_id(self, id: str) -> AddressModel | None:
         """Get address model by ID
@@ -98,7 +92,13 @@ class AddressReadRepositoryImpl(AddressReadRepository):
         Returns:
             AddressModel: _description_
         """
-        async with AsyncDatabase.get_session(self._label) as session:
+        # Cached for every request: never a lagging replica
+        read_session = (
+            AsyncDatabase.get_primary_read_session
+            if address_cache.enabled
+            else AsyncDatabase.get_read_session
+        )
+        async with read_session(self._label) as session:
             try:
                 result = await session.execute(
                     select(AddressModel).where(AddressModel.id == id)
@@ -109,6 +109,17 @@ class AddressReadRepositoryImpl(AddressReadRepository):
                 logger.exception("AsyncDatabase error")
                 raise ex
 
+    async def __get_entity_by_id(self, id: str) -> Optional[Address]:
+        """Get address entity by ID (None if not found)
+
+        Args:
+            id (str): _description_
+
+        Returns:
+            Address: _description_
+        """
+        return converters.convert(await self.__get_by_id(id), Address)
+
     async def get_by_id(self, id: str) -> Address:
         """Gets address by id
 
@@ -120,13 +131,15 @@ class AddressReadRepositoryImpl(AddressReadRepository):
         """
 
         try:
-            entity_model: Optional[AddressModel] = await self.__get_by_id(id)
+            entity: Optional[Address] = await address_cache.get(
+                id, lambda: self.__get_entity_by_id(id)
+            )
 
-            if not entity_model:
+            if not entity:
                 logger.debug("Item with id: {} not found", id)
                 raise ItemNotFoundException(f"Item with id: {id} not found")
 
-            return mapper.map(entity_model, Address)
+            return entity
 
         except Exception as ex:
             logger.exception("AsyncDatabase error")
@@ -1,22 +1,48 @@
-from typing import Optional
+from functools import partial
+from typing import List, Optional
 
 from automapper import mapper
 from sqlalchemy import delete, select, update
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.exceptions import ItemNotFoundException
 from web_api_template.core.repository.manager.sqlalchemy.async_database import (
     AsyncDatabase,
 )
+from web_api_template.core.repository.manager.sqlalchemy.unit_of_work import on_commit
 from web_api_template.domain.repository import AddressWriteRepository
-from web_api_template.domain.value_objects import Address, AddressBase
-from web_api_template.infrastructure.models.sqlalchemy import AddressModel
+from web_api_template.domain.value_objects import Address, AddressBase, AddressCreate
+from web_api_template.infrastructure.models.sqlalchemy import AddressModel, PersonModel
+from web_api_template.infrastructure.repositories.sqlalchemy.converters import (
+    converters,
+)
+from web_api_template.infrastructure.repositories.sqlalchemy.entity_caches import (
+    address_cache,
+)
 
 
 class AddressWriteRepositoryImpl(AddressWriteRepository):
     """Repository implementation for Address"""
 
+    async def __check_person(self, session: AsyncSession, person_id: str) -> None:
+        """Checks that the person exists before inserting rows that reference
+        it: the integrity errors of the insert are not taken as a missing person
+
+        Args:
+            session (AsyncSession): _description_
+            person_id (str): _description_
+
+        Raises:
+            ItemNotFoundException: the person does not exist
+        """
+        exists = await session.scalar(
+            select(PersonModel.id).where(PersonModel.id == person_id)
+        )
+        if exists is None:
+            logger.debug("Person with id: {} not found", person_id)
+            raise ItemNotFoundException(f"Item with id: {person_id} not found")
+
     async def create(
         self,
         *,
@@ -41,52 +67,75 @@ class AddressWriteRepositoryImpl(AddressWriteRepository):
         # entity_model.owner_id = str(current_user.id)
 
         async with AsyncDatabase.get_session(self._label) as session:
+            await self.__check_person(session, person_id)
             try:
                 session.add(entity_model)
                 await session.commit()
+                await on_commit(partial(address_cache.invalidate, entity_model.id))
 
                 # await session.refresh(entity_model)
 
-            except IntegrityError as fke:
-                await session.rollback()
-                logger.exception(
-                    "Foreign key violation exception, Person does not exists."
-                )
-                raise ItemNotFoundException(f"Item with id: {person_id} not found")
-
             except Exception as ex:
                 await session.rollback()
                 logger.exception("AsyncDatabase error")
                 raise ex
 
-            return mapper.map(entity_model, Address)
+            return converters.convert(entity_model, Address)
 
-    async def __get_by_id(self, id: str) -> AddressModel | None:
-        """Get address model by ID
+    async def create_many(
+        self,
+        *,
+        # current_user: User,
+        person_id: str,
+        entities: List[AddressCreate],
+    ) -> List[Address]:
+        """
+        Create addresses of a person on DB in one transaction (one
+        multi-row INSERT)
 
         Args:
-            id (str): _description_
+            person_id (str): person_id to associate the addresses with
+            entities (List[AddressCreate]): addresses to create
+
+        Raises:
+            ItemNotFoundException: the person does not exist
 
         Returns:
-            AddressModel: _description_
+            List[Address]: addresses created (in the given order)
         """
+
+        entity_models: List[AddressModel] = []
+        for entity in entities:
+            entity_model: AddressModel = converters.convert(entity, AddressModel)
+            entity_model.person_id = person_id
+            entity_models.append(entity_model)
+
+        # New ids: nothing to invalidate in the entity cache
         async with AsyncDatabase.get_session(self._label) as session:
+            await self.__check_person(session, person_id)
             try:
-                result = await session.execute(
-                    select(AddressModel).where(AddressModel.id == id)
-                )
-                return result.scalar_one_or_none()
+                session.add_all(entity_models)
+                await session.commit()
 
             except Exception as ex:
+                await session.rollback()
                 logger.exception("AsyncDatabase error")
                 raise ex
 
+        return [
+            converters.convert(entity_model, Address) for entity_model in entity_models
+        ]
+
     async def delete(self, id: str) -> None:
-        """Delete address model by ID
+        """Delete address model by ID (single statement, the row count tells
+        if it existed)
 
         Args:
             id (str): _description_
 
+        Raises:
+            ItemNotFoundException: _description_
+
         Returns:
             None
 
@@ -94,27 +143,31 @@ class AddressWriteRepositoryImpl(AddressWriteRepository):
         async with AsyncDatabase.get_session(self._label) as session:
             try:
                 delete_query = delete(AddressModel).where(AddressModel.id == id)
-                await session.execute(delete_query)
+                result = await session.execute(delete_query)
+
+                if result.rowcount == 0:
+                    logger.debug("Item with id: {} not found", id)
+                    raise ItemNotFoundException(f"Item with id: {id} not found")
+
                 await session.commit()
+                await on_commit(partial(address_cache.invalidate, id))
                 return
 
-            except IntegrityError as fke:
-                await session.rollback()
-                logger.exception(
-                    "Foreign key violation exception, Address does not exists."
-                )
-                raise ItemNotFoundException(f"Item with id: {id} not found")
-
             except Exception as ex:
+                await session.rollback()
                 logger.exception("AsyncDatabase error")
                 raise ex
 
-    async def __update(self, id: str, model: AddressModel) -> Optional[AddressModel]:
-        """update address model with the given ID
+    async def __update(self, id: str, model: AddressModel) -> AddressModel:
+        """update address model with the given ID in a single statement
+        (UPDATE ... RETURNING where the database supports it)
 
         Args:
             id (str): _description_
 
+        Raises:
+            ItemNotFoundException: _description_
+
         Returns:
             AddressModel
 
@@ -126,7 +179,7 @@ class AddressWriteRepositoryImpl(AddressWriteRepository):
 
         async with AsyncDatabase.get_session(self._label) as session:
             try:
-                # Vuild the update query
+                # Build the update query
                 update_query = (
                     update(AddressModel)
                     .where(AddressModel.id == id)
@@ -139,10 +192,26 @@ class AddressWriteRepositoryImpl(AddressWriteRepository):
                     )
                 )
 
-                await session.execute(update_query)
+                updated: Optional[AddressModel] = None
+                if session.bind.dialect.update_returning:
+                    result = await session.execute(update_query.returning(AddressModel))
+                    updated = result.scalar_one_or_none()
+                else:
+                    # i.e. MySQL: read the row in the same session
+                    result = await session.execute(update_query)
+                    if result.rowcount > 0:
+                        updated = await session.scalar(
+                            select(AddressModel).where(AddressModel.id == id)
+                        )
+
+                if updated is None:
+                    # TODO : check if address is in delete status
+                    logger.debug("Item with id: {} not found", id)
+                    raise ItemNotFoundException(f"Item with id: {id} not found")
+
                 await session.commit()
 
-                return await self.__get_by_id(id)
+                return updated
 
             except Exception as ex:
                 await session.rollback()
@@ -166,19 +235,13 @@ class AddressWriteRepositoryImpl(AddressWriteRepository):
         """
 
         try:
-            entity_model: Optional[AddressModel] = await self.__get_by_id(id)
-
-            if not entity_model:
-                # TODO : check if address is in delete status
-                logger.debug("Item with id: {} not found", id)
-                raise ItemNotFoundException(f"Item with id: {id} not found")
-
             new_model: AddressModel = mapper.map(address, AddressModel)
 
-            # Update the given (and existing) id
-            result: Optional[AddressModel] = await self.__update(id=id, model=new_model)
+            # Update the given id (if it exists)
+            result: AddressModel = await self.__update(id=id, model=new_model)
+            await on_commit(partial(address_cache.invalidate, id))
 
-            return mapper.map(result, AddressBase)
+            return converters.convert(result, AddressBase)
 
         except Exception as ex:
             logger.exception("AsyncDatabase error")
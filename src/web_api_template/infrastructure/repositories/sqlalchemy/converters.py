@@ -0,0 +1,41 @@
+"""Model <-> entity converters used by the SQLAlchemy repositories.
+They are built once, when this module is imported.
+"""
+
+from web_api_template.core.repository.converters import ConverterRegistry
+from web_api_template.domain.aggregates import Policy, PolicyCreate
+from web_api_template.domain.entities.person import Person
+from web_api_template.domain.entities.person_create import PersonCreate
+from web_api_template.domain.value_objects import Address, AddressBase, AddressCreate
+from web_api_template.infrastructure.models.sqlalchemy import (
+    AddressModel,
+    PersonModel,
+    PolicyModel,
+)
+
+converters: ConverterRegistry = ConverterRegistry()
+
+# Rows come from our own database (validated when they were written):
+# entities are built without validation
+converters.register(PersonModel, Person, validate=False)
+converters.register(PersonModel, PersonCreate, validate=False)
+
+converters.register(
+    PolicyModel, Policy, renames={"holder_id": "policy_holder_id"}, validate=False
+)
+converters.register(
+    PolicyModel,
+    PolicyCreate,
+    renames={"holder_id": "policy_holder_id"},
+    validate=False,
+)
+
+converters.register(AddressModel, Address, validate=False)
+converters.register(AddressModel, AddressBase, validate=False)
+
+# Entity -> model (batch inserts)
+converters.register(PersonCreate, PersonModel)
+converters.register(
+    PolicyCreate, PolicyModel, renames={"policy_holder_id": "holder_id"}
+)
+converters.register(AddressCreate, AddressModel)
@@ -0,0 +1,20 @@
+from web_api_template.core.entity_cache import EntityCache
+from web_api_template.core.settings import settings
+
+
+def create_entity_cache(name: str) -> EntityCache:
+    """Creates the entity cache with its configuration (ENTITY_CACHE_CONFIG)
+
+    Args:
+        name (str): entity name
+
+    Returns:
+        EntityCache: _description_
+    """
+    return EntityCache(name, **settings.ENTITY_CACHE_CONFIG.get(name, {}))
+
+
+# Shared by the read (get_by_id) and the write (invalidation) repositories
+person_cache: EntityCache = create_entity_cache("persons")
+policy_cache: EntityCache = create_entity_cache("policies")
+address_cache: EntityCache = create_entity_cache("addresses")
@@ -1,3 +1,5 @@
+from typing import Any, Dict, List
+
 from sqlalchemy import text
 
 from web_api_template.core.logging import logger
@@ -30,3 +32,11 @@ class HealthcheckRepositoryImpl(HealthcheckRepository):
         except Exception as ex:
             logger.exception("AsyncDatabase connection error")
             return False
+
+    def pool_status(self) -> List[Dict[str, Any]]:
+        """Connection pool statistics of every database
+
+        Returns:
+            List[Dict[str, Any]]: _description_
+        """
+        return AsyncDatabase.pool_status()
@@ -13,7 +13,8 @@ from web_api_template.core.repository.manager.sqlalchemy.async_paginator import
     AsyncPaginator,
 )
 from web_api_template.core.repository.manager.sqlalchemy.page import Page
-from web_api_template.core.selective_cache import selective_cache
+from web_api_template.core.settings import settings
+from web_api_template.core.two_tier_cache import TwoTierCache
 from web_api_template.domain.repository.permissions_read_repository import (
     PermissionsReadRepository,
 )
@@ -21,21 +22,54 @@ from web_api_template.infrastructure.models.sqlalchemy.permissions_model import
     PermissionsModel,
 )
 
+# Permissions are read on every protected request
+permissions_cache: TwoTierCache = TwoTierCache(
+    alias="default",
+    ttl=settings.PERMISSIONS_CACHE_TTL,
+    local_ttl=settings.PERMISSIONS_LOCAL_CACHE_TTL,
+    local_maxsize=settings.PERMISSIONS_LOCAL_CACHE_SIZE,
+)
+
+
+def permissions_cache_key(username: str) -> str:
+    return f"get_permissions_by_username_{username}_permissions"
+
 
 class PermissionsReadRepositoryImpl(PermissionsReadRepository):
     """Repository implementation for Permissions"""
 
-    @selective_cache(
-        ttl=600,
-        alias="default",
-        key_builder=lambda f, *args, **kwargs: f"{f.__name__}_{kwargs['username']}_permissions",
-    )
     async def get_permissions_by_username(
         self,
         *,
         username: str,
         # query: CommonQueryModel,
         # current_user: User,
+    ) -> List[str]:
+        """Gets the permissions of the user (local cache, cache or database)
+
+        Args:
+            username: username of the person
+
+        Returns:
+            List[str]: permissions
+        """
+        return await permissions_cache.get_or_load(
+            permissions_cache_key(username),
+            lambda: self.__get_permissions_by_username(username=username),
+        )
+
+    async def invalidate_permissions(self, *, username: str) -> None:
+        """Removes the cached permissions of the user
+
+        Args:
+            username (str): username of the person
+        """
+        await permissions_cache.invalidate(permissions_cache_key(username))
+
+    async def __get_permissions_by_username(
+        self,
+        *,
+        username: str,
     ) -> List[str]:
         """Gets filtered policies
 
@@ -52,9 +86,9 @@ class PermissionsReadRepositoryImpl(PermissionsReadRepository):
         logger.debug("User name: {}", username)
         # logger.debug("query: %s", query)
 
-        async with AsyncDatabase.get_session(self._label) as session:
+        # Cached for every request: never a lagging replica
+        async with AsyncDatabase.get_primary_read_session(self._label) as session:
             try:
-
                 result = await session.execute(
                     select(PermissionsModel).where(
                         PermissionsModel.username == username
@@ -1,6 +1,5 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 
-from automapper import mapper
 from sqlalchemy import select
 
 from web_api_template.core.api.pagination_query_model import PaginationQueryModel
@@ -9,14 +8,34 @@ from web_api_template.core.repository.exceptions import ItemNotFoundException
 from web_api_template.core.repository.manager.sqlalchemy.async_database import (
     AsyncDatabase,
 )
-from web_api_template.core.repository.manager.sqlalchemy.async_paginator import (
-    AsyncPaginator,
+from web_api_template.core.repository.manager.sqlalchemy.filter_operator_enum import (
+    FilterOperatorEnum,
 )
 from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.repository.manager.sqlalchemy.query_filter import (
+    FilterField,
+    QueryFilter,
+)
 from web_api_template.domain.entities.person import Person
 from web_api_template.domain.entities.person_filter import PersonFilter
 from web_api_template.domain.repository import PersonReadRepository
 from web_api_template.infrastructure.models.sqlalchemy import PersonModel
+from web_api_template.infrastructure.repositories.sqlalchemy.converters import (
+    converters,
+)
+from web_api_template.infrastructure.repositories.sqlalchemy.entity_caches import (
+    person_cache,
+)
+
+# Allowed PersonFilter fields (indexed columns)
+PERSON_FILTER: QueryFilter = QueryFilter(
+    {
+        "id": FilterField(PersonModel.id),
+        "name": FilterField(PersonModel.name, FilterOperatorEnum.PREFIX),
+        "surname": FilterField(PersonModel.surname, FilterOperatorEnum.PREFIX),
+        "email": FilterField(PersonModel.email),
+    }
+)
 
 
 class PersonReadRepositoryImpl(PersonReadRepository):
@@ -27,40 +46,42 @@ class PersonReadRepositoryImpl(PersonReadRepository):
         *,
         filter: PersonFilter,
         pagination: PaginationQueryModel,
-        # current_user: User,
     ) -> Page:
-        """Gets filtered persons
+        """Gets a page of filtered persons
 
         Args:
-            request (Request): request (from fastAPI)
-            current_user (AuthUser, optional): Current user who makes the request
-            filter: parameter to search (owner_id)
-            query: parameter in pagination(page, size, sort)
+            filter: parameter to search
+            pagination: parameter in pagination(page, size, sort, cursor, count)
 
         Returns:
-            dict
+            Page
         """
+        return await self._get_paginated_list(
+            model=PersonModel,
+            convert=converters.get(PersonModel, Person),
+            query_filter=PERSON_FILTER,
+            filter=filter,
+            pagination=pagination,
+        )
 
-        logger.debug("filter: {}", filter)
-        # logger.debug("query: %s", query)
+    async def stream_list(self, *, filter: PersonFilter) -> AsyncIterator[Person]:
+        """Gets all the filtered persons using a server side cursor
 
-        # async with AsyncDatabase.get_session(self._label) as session:
-        async with AsyncDatabase.get_session(self._label) as session:
-            try:
-
-                result: Page = await AsyncPaginator(session).list(
-                    model=PersonModel,
-                    page=pagination.page,
-                    size=pagination.size,
-                    order_by=pagination.sort.split(",") if pagination.sort else [],
-                )
+        Args:
+            filter: parameter to search
 
-                result.items = [mapper.map(item, Person) for item in result.items]
-                return result
+        Raises:
+            InvalidArgumentException: invalid filter (before streaming starts)
 
-            except Exception as ex:
-                logger.exception("AsyncDatabase error")
-                raise ex
+        Returns:
+            AsyncIterator[Person]
+        """
+        return await self._stream_list(
+            model=PersonModel,
+            convert=converters.get(PersonModel, Person),
+            query_filter=PERSON_FILTER,
+            filter=filter,
+        )
 
     async def __get_by_id(self, id: str) -> PersonModel | None:
         """Get person model by ID
@@ -72,7 +93,13 @@ class PersonReadRepositoryImpl(PersonReadRepository):
             PersonModel: _description_
         """
 
-        async with AsyncDatabase.get_session(self._label) as session:
+        # Cached for every request: never a lagging replica
+        read_session = (
+            AsyncDatabase.get_primary_read_session
+            if person_cache.enabled
+            else AsyncDatabase.get_read_session
+        )
+        async with read_session(self._label) as session:
             try:
                 # result = await session.execute(
                 #     select(PersonModel)
@@ -93,6 +120,17 @@ class PersonReadRepositoryImpl(PersonReadRepository):
                 logger.exception("AsyncDatabase error")
                 raise ex
 
+    async def __get_entity_by_id(self, id: str) -> Optional[Person]:
+        """Get person entity by ID (None if not found)
+
+        Args:
+            id (str): _description_
+
+        Returns:
+            Person: _description_
+        """
+        return converters.convert(await self.__get_by_id(id), Person)
+
     async def get_by_id(self, id: str) -> Person:
         """Gets person by id
 
@@ -103,13 +141,15 @@ class PersonReadRepositoryImpl(PersonReadRepository):
             Person
         """
 
-        entity_model: Optional[PersonModel] = await self.__get_by_id(id)
+        entity: Optional[Person] = await person_cache.get(
+            id, lambda: self.__get_entity_by_id(id)
+        )
 
-        if not entity_model:
+        if not entity:
             logger.debug("Item with id: {} not found", id)
             raise ItemNotFoundException(f"Item with id: {id} not found")
 
-        return mapper.map(entity_model, Person)
+        return entity
 
     # async def count_Persons(self) -> int:
     #     with DbConnectionManager() as manager:
@@ -1,5 +1,6 @@
 from datetime import datetime
-from typing import Optional
+from functools import partial
+from typing import List, Optional, Set
 
 from automapper import mapper
 from sqlalchemy import delete, select, update
@@ -11,6 +12,7 @@ from web_api_template.core.repository.exceptions import ItemNotFoundException
 from web_api_template.core.repository.manager.sqlalchemy.async_database import (
     AsyncDatabase,
 )
+from web_api_template.core.repository.manager.sqlalchemy.unit_of_work import on_commit
 from web_api_template.domain.entities.person import Person
 from web_api_template.domain.entities.person_create import PersonCreate
 from web_api_template.domain.exceptions import (
@@ -19,6 +21,12 @@ from web_api_template.domain.exceptions import (
 )
 from web_api_template.domain.repository import PersonWriteRepository
 from web_api_template.infrastructure.models.sqlalchemy import PersonModel
+from web_api_template.infrastructure.repositories.sqlalchemy.converters import (
+    converters,
+)
+from web_api_template.infrastructure.repositories.sqlalchemy.entity_caches import (
+    person_cache,
+)
 
 
 class PersonWriteRepositoryImpl(PersonWriteRepository):
@@ -48,7 +56,8 @@ class PersonWriteRepositoryImpl(PersonWriteRepository):
             try:
                 session.add(entity_model)
                 await session.commit()
-            except IntegrityError as ie:
+                await on_commit(partial(person_cache.invalidate, entity_model.id))
+            except IntegrityError:
                 await session.rollback()
                 logger.exception("Integrity exception, person already exists.")
                 raise PersonAlreadyExistsException(entity.identification_number)
@@ -57,34 +66,157 @@ class PersonWriteRepositoryImpl(PersonWriteRepository):
                 logger.exception("Commit error")
                 raise ex
 
-            return mapper.map(entity_model, PersonCreate)
+            return converters.convert(entity_model, PersonCreate)
 
-    async def __get_by_id(self, id: str) -> PersonModel | None:
-        """Get person model by ID
+    async def create_many(
+        self,
+        *,
+        # current_user: User,
+        entities: List[PersonCreate],
+    ) -> List[Person | Exception]:
+        """
+        Create persons on DB in one transaction (one multi-row INSERT).
+        The persons that already exist (or are repeated in the batch) are
+        not inserted.
 
         Args:
-            id (str): _description_
+            entities (List[PersonCreate]): persons to create
+        Returns:
+            List[Person | Exception]: person created or
+                PersonAlreadyExistsException, by index
+        """
+
+        try:
+            results: List[Person | Exception] = await self.__insert_many(entities)
+        except IntegrityError:
+            # Inserted concurrently (nothing was inserted): one by one
+            logger.debug("Integrity exception, inserting the batch row by row")
+            results = await self.__insert_each(entities)
+
+        return results
+
+    async def __insert_many(
+        self, entities: List[PersonCreate]
+    ) -> List[Person | Exception]:
+        """Inserts the persons that do not exist (one SELECT and one INSERT)
+
+        Args:
+            entities (List[PersonCreate]): _description_
+
+        Raises:
+            IntegrityError: a person has been inserted concurrently
 
         Returns:
-            PersonModel: _description_
+            List[Person | Exception]: _description_
         """
+        results: List[PersonModel | Exception] = []
+
         async with AsyncDatabase.get_session(self._label) as session:
             try:
-                result = await session.execute(
-                    select(PersonModel).where(PersonModel.id == id)
+                existing: Set[str] = set(
+                    await session.scalars(
+                        select(PersonModel.identification_number).where(
+                            PersonModel.identification_number.in_(
+                                {entity.identification_number for entity in entities}
+                            )
+                        )
+                    )
+                )
+
+                for entity in entities:
+                    if entity.identification_number in existing:
+                        results.append(
+                            PersonAlreadyExistsException(entity.identification_number)
+                        )
+                    else:
+                        existing.add(entity.identification_number)
+                        results.append(converters.convert(entity, PersonModel))
+
+                # New ids: nothing to invalidate in the entity cache
+                session.add_all(
+                    [result for result in results if not isinstance(result, Exception)]
                 )
-                return result.scalar_one_or_none()
+                await session.commit()
 
+            except IntegrityError as ie:
+                await session.rollback()
+                raise ie
             except Exception as ex:
-                logger.exception("AsyncDatabase error")
+                await session.rollback()
+                logger.exception("Commit error")
+                raise ex
+
+        return [
+            result
+            if isinstance(result, Exception)
+            else converters.convert(result, Person)
+            for result in results
+        ]
+
+    async def __insert_each(
+        self, entities: List[PersonCreate]
+    ) -> List[Person | Exception]:
+        """Inserts the persons one by one, each one in a savepoint: the ones
+        that conflict (i.e. inserted concurrently) are not inserted. Slower
+        than __insert_many, only used after a conflict of the batch.
+
+        Args:
+            entities (List[PersonCreate]): _description_
+
+        Returns:
+            List[Person | Exception]: _description_
+        """
+        results: List[PersonModel | Exception] = []
+
+        async with AsyncDatabase.get_session(self._label) as session:
+            try:
+                inserted: Set[str] = set()
+                for entity in entities:
+                    if entity.identification_number not in inserted:
+                        try:
+                            async with session.begin_nested():
+                                model: PersonModel = converters.convert(
+                                    entity, PersonModel
+                                )
+                                session.add(model)
+                        except IntegrityError:
+                            logger.debug(
+                                "Person already exists: {}",
+                                entity.identification_number,
+                            )
+                        else:
+                            inserted.add(entity.identification_number)
+                            results.append(model)
+                            continue
+
+                    results.append(
+                        PersonAlreadyExistsException(entity.identification_number)
+                    )
+
+                await session.commit()
+
+            except Exception as ex:
+                await session.rollback()
+                logger.exception("Commit error")
                 raise ex
 
+        return [
+            result
+            if isinstance(result, Exception)
+            else converters.convert(result, Person)
+            for result in results
+        ]
+
     async def __delete(self, id: str) -> None:
-        """Delete person model by ID
+        """Delete person model by ID (single statement, the row count tells
+        if it existed)
 
         Args:
             id (str): _description_
 
+        Raises:
+            ItemNotFoundException: _description_
+
         Returns:
             None
 
@@ -92,7 +224,13 @@ class PersonWriteRepositoryImpl(PersonWriteRepository):
         async with AsyncDatabase.get_session(self._label) as session:
             try:
                 delete_query = delete(PersonModel).where(PersonModel.id == id)
-                await session.execute(delete_query)
+                result = await session.execute(delete_query)
+
+                if result.rowcount == 0:
+                    # TODO : check if person is in delete status
+                    logger.debug("Item with id: {} not found", id)
+                    raise ItemNotFoundException(f"Item with id: {id} not found")
+
                 await session.commit()
                 return
 
@@ -113,47 +251,38 @@ class PersonWriteRepositoryImpl(PersonWriteRepository):
         """
 
         try:
-            entity_model: Optional[PersonModel] = await self.__get_by_id(id)
-
-            if not entity_model:
-                # TODO : check if person is in delete status
-                logger.debug("Item with id: {} not found", id)
-                raise ItemNotFoundException(f"Item with id: {id} not found")
-
-            # Delete the given (and existing) id
+            # Delete the given id (if it exists)
             await self.__delete(id)
+            await on_commit(partial(person_cache.invalidate, id))
 
         except Exception as ex:
             logger.exception("AsyncDatabase error")
             raise ex
 
-    async def __update(self, id: str, model: PersonModel) -> Optional[PersonModel]:
-        """update person model with the given ID
+    async def __update(self, id: str, model: PersonModel) -> PersonModel:
+        """update person model with the given ID and version in a single
+        statement (UPDATE ... RETURNING where the database supports it)
 
         Args:
             id (str): _description_
 
+        Raises:
+            ItemNotFoundException: _description_
+            PersonAlreadyModifiedException: _description_
+            PersonAlreadyExistsException: _description_
+
         Returns:
             PersonModel
 
         """
 
         # TODO: concurrency fields
-        # model.updated_at = datetime.utcnow()
         # model.updated_by = "fake"
 
+        updated_at: datetime = datetime.now()
+
         async with AsyncDatabase.get_session(self._label) as session:
             try:
-
-                # TODO: change to an exists
-                current_person = await session.execute(
-                    select(PersonModel).where(PersonModel.id == id)
-                )
-                current_person = current_person.scalar_one_or_none()
-
-                if not current_person:
-                    raise ItemNotFoundException(f"Item with id: {id} not found")
-
                 update_query = (
                     update(PersonModel)
                     .where(PersonModel.id == id)
@@ -164,33 +293,47 @@ class PersonWriteRepositoryImpl(PersonWriteRepository):
                         email=model.email,
                         identification_number=model.identification_number,
                         version=model.version + 1,  # Increment version
-                        updated_at=datetime.now(),
+                        updated_at=updated_at,
                     )
                 )
 
-                result = await session.execute(update_query)
+                updated: Optional[PersonModel] = None
+                if session.bind.dialect.update_returning:
+                    result = await session.execute(update_query.returning(PersonModel))
+                    updated = result.scalar_one_or_none()
+                else:
+                    # i.e. MySQL: the updated row is the given model
+                    result = await session.execute(update_query)
+                    if result.rowcount > 0:
+                        model.id = id
+                        model.version = model.version + 1
+                        model.updated_at = updated_at
+                        updated = model
+
+                if updated is None:
+                    # Only on failure: not found or modified by another transaction
+                    exists = await session.scalar(
+                        select(PersonModel.id).where(PersonModel.id == id)
+                    )
+                    if exists is None:
+                        raise ItemNotFoundException(f"Item with id: {id} not found")
 
-                if result.rowcount == 0:
                     raise StaleDataError(
                         "Another transaction has modified this record."
                     )
 
                 await session.commit()
 
-                # return await self.__get_by_id(id)
-                model.id = id
-                model.version = model.version + 1
+                return updated
 
-                return model
-
-            except IntegrityError as ie:
+            except IntegrityError:
                 await session.rollback()
                 logger.exception(
                     "Integrity exception, identification number already exists."
                 )
                 raise PersonAlreadyExistsException(model.identification_number)
 
-            except StaleDataError as sde:
+            except StaleDataError:
                 await session.rollback()
                 logger.exception(
                     "Concurrency exception, record was modified by another transaction."
@@ -219,19 +362,13 @@ class PersonWriteRepositoryImpl(PersonWriteRepository):
         """
 
         try:
-            entity_model: Optional[PersonModel] = await self.__get_by_id(id)
-
-            if not entity_model:
-                # TODO : check if person is in delete status
-                logger.debug("Item with id: {} not found", id)
-                raise ItemNotFoundException(f"Item with id: {id} not found")
-
             new_model: PersonModel = mapper.map(person, PersonModel)
 
-            # Update the given (and existing) id
-            result: Optional[PersonModel] = await self.__update(id=id, model=new_model)
+            # Update the given id (if it exists and has not been modified)
+            result: PersonModel = await self.__update(id=id, model=new_model)
+            await on_commit(partial(person_cache.invalidate, id))
 
-            return mapper.map(result, Person)
+            return converters.convert(result, Person)
 
         except Exception as ex:
             logger.exception("AsyncDatabase error")
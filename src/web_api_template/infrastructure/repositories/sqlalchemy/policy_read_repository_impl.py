@@ -1,118 +1,91 @@
-from typing import List, Optional
+from typing import AsyncIterator, Optional
 
-from automapper import mapper
 from sqlalchemy import select
 
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.exceptions import ItemNotFoundException
 from web_api_template.core.repository.manager.sqlalchemy.async_database import (
     AsyncDatabase,
 )
+from web_api_template.core.repository.manager.sqlalchemy.filter_operator_enum import (
+    FilterOperatorEnum,
+)
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.repository.manager.sqlalchemy.query_filter import (
+    FilterField,
+    QueryFilter,
+)
 from web_api_template.domain.aggregates import Policy, PolicyFilter
 from web_api_template.domain.repository import PolicyReadRepository
 from web_api_template.infrastructure.models.sqlalchemy import PolicyModel
+from web_api_template.infrastructure.repositories.sqlalchemy.converters import (
+    converters,
+)
+from web_api_template.infrastructure.repositories.sqlalchemy.entity_caches import (
+    policy_cache,
+)
+
+# Allowed PolicyFilter fields (indexed columns)
+POLICY_FILTER: QueryFilter = QueryFilter(
+    {
+        "id": FilterField(PolicyModel.id),
+        "policy_holder_id": FilterField(PolicyModel.holder_id),
+        "policy_number": FilterField(
+            PolicyModel.policy_number, FilterOperatorEnum.PREFIX
+        ),
+        "status": FilterField(PolicyModel.status),
+        "statuses": FilterField(PolicyModel.status, FilterOperatorEnum.IN),
+        "start_date_from": FilterField(PolicyModel.start_date, FilterOperatorEnum.GTE),
+        "start_date_to": FilterField(PolicyModel.start_date, FilterOperatorEnum.LTE),
+    }
+)
 
 
 class PolicyReadRepositoryImpl(PolicyReadRepository):
     """Repository implementation for Policy"""
 
-    async def get_list(
+    async def get_paginated_list(
         self,
         *,
         filter: PolicyFilter,
-        # query: CommonQueryModel,
-        # current_user: User,
-    ) -> List[Policy]:
-        """Gets filtered policies
+        pagination: PaginationQueryModel,
+    ) -> Page:
+        """Gets a page of filtered policies
 
         Args:
-            request (Request): request (from fastAPI)
-            current_user (AuthUser, optional): Current user who makes the request
-            filter: parameter to search (owner_id)
-            query: parameter in pagination(page, size, sort)
+            filter: parameter to search
+            pagination: parameter in pagination(page, size, sort, cursor, count)
 
         Returns:
-            dict
+            Page
         """
+        return await self._get_paginated_list(
+            model=PolicyModel,
+            convert=converters.get(PolicyModel, Policy),
+            query_filter=POLICY_FILTER,
+            filter=filter,
+            pagination=pagination,
+        )
 
-        logger.debug("filter: {}", filter)
-        # logger.debug("query: %s", query)
-
-        async with AsyncDatabase.get_session(self._label) as session:
-            try:
-                # TODO: Apply filters
-
-                result = await session.execute(select(PolicyModel))
-
-                # result = await session.execute(
-                #     select(PolicyModel).options(
-                #         selectinload(PolicyModel.holder).selectinload(
-                #             PersonModel.addresses
-                #         ),
-                #     )
-                # )
-
-                # It is done this way while I am creating the unit tests
-                scalars = result.scalars()
-                items = scalars.all()
-                mapper.add_custom_mapping(PolicyModel, "holder", "policy_holder")
-                mapper.add_custom_mapping(PolicyModel, "holder_id", "policy_holder_id")
-                return [mapper.map(item, Policy) for item in items]
-
-            except Exception as ex:
-                logger.exception("AsyncDatabase error")
-                raise ex
-
-    async def get_list_by_person_id(
-        self,
-        *,
-        person_id: str,
-        # query: CommonQueryModel,
-        # current_user: User,
-    ) -> List[Policy]:
-        """Gets filtered policies
+    async def stream_list(self, *, filter: PolicyFilter) -> AsyncIterator[Policy]:
+        """Gets all the filtered policies using a server side cursor
 
         Args:
-            request (Request): request (from fastAPI)
-            current_user (AuthUser, optional): Current user who makes the request
-            id: person id
-            query: parameter in pagination(page, size, sort)
+            filter: parameter to search
+
+        Raises:
+            InvalidArgumentException: invalid filter (before streaming starts)
 
         Returns:
-            dict
+            AsyncIterator[Policy]
         """
-
-        logger.debug("Person id: {}", person_id)
-        # logger.debug("query: %s", query)
-
-        async with AsyncDatabase.get_session(self._label) as session:
-            try:
-
-                # result = await session.execute(
-                #     select(PolicyModel)
-                #     .where(PolicyModel.holder_id == person_id)
-                #     .options(
-                #         selectinload(PolicyModel.holder).selectinload(
-                #             PersonModel.addresses
-                #         ),
-                #     )
-                # )
-
-                result = await session.execute(
-                    select(PolicyModel).where(PolicyModel.holder_id == person_id)
-                )
-
-                # It is done this way while I am creating the unit tests
-                scalars = result.scalars()
-                items = scalars.all()
-
-                mapper.add_custom_mapping(PolicyModel, "holder", "policy_holder")
-                mapper.add_custom_mapping(PolicyModel, "holder_id", "policy_holder_id")
-                return [mapper.map(item, Policy) for item in items]
-
-            except Exception as ex:
-                logger.exception("AsyncDatabase error")
-                raise ex
+        return await self._stream_list(
+            model=PolicyModel,
+            convert=converters.get(PolicyModel, Policy),
+            query_filter=POLICY_FILTER,
+            filter=filter,
+        )
 
     async def __get_by_id(self, id: str) -> PolicyModel | None:
         """Get policy model by ID
@@ -123,9 +96,14 @@ class PolicyReadRepositoryImpl(PolicyReadRepository):
         Returns:
             PolicyModel: _description_
         """
-        async with AsyncDatabase.get_session(self._label) as session:
+        # Cached for every request: never a lagging replica
+        read_session = (
+            AsyncDatabase.get_primary_read_session
+            if policy_cache.enabled
+            else AsyncDatabase.get_read_session
+        )
+        async with read_session(self._label) as session:
             try:
-
                 # result = await session.execute(
                 #     select(PolicyModel)
                 #     .where(PolicyModel.id == id)
@@ -146,6 +124,17 @@ class PolicyReadRepositoryImpl(PolicyReadRepository):
                 logger.exception("AsyncDatabase error")
                 raise ex
 
+    async def __get_entity_by_id(self, id: str) -> Optional[Policy]:
+        """Get policy entity by ID (None if not found)
+
+        Args:
+            id (str): _description_
+
+        Returns:
+            Policy: _description_
+        """
+        return converters.convert(await self.__get_by_id(id), Policy)
+
     async def get_by_id(self, id: str) -> Policy:
         """Gets policy by id
 
@@ -157,15 +146,15 @@ class PolicyReadRepositoryImpl(PolicyReadRepository):
         """
 
         try:
-            entity_model: Optional[PolicyModel] = await self.__get_by_id(id)
+            entity: Optional[Policy] = await policy_cache.get(
+                id, lambda: self.__get_entity_by_id(id)
+            )
 
-            if not entity_model:
+            if not entity:
                 logger.debug("Item with id: {} not found", id)
                 raise ItemNotFoundException(f"Item with id: {id} not found")
 
-            mapper.add_custom_mapping(PolicyModel, "holder", "policy_holder")
-            mapper.add_custom_mapping(PolicyModel, "holder_id", "policy_holder_id")
-            return mapper.map(entity_model, Policy)
+            return entity
 
         except Exception as ex:
             logger.exception("AsyncDatabase error")
@@ -1,21 +1,51 @@
-from typing import Optional
+from functools import partial
+from typing import Any, Dict, List, Optional
 
 from automapper import mapper
 from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from web_api_template.core.logging import logger
 from web_api_template.core.repository.exceptions import ItemNotFoundException
 from web_api_template.core.repository.manager.sqlalchemy.async_database import (
     AsyncDatabase,
 )
+from web_api_template.core.repository.manager.sqlalchemy.unit_of_work import on_commit
 from web_api_template.domain.aggregates import Policy, PolicyCreate
 from web_api_template.domain.repository import PolicyWriteRepository
-from web_api_template.infrastructure.models.sqlalchemy import PolicyModel
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel, PolicyModel
+from web_api_template.infrastructure.repositories.sqlalchemy.converters import (
+    converters,
+)
+from web_api_template.infrastructure.repositories.sqlalchemy.entity_caches import (
+    policy_cache,
+)
+
+# Entity -> model mapping (registered once)
+mapper.add_custom_mapping(PolicyCreate, "policy_holder_id", "holder_id")
 
 
 class PolicyWriteRepositoryImpl(PolicyWriteRepository):
     """Repository implementation for Policy"""
 
+    async def __check_person(self, session: AsyncSession, person_id: str) -> None:
+        """Checks that the person exists before inserting rows that reference
+        it: the integrity errors of the insert are not taken as a missing person
+
+        Args:
+            session (AsyncSession): _description_
+            person_id (str): _description_
+
+        Raises:
+            ItemNotFoundException: the person does not exist
+        """
+        exists = await session.scalar(
+            select(PersonModel.id).where(PersonModel.id == person_id)
+        )
+        if exists is None:
+            logger.debug("Person with id: {} not found", person_id)
+            raise ItemNotFoundException(f"Item with id: {person_id} not found")
+
     async def create(
         self,
         *,
@@ -32,7 +62,6 @@ class PolicyWriteRepositoryImpl(PolicyWriteRepository):
             policy (policy): policy created
         """
 
-        mapper.add_custom_mapping(PolicyCreate, "policy_holder_id", "holder_id")
         entity_model: PolicyModel = mapper.map(entity, PolicyModel)
         entity_model.holder_id = person_id
 
@@ -43,6 +72,7 @@ class PolicyWriteRepositoryImpl(PolicyWriteRepository):
             try:
                 session.add(entity_model)
                 await session.commit()
+                await on_commit(partial(policy_cache.invalidate, entity_model.id))
             # except IntegrityError as ie:
             #     await session.rollback()
             #     logger.exception("Integrity exception, policy already exists.")
@@ -52,35 +82,63 @@ class PolicyWriteRepositoryImpl(PolicyWriteRepository):
                 logger.exception("Commit error")
                 raise ex
 
-            mapper.add_custom_mapping(PolicyModel, "holder_id", "policy_holder_id")
-            return mapper.map(entity_model, PolicyCreate)
+            return converters.convert(entity_model, PolicyCreate)
 
-    async def __get_by_id(self, id: str) -> PolicyModel | None:
-        """Get policy model by ID
+    async def create_many(
+        self,
+        *,
+        # current_user: User,
+        person_id: str,
+        entities: List[PolicyCreate],
+    ) -> List[PolicyCreate]:
+        """
+        Create policies of a person on DB in one transaction (one
+        multi-row INSERT)
 
         Args:
-            id (str): _description_
+            person_id (str): person_id to associate the policies with
+            entities (List[PolicyCreate]): policies to create
+
+        Raises:
+            ItemNotFoundException: the person does not exist
 
         Returns:
-            PolicyModel: _description_
+            List[PolicyCreate]: policies created (in the given order)
         """
+
+        entity_models: List[PolicyModel] = []
+        for entity in entities:
+            entity_model: PolicyModel = converters.convert(entity, PolicyModel)
+            entity_model.holder_id = person_id
+            entity_models.append(entity_model)
+
+        # New ids: nothing to invalidate in the entity cache
         async with AsyncDatabase.get_session(self._label) as session:
+            await self.__check_person(session, person_id)
             try:
-                result = await session.execute(
-                    select(PolicyModel).where(PolicyModel.id == id)
-                )
-                return result.scalar_one_or_none()
+                session.add_all(entity_models)
+                await session.commit()
 
             except Exception as ex:
+                await session.rollback()
                 logger.exception("AsyncDatabase error")
                 raise ex
 
+        return [
+            converters.convert(entity_model, PolicyCreate)
+            for entity_model in entity_models
+        ]
+
     async def __delete(self, id: str) -> None:
-        """Delete policy model by ID
+        """Delete policy model by ID (single statement, the row count tells
+        if it existed)
 
         Args:
             id (str): _description_
 
+        Raises:
+            ItemNotFoundException: _description_
+
         Returns:
             None
 
@@ -88,11 +146,18 @@ class PolicyWriteRepositoryImpl(PolicyWriteRepository):
         async with AsyncDatabase.get_session(self._label) as session:
             try:
                 delete_query = delete(PolicyModel).where(PolicyModel.id == id)
-                await session.execute(delete_query)
+                result = await session.execute(delete_query)
+
+                if result.rowcount == 0:
+                    # TODO : check if policy is in delete status
+                    logger.debug("Item with id: {} not found", id)
+                    raise ItemNotFoundException(f"Item with id: {id} not found")
+
                 await session.commit()
                 return
 
             except Exception as ex:
+                await session.rollback()
                 logger.exception("AsyncDatabase error")
                 raise ex
 
@@ -108,26 +173,24 @@ class PolicyWriteRepositoryImpl(PolicyWriteRepository):
         """
 
         try:
-            entity_model: Optional[PolicyModel] = await self.__get_by_id(id)
-
-            if not entity_model:
-                # TODO : check if policy is in delete status
-                logger.debug("Item with id: {} not found", id)
-                raise ItemNotFoundException(f"Item with id: {id} not found")
-
-            # Delete the given (and existing) id
+            # Delete the given id (if it exists)
             await self.__delete(id)
+            await on_commit(partial(policy_cache.invalidate, id))
 
         except Exception as ex:
             logger.exception("AsyncDatabase error")
             raise ex
 
-    async def __update(self, id: str, model: PolicyModel) -> Optional[PolicyModel]:
-        """update policy model with the given ID
+    async def __update(self, id: str, model: PolicyModel) -> PolicyModel:
+        """update policy model with the given ID in a single statement
+        (UPDATE ... RETURNING where the database supports it)
 
         Args:
             id (str): _description_
 
+        Raises:
+            ItemNotFoundException: _description_
+
         Returns:
             PolicyModel
 
@@ -137,23 +200,40 @@ class PolicyWriteRepositoryImpl(PolicyWriteRepository):
         # model.updated_at = datetime.utcnow()
         # model.updated_by = "fake"
 
+        values: Dict[str, Any] = {
+            "policy_number": model.policy_number,
+            "status": model.status,
+        }
+        if model.holder_id is not None:
+            values["holder_id"] = model.holder_id
+
         async with AsyncDatabase.get_session(self._label) as session:
             try:
-                # Vuild the update query
+                # Build the update query
                 update_query = (
-                    update(PolicyModel)
-                    .where(PolicyModel.id == id)
-                    .values(
-                        policy_number=model.policy_number,
-                        person_id=model.person_id,
-                        status=model.status,
-                    )
+                    update(PolicyModel).where(PolicyModel.id == id).values(**values)
                 )
 
-                await session.execute(update_query)
+                updated: Optional[PolicyModel] = None
+                if session.bind.dialect.update_returning:
+                    result = await session.execute(update_query.returning(PolicyModel))
+                    updated = result.scalar_one_or_none()
+                else:
+                    # i.e. MySQL: read the row in the same session
+                    result = await session.execute(update_query)
+                    if result.rowcount > 0:
+                        updated = await session.scalar(
+                            select(PolicyModel).where(PolicyModel.id == id)
+                        )
+
+                if updated is None:
+                    # TODO : check if policy is in delete status
+                    logger.debug("Item with id: {} not found", id)
+                    raise ItemNotFoundException(f"Item with id: {id} not found")
+
                 await session.commit()
 
-                return await self.__get_by_id(id)
+                return updated
 
             except Exception as ex:
                 await session.rollback()
@@ -177,19 +257,13 @@ class PolicyWriteRepositoryImpl(PolicyWriteRepository):
         """
 
         try:
-            entity_model: Optional[PolicyModel] = await self.__get_by_id(id)
-
-            if not entity_model:
-                # TODO : check if policy is in delete status
-                logger.debug("Item with id: {} not found", id)
-                raise ItemNotFoundException(f"Item with id: {id} not found")
-
             new_model: PolicyModel = mapper.map(policy, PolicyModel)
 
-            # Update the given (and existing) id
-            result: Optional[PolicyModel] = await self.__update(id=id, model=new_model)
+            # Update the given id (if it exists)
+            result: PolicyModel = await self.__update(id=id, model=new_model)
+            await on_commit(partial(policy_cache.invalidate, id))
 
-            return mapper.map(result, Policy)
+            return converters.convert(result, Policy)
 
         except Exception as ex:
             logger.exception("AsyncDatabase error")
@@ -17,6 +17,9 @@ from web_api_template.infrastructure.models.dynamodb import (
     PersonModel,
     PolicyModel,
 )
+from web_api_template.infrastructure.repositories.sqlalchemy.permissions_read_repository_impl import (
+    permissions_cache,
+)
 
 
 async def initialize_dynamodb():
@@ -87,7 +90,6 @@ async def lifespan(app: FastAPI):
     # --------------------------------------------------------------
 
     if settings.INITIALIZE_DATABASE:
-
         # Initialize SQLALCHEMY database
         await initialize_sqlalchemy()
 
@@ -105,4 +107,9 @@ async def lifespan(app: FastAPI):
     # Shutdown section
     # --------------------------------------------------------------
 
+    if settings.CACHE_ENABLED:
+        logger.opt(lazy=True).info(
+            "Permissions cache stats: {}", permissions_cache.stats
+        )
+
     logger.info("Async shutdown completed ...")
@@ -4,6 +4,7 @@
 from fastapi import FastAPI
 
 from web_api_template.api.v1.addresses.router import api_router as addresses_v1_router
+from web_api_template.api.v1.debug.router import api_router as debug_v1_router
 
 # Healthcheck (do not touch)
 from web_api_template.api.v1.healthcheck.router import (
@@ -12,6 +13,7 @@ from web_api_template.api.v1.healthcheck.router import (
 from web_api_template.api.v1.persons.router import api_router as persons_v1_router
 from web_api_template.api.v1.policies.router import api_router as policies_v1_router
 from web_api_template.core.logging import logger
+from web_api_template.core.settings import settings
 
 
 def include_routers(app: FastAPI):
@@ -25,6 +27,18 @@ def include_routers(app: FastAPI):
     # Healthcheck route (do not touch)
     app.include_router(healthcheck_v1_router)
 
+    # Prometheus scrape
+    if settings.METRICS_ENABLED:
+        # Only imports prometheus_client when enabled
+        from web_api_template.api.v1.metrics.router import (
+            api_router as metrics_v1_router,
+        )
+
+        app.include_router(metrics_v1_router)
+
     app.include_router(persons_v1_router)
     app.include_router(policies_v1_router)
     app.include_router(addresses_v1_router)
+
+    # Diagnostics (administrators)
+    app.include_router(debug_v1_router)
@@ -0,0 +1,45 @@
+from web_api_template.core.api import BatchResult, batch_result
+from web_api_template.domain.entities.person_create import PersonCreate
+from web_api_template.domain.exceptions import PersonAlreadyExistsException
+
+
+def test_results_by_index():
+    person = PersonCreate(
+        name="John",
+        surname="Doe",
+        email="johndoe@mail.com",
+        identification_number="12345678A",
+    )
+
+    result: BatchResult = batch_result(
+        [person, PersonAlreadyExistsException("12345678B"), ValueError("boom")]
+    )
+
+    assert result.succeeded == 1
+    assert result.failed == 2
+    assert [item.index for item in result.items] == [0, 1, 2]
+
+    assert result.items[0].status == 201
+    assert result.items[0].item == person
+
+    assert result.items[1].status == 409
+    assert result.items[1].item is None
+    assert result.items[1].error == "PersonAlreadyExists"
+    assert "12345678B" in result.items[1].detail
+
+    assert result.items[2].status == 500
+    assert result.items[2].error is None
+
+
+def test_serialized_items():
+    person = PersonCreate(
+        name="John",
+        surname="Doe",
+        email="johndoe@mail.com",
+        identification_number="12345678A",
+    )
+
+    result: BatchResult = batch_result([person], success_status=200)
+
+    assert '"identification_number":"12345678A"' in result.model_dump_json()
+    assert result.items[0].status == 200
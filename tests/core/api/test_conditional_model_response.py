@@ -0,0 +1,49 @@
+from starlette.requests import Request
+
+from web_api_template.core.api import conditional_model_response
+from web_api_template.core.http.etag import entity_etag
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.domain.entities.person import Person
+
+PERSON: Person = Person(
+    id="2pX3um6Y7siS1bCyZx5Bw8E8dWv",
+    name="John",
+    surname="Doe",
+    email="johndoe@mail.com",
+    identification_number="12345678A",
+    version=3,
+)
+
+
+def request(if_none_match: str = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+def test_entity_not_modified():
+    etag: str = entity_etag(PERSON.id, PERSON.version)
+
+    response = conditional_model_response(request(), PERSON, etag=etag)
+    assert response.status_code == 200
+    assert response.headers["etag"] == etag
+
+    response = conditional_model_response(request(etag), PERSON, etag=etag)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+    # Modified: new version
+    response = conditional_model_response(
+        request(etag), PERSON, etag=entity_etag(PERSON.id, 4)
+    )
+    assert response.status_code == 200
+
+
+def test_page_not_modified():
+    page = Page.model_construct(items=[PERSON], total=1)
+
+    etag: str = conditional_model_response(request(), page).headers["etag"]
+    assert conditional_model_response(request(etag), page).status_code == 304
+
+    page = Page.model_construct(items=[], total=0)
+    assert conditional_model_response(request(etag), page).status_code == 200
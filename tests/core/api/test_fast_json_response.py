@@ -0,0 +1,48 @@
+import json
+from datetime import date
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from web_api_template.core.api import FastJSONResponse, ProblemDetail
+from web_api_template.core.api.fast_json_response import ENCODERS, get_json_encoder
+from web_api_template.domain.types import CurrencyEnum, PolicyStatusEnum
+
+CONTENT = {
+    "start_date": date(2024, 1, 31),
+    "status": PolicyStatusEnum.ACTIVE,
+    "currency": CurrencyEnum.EUR,
+    "premium": 10.5,
+    "name": "Müller",
+    "items": [1, None, True],
+}
+
+
+@pytest.mark.parametrize("name", list(ENCODERS))
+def test_same_content_as_jsonable_encoder(name):
+    encode = get_json_encoder(name)
+
+    assert json.loads(encode(CONTENT)) == jsonable_encoder(CONTENT)
+
+
+@pytest.mark.parametrize("name", list(ENCODERS))
+def test_problem_detail(name):
+    problem_detail = ProblemDetail(title="Invalid argument", status=400)
+    problem_detail.add_extension("field", "name")
+
+    body = json.loads(get_json_encoder(name)(problem_detail))
+
+    assert body == jsonable_encoder(problem_detail)
+    assert body["field"] == "name"
+
+
+def test_unknown_encoder_fallback():
+    assert get_json_encoder("unknown")(CONTENT) == get_json_encoder("json")(CONTENT)
+
+
+def test_response():
+    response = FastJSONResponse(status_code=400, content=CONTENT)
+
+    assert response.status_code == 400
+    assert response.media_type == "application/json"
+    assert json.loads(response.body)["status"] == "active"
@@ -0,0 +1,40 @@
+import json
+
+from fastapi.encoders import jsonable_encoder
+
+from web_api_template.core.api import FastJSONResponse, model_response
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.domain.entities.person import Person
+
+
+def test_same_content_as_response_model():
+    person = Person(
+        id="2pX3um6Y7siS1bCyZx5Bw8E8dWv",
+        name="John",
+        surname="Doe",
+        email="johndoe@mail.com",
+        identification_number="12345678A",
+        version=3,
+    )
+    page = Page.model_construct(items=[person], total=1)
+
+    response = model_response(page, status_code=200)
+
+    assert response.status_code == 200
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(page)
+
+
+def test_configured_encoder(monkeypatch):
+    encoded = []
+
+    def encode(content):
+        encoded.append(content)
+        return b'{"encoded":true}'
+
+    monkeypatch.setattr(FastJSONResponse, "encode", staticmethod(encode))
+
+    response = model_response(Page.model_construct(items=[], total=0))
+
+    assert response.body == b'{"encoded":true}'
+    assert encoded[0]["total"] == 0
@@ -0,0 +1,13 @@
+import pytest
+from pydantic import ValidationError
+
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
+from web_api_template.core.settings import settings
+
+
+def test_max_page_size():
+    pagination = PaginationQueryModel(size=settings.PAGINATION_MAX_SIZE)
+    assert pagination.size == settings.PAGINATION_MAX_SIZE
+
+    with pytest.raises(ValidationError):
+        PaginationQueryModel(size=settings.PAGINATION_MAX_SIZE + 1)
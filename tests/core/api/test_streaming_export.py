@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, List
+
+import pytest
+from pydantic import BaseModel
+
+from web_api_template.core.api import ExportFormatEnum, export_response
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    tags: List[str] = []
+
+
+async def items(total: int) -> AsyncIterator[Item]:
+    for index in range(total):
+        yield Item(id=index, name=f"Name, {index}", tags=["a", "b"])
+
+
+async def read_body(export_format: ExportFormatEnum, total: int) -> str:
+    response = export_response(
+        items(total), export_format=export_format, filename="items"
+    )
+    return "".join([chunk async for chunk in response.body_iterator])
+
+
+@pytest.mark.asyncio
+async def test_ndjson():
+    body: str = await read_body(ExportFormatEnum.NDJSON, 5000)
+    lines: List[str] = body.splitlines()
+
+    assert len(lines) == 5000
+    assert json.loads(lines[-1]) == {
+        "id": 4999,
+        "name": "Name, 4999",
+        "tags": ["a", "b"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_csv():
+    body: str = await read_body(ExportFormatEnum.CSV, 3)
+    rows: List[List[str]] = list(csv.reader(io.StringIO(body)))
+
+    assert rows[0] == ["id", "name", "tags"]
+    assert rows[1] == ["0", "Name, 0", '["a", "b"]']
+    assert len(rows) == 4
+
+
+@pytest.mark.asyncio
+async def test_empty_export():
+    response = export_response(
+        items(0), export_format=ExportFormatEnum.CSV, filename="items"
+    )
+
+    assert response.media_type == "text/csv"
+    assert response.headers["content-disposition"] == 'attachment; filename="items.csv"'
+    assert [chunk async for chunk in response.body_iterator] == []
@@ -0,0 +1,32 @@
+from web_api_template.core.http.etag import (
+    content_etag,
+    entity_etag,
+    etag_matches,
+    etag_version,
+)
+
+PERSON_ID: str = "2pX3um6Y7siS1bCyZx5Bw8E8dWv"
+
+
+def test_entity_etag_version():
+    etag: str = entity_etag(PERSON_ID, 3)
+
+    assert etag == f'W/"{PERSON_ID}-3"'
+    assert etag_version(etag, PERSON_ID) == 3
+    # Strong form of the same ETag, in a list
+    assert etag_version(f'"other", "{PERSON_ID}-3"', PERSON_ID) == 3
+    assert etag_version(entity_etag("other", 3), PERSON_ID) is None
+    assert etag_version(f'"{PERSON_ID}-x"', PERSON_ID) is None
+    assert etag_version(None, PERSON_ID) is None
+
+
+def test_etag_matches():
+    etag: str = content_etag(b'{"items":[]}')
+
+    assert etag == content_etag(b'{"items":[]}')
+    assert etag != content_etag(b'{"items":[1]}')
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"a", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"a"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,308 @@
+import asyncio
+import gc
+from typing import List
+
+import pytest
+import pytest_asyncio
+from ksuid import Ksuid
+from sqlalchemy import create_mock_engine, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from web_api_template.core.repository.exceptions import InvalidArgumentException
+from web_api_template.core.repository.manager.sqlalchemy.async_paginator import (
+    AsyncPaginator,
+)
+from web_api_template.core.repository.manager.sqlalchemy.count_mode_enum import (
+    CountModeEnum,
+)
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.repository.model.sqlalchemy import metadata
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel
+
+TOTAL_PERSONS: int = 25
+
+
+def create_persons_model() -> List[PersonModel]:
+    return [
+        PersonModel(
+            id=str(Ksuid()),
+            # Repeated names to check the id tiebreaker
+            name=f"Person{index % 4}",
+            surname=f"Surname{index}",
+            email=f"email{index}@mail.com",
+            identification_number=f"ID-{index:05d}",
+            # Nullable sort column: every third person has no creator
+            created_by=None if index % 3 == 0 else f"user{index % 2}",
+        )
+        for index in range(TOTAL_PERSONS)
+    ]
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+
+    async_session = async_sessionmaker(engine, class_=AsyncSession)
+    async with async_session() as session:
+        session.add_all(create_persons_model())
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+async def walk_cursors(session: AsyncSession, order_by: List[str]) -> List[str]:
+    """Walks every page following next_cursor and returns the ids in order"""
+    page: Page = await AsyncPaginator(session).list(
+        model=PersonModel, order_by=order_by, size=7
+    )
+    ids: List[str] = [item.id for item in page.items]
+
+    while page.next_cursor:
+        page = await AsyncPaginator(session).list(
+            model=PersonModel, order_by=order_by, size=7, cursor=page.next_cursor
+        )
+        ids.extend(item.id for item in page.items)
+
+    return ids
+
+
+async def walk_offsets(session: AsyncSession, order_by: List[str]) -> List[str]:
+    """Walks every page by page number and returns the ids in order"""
+    ids: List[str] = []
+    for page_number in range(1, 5):
+        page: Page = await AsyncPaginator(session).list(
+            model=PersonModel, order_by=order_by, size=7, page=page_number
+        )
+        ids.extend(item.id for item in page.items)
+    return ids
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order_by", [[], ["name"], ["-name", "surname"]])
+async def test_keyset_matches_offset(session, order_by):
+    keyset_ids: List[str] = await walk_cursors(session, order_by)
+    offset_ids: List[str] = await walk_offsets(session, order_by)
+
+    assert len(keyset_ids) == TOTAL_PERSONS
+    assert keyset_ids == offset_ids
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order_by", [["created_by"], ["-created_by"]])
+async def test_keyset_nullable_sort_column(session, order_by):
+    keyset_ids: List[str] = await walk_cursors(session, order_by)
+    offset_ids: List[str] = await walk_offsets(session, order_by)
+
+    # NULL values are neither skipped nor repeated
+    assert len(keyset_ids) == TOTAL_PERSONS
+    assert keyset_ids == offset_ids
+
+    # Walk back from the last page to the first one
+    page: Page = await AsyncPaginator(session).list(
+        model=PersonModel, order_by=order_by, size=7, page=4
+    )
+    ids: List[str] = [item.id for item in page.items]
+    while page.prev_cursor:
+        page = await AsyncPaginator(session).list(
+            model=PersonModel, order_by=order_by, size=7, cursor=page.prev_cursor
+        )
+        ids = [item.id for item in page.items] + ids
+
+    assert ids == offset_ids
+
+
+class MySQLSession:
+    """Session bound to MySQL (only to build the queries)"""
+
+    def get_bind(self):
+        return create_mock_engine("mysql://", executor=None)
+
+
+def test_nullable_sort_column_on_mysql():
+    paginator: AsyncPaginator = AsyncPaginator(MySQLSession())
+    paginator._model = PersonModel
+    paginator._query = select(PersonModel)
+    paginator._sort(["created_by", "-updated_by"])
+
+    sql: str = str(paginator._query.compile(dialect=mysql.dialect()))
+
+    # MySQL does not support NULLS FIRST/LAST
+    assert "NULLS" not in sql
+    assert sql.endswith(
+        "ORDER BY persons.created_by IS NULL ASC, persons.created_by ASC, "
+        "persons.updated_by IS NULL DESC, persons.updated_by DESC, persons.id ASC"
+    )
+
+
+@pytest.mark.asyncio
+async def test_keyset_prev_cursor(session):
+    first: Page = await AsyncPaginator(session).list(model=PersonModel, size=10)
+    second: Page = await AsyncPaginator(session).list(
+        model=PersonModel, size=10, cursor=first.next_cursor
+    )
+    back: Page = await AsyncPaginator(session).list(
+        model=PersonModel, size=10, cursor=second.prev_cursor
+    )
+
+    assert first.prev_cursor is None
+    assert second.page is None
+    assert second.total == TOTAL_PERSONS
+    assert [item.id for item in back.items] == [item.id for item in first.items]
+    assert back.prev_cursor is None
+    assert back.next_cursor is not None
+
+
+@pytest.mark.asyncio
+async def test_keyset_last_page_has_no_next_cursor(session):
+    page: Page = await AsyncPaginator(session).list(model=PersonModel, size=20)
+    last: Page = await AsyncPaginator(session).list(
+        model=PersonModel, size=20, cursor=page.next_cursor
+    )
+
+    assert len(last.items) == TOTAL_PERSONS - 20
+    assert last.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor(session):
+    with pytest.raises(InvalidArgumentException):
+        await AsyncPaginator(session).list(model=PersonModel, cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_cursor_does_not_match_sort(session):
+    page: Page = await AsyncPaginator(session).list(model=PersonModel, size=5)
+
+    with pytest.raises(InvalidArgumentException):
+        await AsyncPaginator(session).list(
+            model=PersonModel, order_by=["name"], cursor=page.next_cursor
+        )
+
+
+@pytest.mark.asyncio
+async def test_invalid_sort_column(session):
+    with pytest.raises(InvalidArgumentException):
+        await AsyncPaginator(session).list(model=PersonModel, order_by=["unknown"])
+
+
+@pytest.mark.asyncio
+async def test_count_none(session):
+    page: Page = await AsyncPaginator(session).list(
+        model=PersonModel, size=10, page=3, count_mode=CountModeEnum.NONE
+    )
+
+    assert page.total is None
+    assert page.pages is None
+    assert page.has_next is False
+    assert len(page.items) == TOTAL_PERSONS - 20
+
+    page = await AsyncPaginator(session).list(
+        model=PersonModel, size=10, page=2, count_mode=CountModeEnum.NONE
+    )
+    assert page.has_next is True
+    assert page.next_cursor is not None
+
+
+@pytest.mark.asyncio
+async def test_count_estimate_falls_back_to_exact(session):
+    # SQLite has no planner statistics: exact count is used
+    page: Page = await AsyncPaginator(session).list(
+        model=PersonModel, size=10, count_mode=CountModeEnum.ESTIMATE
+    )
+
+    assert page.total == TOTAL_PERSONS
+    assert page.pages == 3
+    assert page.estimated is False
+    assert page.has_next is True
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    # File database: every session gets its own pooled connection
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'persons.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+
+    async_session = async_sessionmaker(engine, class_=AsyncSession)
+    async with async_session() as session:
+        session.add_all(create_persons_model())
+        await session.commit()
+
+    yield async_session
+
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_count(session_factory):
+    async with session_factory() as session:
+        paginator = AsyncPaginator(session, count_session_factory=session_factory)
+
+        page: Page = await paginator.list(model=PersonModel, size=10, page=2)
+        assert page.total == TOTAL_PERSONS
+        assert page.page == 2
+        assert len(page.items) == 10
+        assert page.has_next is True
+
+        # Requested page is clamped to the last page once the count is known
+        page = await paginator.list(model=PersonModel, size=10, page=9)
+        assert page.page == 3
+        assert len(page.items) == TOTAL_PERSONS - 20
+        assert page.has_next is False
+
+        keyset: Page = await paginator.list(
+            model=PersonModel, size=10, cursor=page.prev_cursor
+        )
+        assert keyset.total == TOTAL_PERSONS
+        assert len(keyset.items) == 10
+
+
+@pytest.mark.asyncio
+async def test_concurrent_count_query_fails(session_factory):
+    count_cancelled = asyncio.Event()
+
+    async def slow_total(count_mode, session=None):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            count_cancelled.set()
+            raise
+
+    async def failing_fetch():
+        await asyncio.sleep(0)
+        raise RuntimeError("items query failed")
+
+    async with session_factory() as session:
+        paginator = AsyncPaginator(session, count_session_factory=session_factory)
+        paginator._total = slow_total
+
+        # The error of the failed query is raised and the count is cancelled
+        with pytest.raises(RuntimeError, match="items query failed"):
+            await asyncio.wait_for(
+                paginator._total_and_items(CountModeEnum.EXACT, failing_fetch), 1
+            )
+        assert count_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_count_session_fails(session_factory, recwarn):
+    def failing_session_factory():
+        raise RuntimeError("no connection available")
+
+    async with session_factory() as session:
+        paginator = AsyncPaginator(
+            session, count_session_factory=failing_session_factory
+        )
+
+        with pytest.raises(RuntimeError, match="no connection available"):
+            await paginator.list(model=PersonModel, size=10)
+
+    # The items query is not created before the count session
+    gc.collect()
+    assert not [
+        warning for warning in recwarn if "never awaited" in str(warning.message)
+    ]
@@ -0,0 +1,94 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from web_api_template.core.repository.manager.sqlalchemy.pool_metrics import (
+    PoolMetrics,
+)
+
+
+@pytest_asyncio.fixture
+async def pool_metrics(tmp_path):
+    pool_metrics = PoolMetrics(label="TEST", wait_warning_ms=50)
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    pool_metrics.register(engine)
+    yield pool_metrics
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_checkouts_and_connects(pool_metrics):
+    engine = pool_metrics._engine
+    for _ in range(3):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert pool_metrics.snapshot()["checked_out"] == 1
+
+    snapshot = pool_metrics.snapshot()
+    assert snapshot["label"] == "TEST"
+    assert snapshot["size"] == 1
+    assert snapshot["checked_out"] == 0
+    assert snapshot["checkouts"] == 3
+    # The connection is reused
+    assert snapshot["connects"] == 1
+    assert snapshot["connect_time_ms"] > 0
+    assert snapshot["timeouts"] == 0
+    assert snapshot["warnings"] == []
+
+
+@pytest.mark.asyncio
+async def test_timeout_warnings(pool_metrics):
+    engine = pool_metrics._engine
+    async with engine.connect():
+        # Pool exhausted: waits pool_timeout (100 ms)
+        with pytest.raises(TimeoutError):
+            async with engine.connect():
+                pass
+
+    snapshot = pool_metrics.snapshot()
+    assert snapshot["timeouts"] == 1
+    assert snapshot["wait_max_ms"] >= 100
+    # Over the 50 ms threshold (p95 of two checkouts is the slowest)
+    assert len(snapshot["warnings"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidations(pool_metrics):
+    engine = pool_metrics._engine
+    async with engine.connect() as conn:
+        await conn.invalidate()
+
+    assert pool_metrics.snapshot()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_class_kept(pool_metrics, tmp_path):
+    # Dialect default pool class, recreated on dispose
+    assert isinstance(pool_metrics.pool, AsyncAdaptedQueuePool)
+    await pool_metrics._engine.dispose()
+    assert isinstance(pool_metrics.pool, AsyncAdaptedQueuePool)
+    async with pool_metrics._engine.connect():
+        pass
+    assert pool_metrics.snapshot()["checkouts"] == 1
+
+    null_pool_metrics = PoolMetrics(label="NULL")
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'null.db'}", poolclass=NullPool
+    )
+    null_pool_metrics.register(engine)
+    async with engine.connect():
+        pass
+
+    assert isinstance(null_pool_metrics.pool, NullPool)
+    snapshot = null_pool_metrics.snapshot()
+    assert snapshot["checkouts"] == 1
+    assert snapshot["size"] == 0
+    await engine.dispose()
@@ -0,0 +1,196 @@
+from datetime import date, timedelta
+from typing import Any, List
+
+import pytest
+import pytest_asyncio
+from ksuid import Ksuid
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from web_api_template.core.repository.exceptions import InvalidArgumentException
+from web_api_template.core.repository.manager.sqlalchemy.async_paginator import (
+    AsyncPaginator,
+)
+from web_api_template.core.repository.manager.sqlalchemy.count_mode_enum import (
+    CountModeEnum,
+)
+from web_api_template.core.repository.manager.sqlalchemy.filter_operator_enum import (
+    FilterOperatorEnum,
+)
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.core.repository.manager.sqlalchemy.query_filter import (
+    FilterField,
+    QueryFilter,
+)
+from web_api_template.core.repository.model.sqlalchemy import metadata
+from web_api_template.domain.aggregates import PolicyFilter
+from web_api_template.domain.entities.person_filter import PersonFilter
+from web_api_template.domain.types import (
+    CurrencyEnum,
+    PolicyStatusEnum,
+    PolicyTypeEnum,
+)
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel, PolicyModel
+from web_api_template.infrastructure.repositories.sqlalchemy.person_read_repository_impl import (
+    PERSON_FILTER,
+)
+from web_api_template.infrastructure.repositories.sqlalchemy.policy_read_repository_impl import (
+    POLICY_FILTER,
+)
+
+HOLDER_ID: str = str(Ksuid())
+START_DATE: date = date(2024, 1, 1)
+
+
+def create_persons_model() -> List[PersonModel]:
+    return [
+        PersonModel(
+            id=HOLDER_ID if index == 0 else str(Ksuid()),
+            name=f"John{index}" if index % 2 else f"Jane{index}",
+            surname="Doe_" if index == 0 else f"Doe{index}",
+            email=f"email{index}@mail.com",
+            identification_number=f"ID-{index:05d}",
+        )
+        for index in range(20)
+    ]
+
+
+def create_policies_model() -> List[PolicyModel]:
+    statuses: List[PolicyStatusEnum] = list(PolicyStatusEnum)
+    return [
+        PolicyModel(
+            id=str(Ksuid()),
+            holder_id=HOLDER_ID,
+            policy_number=f"POL-{index:03d}",
+            status=statuses[index % len(statuses)],
+            policy_type=PolicyTypeEnum.HOME,
+            start_date=START_DATE + timedelta(days=index),
+            end_date=START_DATE + timedelta(days=365 + index),
+            premium=100.0,
+            currency=CurrencyEnum.EUR,
+        )
+        for index in range(10)
+    ]
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+
+    async_session = async_sessionmaker(engine, class_=AsyncSession)
+    async with async_session() as session:
+        session.add_all(create_persons_model())
+        session.add_all(create_policies_model())
+        await session.commit()
+        yield session
+
+    await engine.dispose()
+
+
+async def select_policies(session: AsyncSession, filter: PolicyFilter) -> List[Any]:
+    result = await session.execute(
+        select(PolicyModel).where(*POLICY_FILTER.build(filter))
+    )
+    return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_prefix_and_eq(session):
+    page: Page = await AsyncPaginator(session).list(
+        model=PersonModel, filter_by=PERSON_FILTER.build(PersonFilter(name="John1"))
+    )
+
+    # John1, John11, John13, John15, John17 and John19
+    assert page.total == 6
+    assert all(item.name.startswith("John1") for item in page.items)
+
+    page = await AsyncPaginator(session).list(
+        model=PersonModel,
+        filter_by=PERSON_FILTER.build(PersonFilter(email="email3@mail.com")),
+    )
+    assert [item.email for item in page.items] == ["email3@mail.com"]
+
+
+@pytest.mark.asyncio
+async def test_prefix_escapes_wildcards(session):
+    page: Page = await AsyncPaginator(session).list(
+        model=PersonModel, filter_by=PERSON_FILTER.build(PersonFilter(surname="Doe_"))
+    )
+
+    assert [item.id for item in page.items] == [HOLDER_ID]
+
+
+@pytest.mark.asyncio
+async def test_in_and_range(session):
+    policies = await select_policies(
+        session,
+        PolicyFilter(
+            policy_holder_id=HOLDER_ID,
+            statuses="active, inactive",
+        ),
+    )
+    assert sorted(policy.policy_number for policy in policies) == [
+        "POL-002",
+        "POL-003",
+        "POL-008",
+        "POL-009",
+    ]
+
+    policies = await select_policies(
+        session,
+        PolicyFilter(
+            start_date_from=START_DATE + timedelta(days=2),
+            start_date_to=START_DATE + timedelta(days=4),
+        ),
+    )
+    assert sorted(policy.policy_number for policy in policies) == [
+        "POL-002",
+        "POL-003",
+        "POL-004",
+    ]
+
+
+def test_in_invalid_value():
+    with pytest.raises(InvalidArgumentException):
+        POLICY_FILTER.build(PolicyFilter(statuses="active,unknown"))
+
+
+def test_field_not_allowed():
+    query_filter = QueryFilter({"name": FilterField(PersonModel.name)})
+
+    with pytest.raises(InvalidArgumentException):
+        query_filter.build(PersonFilter(surname="Doe"))
+
+
+def test_column_not_indexed():
+    with pytest.raises(ValueError):
+        QueryFilter(
+            {"premium": FilterField(PolicyModel.premium, FilterOperatorEnum.GTE)}
+        )
+
+
+@pytest.mark.asyncio
+async def test_filtered_estimate_and_keyset(session):
+    filter_by = PERSON_FILTER.build(PersonFilter(name="Jane"))
+
+    # Estimation is not possible for a filtered query: exact count
+    page: Page = await AsyncPaginator(session).list(
+        model=PersonModel,
+        filter_by=filter_by,
+        size=4,
+        count_mode=CountModeEnum.ESTIMATE,
+    )
+    assert page.total == 10
+    assert page.estimated is False
+
+    ids: List[str] = [item.id for item in page.items]
+    while page.next_cursor:
+        page = await AsyncPaginator(session).list(
+            model=PersonModel, filter_by=filter_by, size=4, cursor=page.next_cursor
+        )
+        assert page.total == 10
+        ids.extend(item.id for item in page.items)
+
+    assert len(ids) == 10
@@ -0,0 +1,114 @@
+import pytest
+import pytest_asyncio
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from web_api_template.core.repository.manager.sqlalchemy.query_tracing import (
+    QueryTracer,
+    SlowQueryTable,
+    fingerprint,
+)
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        (
+            "SELECT persons.id FROM persons WHERE persons.id = ?",
+            "SELECT persons.id FROM persons WHERE persons.id = ?",
+        ),
+        (
+            "SELECT * FROM persons_1 WHERE name = 'O''Neil' AND age > 30 LIMIT 10",
+            "SELECT * FROM persons_1 WHERE name = ? AND age > ? LIMIT ?",
+        ),
+        (
+            "SELECT * FROM persons WHERE id IN ($1::VARCHAR, $2::VARCHAR)",
+            "SELECT * FROM persons WHERE id IN (...)",
+        ),
+        (
+            "UPDATE persons SET name=%(name)s WHERE persons.id = %(id_1)s",
+            "UPDATE persons SET name=? WHERE persons.id = ?",
+        ),
+        (
+            "INSERT INTO persons (id, name) VALUES (?, ?), (?, ?), (?, ?)",
+            "INSERT INTO persons (id, name) VALUES (...)",
+        ),
+        (
+            "SELECT id /* by id */ FROM persons\n  WHERE id = :id -- comment",
+            "SELECT id FROM persons WHERE id = ?",
+        ),
+    ],
+)
+def test_fingerprint(statement, expected):
+    assert fingerprint(statement) == expected
+
+
+def test_slow_query_table():
+    table = SlowQueryTable(max_size=2)
+    table.record("DEFAULT", "SELECT ?", 10, 1)
+    table.record("DEFAULT", "SELECT ?", 30, 1)
+    table.record("DEFAULT", "DELETE ?", 5, -1)
+
+    assert [stats["fingerprint"] for stats in table.top(order_by="max_ms")] == [
+        "SELECT ?",
+        "DELETE ?",
+    ]
+    stats = table.top(limit=1)[0]
+    assert stats["count"] == 2
+    assert stats["total_ms"] == 40
+    assert stats["mean_ms"] == 20
+    assert stats["rows"] == 2
+
+    # Full: the lowest total time is dropped
+    table.record("DEFAULT", "UPDATE ?", 1, 1)
+    assert {stats["fingerprint"] for stats in table.top()} == {"SELECT ?", "UPDATE ?"}
+
+    with pytest.raises(ValueError):
+        table.top(order_by="fingerprint")
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_query_tracer(engine):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    table = SlowQueryTable()
+    QueryTracer("TEST", table=table, tracer_provider=provider).instrument(engine)
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER)"))
+        await conn.execute(text("INSERT INTO items VALUES (1), (2), (3)"))
+        for id in range(3):
+            await conn.execute(text("DELETE FROM items WHERE id = :id"), {"id": id})
+        with pytest.raises(OperationalError):
+            await conn.execute(text("SELECT * FROM missing"))
+
+    stats = {stats["fingerprint"]: stats for stats in table.top(limit=10)}
+    assert stats["DELETE FROM items WHERE id = ?"]["count"] == 3
+    assert stats["DELETE FROM items WHERE id = ?"]["rows"] == 2
+    assert stats["INSERT INTO items VALUES (...)"]["rows"] == 3
+    assert stats["SELECT * FROM missing"]["count"] == 1
+
+    spans = exporter.get_finished_spans()
+    insert = next(span for span in spans if span.name == "INSERT TEST")
+    assert insert.attributes["db.statement"] == "INSERT INTO items VALUES (...)"
+    assert insert.attributes["db.system"] == "sqlite"
+    assert insert.attributes["pool.name"] == "TEST"
+    assert insert.attributes["db.response.returned_rows"] == 3
+
+    error = next(span for span in spans if span.name == "SELECT TEST")
+    assert error.status.status_code == StatusCode.ERROR
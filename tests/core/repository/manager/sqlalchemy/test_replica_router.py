@@ -0,0 +1,167 @@
+from typing import Dict, List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from web_api_template.core.repository.manager.sqlalchemy.async_database import (
+    AsyncDatabase,
+)
+from web_api_template.core.repository.manager.sqlalchemy.replica_router import (
+    LEAST_CONNECTIONS,
+    ReplicaRouter,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest_asyncio.fixture
+async def factories(tmp_path):
+    engines = {
+        label: create_async_engine(f"sqlite+aiosqlite:///{tmp_path / label}.db")
+        for label in ("PRIMARY", "REPLICA1", "REPLICA2")
+    }
+    # The database folder does not exist: every connection fails
+    engines["DOWN"] = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'down.db'}"
+    )
+    # One connection: a second checkout times out
+    engines["BUSY"] = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'busy'}.db",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    yield {
+        label: sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        for label, engine in engines.items()
+    }
+    for engine in engines.values():
+        await engine.dispose()
+
+
+def select_replicas(factories: Dict[str, sessionmaker], labels: List[str]):
+    return {label: factories[label] for label in labels}
+
+
+def test_unknown_strategy(factories):
+    with pytest.raises(ValueError):
+        ReplicaRouter(select_replicas(factories, ["REPLICA1"]), strategy="random")
+
+
+def test_round_robin(factories):
+    router = ReplicaRouter(select_replicas(factories, ["REPLICA1", "REPLICA2"]))
+
+    assert [router.candidates()[0] for _ in range(4)] == [
+        "REPLICA1",
+        "REPLICA2",
+        "REPLICA1",
+        "REPLICA2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_least_connections(factories):
+    router = ReplicaRouter(
+        select_replicas(factories, ["REPLICA1", "REPLICA2"]),
+        strategy=LEAST_CONNECTIONS,
+    )
+
+    session = await router.connect()
+    assert session.bind is factories["REPLICA1"].kw["bind"]
+    # REPLICA1 has a checked out connection
+    assert router.candidates() == ["REPLICA2", "REPLICA1"]
+
+    await session.close()
+    assert router.candidates() == ["REPLICA1", "REPLICA2"]
+
+
+@pytest.mark.asyncio
+async def test_failed_replica_ejected(factories):
+    clock = FakeClock()
+    router = ReplicaRouter(
+        select_replicas(factories, ["DOWN", "REPLICA1"]),
+        eject_seconds=30,
+        clock=clock,
+    )
+
+    session = await router.connect()
+    assert session.bind is factories["REPLICA1"].kw["bind"]
+    await session.close()
+
+    assert router.is_ejected("DOWN")
+    assert router.candidates() == ["REPLICA1"]
+
+    # Back to the rotation after eject_seconds
+    clock.now = 30
+    assert not router.is_ejected("DOWN")
+    assert "DOWN" in router.candidates()
+
+
+@pytest.mark.asyncio
+async def test_pool_timeout_tries_next_replica(factories):
+    router = ReplicaRouter(select_replicas(factories, ["BUSY", "REPLICA1"]))
+
+    async with factories["BUSY"]() as busy:
+        await busy.connection()
+
+        session = await router.connect()
+        assert session.bind is factories["REPLICA1"].kw["bind"]
+        await session.close()
+
+    assert router.is_ejected("BUSY")
+
+
+@pytest.mark.asyncio
+async def test_no_replica_available(factories):
+    router = ReplicaRouter(select_replicas(factories, ["DOWN"]))
+
+    assert await router.connect() is None
+    assert router.candidates() == []
+
+
+@pytest.mark.asyncio
+async def test_reads_on_primary_after_a_write(factories, monkeypatch):
+    monkeypatch.setattr(AsyncDatabase, "_sessions", factories)
+    monkeypatch.setattr(
+        AsyncDatabase,
+        "_routers",
+        {"PRIMARY": ReplicaRouter(select_replicas(factories, ["REPLICA1"]))},
+    )
+
+    async with AsyncDatabase.get_read_session("PRIMARY") as session:
+        assert session.bind is factories["REPLICA1"].kw["bind"]
+
+    async with AsyncDatabase.get_session("PRIMARY") as session:
+        assert session.bind is factories["PRIMARY"].kw["bind"]
+
+    # Read your own writes: the replica may lag behind
+    async with AsyncDatabase.get_read_session("PRIMARY") as session:
+        assert session.bind is factories["PRIMARY"].kw["bind"]
+
+
+@pytest.mark.asyncio
+async def test_primary_read_session(factories, monkeypatch):
+    monkeypatch.setattr(AsyncDatabase, "_sessions", factories)
+    monkeypatch.setattr(
+        AsyncDatabase,
+        "_routers",
+        {"PRIMARY": ReplicaRouter(select_replicas(factories, ["REPLICA1"]))},
+    )
+
+    # i.e. cache loads
+    async with AsyncDatabase.get_primary_read_session("PRIMARY") as session:
+        assert session.bind is factories["PRIMARY"].kw["bind"]
+
+    # The other reads of the request still go to the replicas
+    async with AsyncDatabase.get_read_session("PRIMARY") as session:
+        assert session.bind is factories["REPLICA1"].kw["bind"]
@@ -0,0 +1,117 @@
+import asyncio
+from typing import List
+
+import pytest
+import pytest_asyncio
+from ksuid import Ksuid
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from web_api_template.core.repository.manager.sqlalchemy.unit_of_work import (
+    UnitOfWorkSession,
+    current_unit_of_work,
+    on_commit,
+    unit_of_work,
+)
+from web_api_template.core.repository.model.sqlalchemy import metadata
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel
+
+
+def create_person_model(index: int) -> PersonModel:
+    return PersonModel(
+        id=str(Ksuid()),
+        name=f"Person{index}",
+        surname=f"Surname{index}",
+        email=f"email{index}@mail.com",
+        identification_number=f"ID-{index:05d}",
+    )
+
+
+@pytest_asyncio.fixture
+async def engine(tmp_path):
+    # File database: the checks use their own connections
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'uow.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def session_factory(engine: AsyncEngine):
+    return lambda label: UnitOfWorkSession(bind=engine, expire_on_commit=False)
+
+
+async def count_persons(engine: AsyncEngine) -> int:
+    async with engine.connect() as conn:
+        return await conn.scalar(select(func.count()).select_from(PersonModel))
+
+
+@pytest.mark.asyncio
+async def test_session_shared_by_the_owner_task(engine):
+    async with unit_of_work(session_factory(engine)) as work:
+        assert current_unit_of_work() is work
+        assert work.get_session("DEFAULT") is work.get_session("DEFAULT")
+        assert work.get_session("DEFAULT") is not work.get_session("REPLICA")
+
+        # Other tasks (i.e. asyncio.gather) can not share the session
+        async def child():
+            return current_unit_of_work()
+
+        assert await asyncio.create_task(child()) is None
+
+    assert current_unit_of_work() is None
+
+
+@pytest.mark.asyncio
+async def test_repository_commit_deferred_to_the_unit_of_work(engine):
+    async with unit_of_work(session_factory(engine)) as work:
+        session = work.get_session("DEFAULT")
+        session.add(create_person_model(1))
+        await session.commit()
+        session.add(create_person_model(2))
+        await session.commit()
+
+        # Flushed in the transaction, not committed
+        assert await count_persons(engine) == 0
+        await work.commit()
+
+    assert await count_persons(engine) == 2
+
+
+@pytest.mark.asyncio
+async def test_rollback_discards_every_step(engine):
+    with pytest.raises(RuntimeError):
+        async with unit_of_work(session_factory(engine)) as work:
+            session = work.get_session("DEFAULT")
+            session.add(create_person_model(1))
+            await session.commit()
+            raise RuntimeError("Second step failed")
+
+    assert await count_persons(engine) == 0
+
+
+@pytest.mark.asyncio
+async def test_on_commit_callbacks(engine):
+    calls: List[str] = []
+
+    async def invalidate():
+        calls.append(f"invalidated: {await count_persons(engine)}")
+
+    # Out of a unit of work: immediately
+    await on_commit(invalidate)
+    assert calls == ["invalidated: 0"]
+
+    async with unit_of_work(session_factory(engine)) as work:
+        work.get_session("DEFAULT").add(create_person_model(1))
+        await on_commit(invalidate)
+        assert len(calls) == 1
+        await work.commit()
+
+    # After the commit (the change is visible)
+    assert calls == ["invalidated: 0", "invalidated: 1"]
+
+    async with unit_of_work(session_factory(engine)) as work:
+        await on_commit(invalidate)
+        await work.rollback()
+
+    assert len(calls) == 2
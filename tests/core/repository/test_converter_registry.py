@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from datetime import date
+
+import pytest
+from automapper import mapper
+from pydantic import BaseModel
+
+from web_api_template.core.repository.converters import ConverterRegistry
+from web_api_template.domain.aggregates import Policy, PolicyCreate
+from web_api_template.domain.entities.person import Person
+from web_api_template.domain.entities.person_create import PersonCreate
+from web_api_template.domain.types import PolicyStatusEnum, PolicyTypeEnum
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel, PolicyModel
+from web_api_template.infrastructure.repositories.sqlalchemy.converters import (
+    converters,
+)
+
+PERSON_ID: str = "2pX3um6Y7siS1bCyZx5Bw8E8dWv"
+
+
+@dataclass
+class Source:
+    code: str
+
+
+class Target(BaseModel):
+    id: str
+    name: str = "default"
+
+
+def test_same_result_as_automapper():
+    person = PersonModel(
+        id=PERSON_ID,
+        name="John",
+        surname="Doe",
+        email="johndoe@mail.com",
+        identification_number="12345678A",
+        version=3,
+    )
+
+    assert converters.convert(person, Person) == mapper.map(person, Person)
+
+
+def test_policy_holder_rename():
+    policy = PolicyModel(
+        id=PERSON_ID,
+        holder_id=PERSON_ID,
+        policy_number="AB-111",
+        status=PolicyStatusEnum.ACTIVE,
+        policy_type=PolicyTypeEnum.CAR,
+        start_date=date(2024, 1, 1),
+        end_date=date(2025, 1, 1),
+        premium=10.5,
+    )
+
+    entity: Policy = converters.convert(policy, Policy)
+
+    assert entity.policy_holder_id == PERSON_ID
+    assert entity.status == PolicyStatusEnum.ACTIVE
+    assert entity.premium == 10.5
+
+
+def test_single_field_and_defaults():
+    registry = ConverterRegistry()
+    registry.register(Source, Target, renames={"code": "id"})
+
+    target: Target = registry.convert(Source(code="A"), Target)
+    assert target == Target(id="A", name="default")
+    assert registry.convert(None, Target) is None
+
+
+def test_not_registered():
+    with pytest.raises(KeyError):
+        ConverterRegistry().convert(Source(code="A"), Target)
+
+
+def test_trusted_source_not_validated():
+    registry = ConverterRegistry()
+    registry.register(Source, Target, renames={"code": "id"}, validate=False)
+
+    # No validation: the value is assigned as it is, the defaults still apply
+    target: Target = registry.convert(Source(code=1), Target)
+    assert target.id == 1
+    assert target.name == "default"
+
+
+def test_entity_to_model_same_result_as_automapper():
+    entity = PersonCreate(
+        name="John",
+        surname="Doe",
+        email="johndoe@mail.com",
+        identification_number="12345678A",
+    )
+
+    model: PersonModel = converters.convert(entity, PersonModel)
+    expected: PersonModel = mapper.map(entity, PersonModel)
+
+    for column in PersonModel.__table__.columns:
+        assert getattr(model, column.key) == getattr(expected, column.key)
+
+
+def test_entity_to_model_policy_holder_rename():
+    entity = PolicyCreate(
+        policy_holder_id=PERSON_ID,
+        policy_number="AB-111",
+        policy_type=PolicyTypeEnum.CAR,
+        start_date=date(2024, 1, 1),
+        end_date=date(2025, 1, 1),
+        premium=10.5,
+    )
+
+    model: PolicyModel = converters.convert(entity, PolicyModel)
+
+    assert model.holder_id == PERSON_ID
+    assert model.policy_type == PolicyTypeEnum.CAR
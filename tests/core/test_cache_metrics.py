@@ -0,0 +1,63 @@
+import pytest
+from aiocache import caches
+
+from web_api_template.core import cache_metrics
+from web_api_template.core.settings import settings
+
+ALIAS: str = "metrics_test"
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    caches.add(
+        ALIAS,
+        {
+            "cache": "aiocache.SimpleMemoryCache",
+            "plugins": [
+                {"class": "aiocache.plugins.HitMissRatioPlugin"},
+                {"class": "aiocache.plugins.TimingPlugin"},
+            ],
+        },
+    )
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "CACHE_CONFIG", {ALIAS: {}})
+    return caches.get(ALIAS)
+
+
+def observations(callback):
+    return {
+        tuple(sorted(observation.attributes.items())): observation.value
+        for observation in callback(None)
+    }
+
+
+@pytest.mark.asyncio
+async def test_cache_metrics(cache):
+    # No statistics before the first operation
+    assert observations(cache_metrics._observe_requests) == {}
+
+    await cache.set("key", 1)
+    await cache.get("key")
+    await cache.get("key")
+    await cache.get("missing")
+
+    assert observations(cache_metrics._observe_requests) == {
+        (("cache.name", ALIAS), ("result", "hit")): 2,
+        (("cache.name", ALIAS), ("result", "miss")): 1,
+    }
+    assert observations(cache_metrics._observe_hit_ratio) == {
+        (("cache.name", ALIAS),): pytest.approx(2 / 3)
+    }
+    assert observations(cache_metrics._observe_operations) == {
+        (("cache.name", ALIAS), ("cache.operation", "set")): 1,
+        (("cache.name", ALIAS), ("cache.operation", "get")): 3,
+    }
+    assert all(
+        value >= 0
+        for value in observations(cache_metrics._observe_operation_time).values()
+    )
+
+
+def test_cache_metrics_disabled(cache, monkeypatch):
+    monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+    assert observations(cache_metrics._observe_operations) == {}
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from aiocache import caches
+
+from web_api_template.core.entity_cache import EntityCache
+from web_api_template.core.selective_cache import is_cache_enabled, set_cache_enabled
+
+ALIAS: str = "test_entity_cache"
+
+
+class Loader:
+    def __init__(self, value):
+        self.value = value
+        self.calls: int = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.value
+
+
+@pytest.fixture
+def remote():
+    caches.add(ALIAS, {"cache": "aiocache.SimpleMemoryCache"})
+    enabled: bool = is_cache_enabled()
+    set_cache_enabled(True)
+
+    yield caches.get(ALIAS)
+
+    set_cache_enabled(enabled)
+
+
+@pytest.mark.asyncio
+async def test_cached_until_written(remote):
+    cache = EntityCache("persons", alias=ALIAS, ttl=60)
+    loader = Loader({"id": "1", "version": 0})
+
+    assert await cache.get("1", loader) == {"id": "1", "version": 0}
+    assert await cache.get("1", loader) == {"id": "1", "version": 0}
+    assert loader.calls == 1
+
+    # Written by another process: the next read goes to the database
+    await EntityCache("persons", alias=ALIAS, ttl=60).invalidate("1")
+
+    loader.value = {"id": "1", "version": 1}
+    assert await cache.get("1", loader) == {"id": "1", "version": 1}
+    assert loader.calls == 2
+    await remote.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_coalesced(remote):
+    cache = EntityCache("persons", alias=ALIAS, ttl=60)
+    loader = Loader({"id": "2"})
+
+    results = await asyncio.gather(*[cache.get("2", loader) for _ in range(20)])
+
+    assert results == [{"id": "2"}] * 20
+    assert loader.calls == 1
+    await remote.clear()
+
+
+@pytest.mark.asyncio
+async def test_not_found_and_maxsize(remote):
+    cache = EntityCache("persons", alias=ALIAS, ttl=60, maxsize=2)
+    loader = Loader(None)
+
+    assert await cache.get("3", loader) is None
+    assert await cache.get("3", loader) is None
+    assert loader.calls == 2
+
+    for id in ("a", "b", "c"):
+        await cache.get(id, Loader(id))
+    assert list(cache._local) == ["b", "c"]
+    await remote.clear()
+
+
+@pytest.mark.asyncio
+async def test_disabled(remote):
+    cache = EntityCache("persons", alias=ALIAS)
+    loader = Loader({"id": "4"})
+
+    await cache.get("4", loader)
+    await cache.get("4", loader)
+
+    assert loader.calls == 2
+    assert await remote.get("entity_persons_4_version") is None
@@ -0,0 +1,92 @@
+import io
+import threading
+
+from loguru import logger
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from web_api_template.core.log_sinks import BackgroundSink, SpanEventSink
+
+# Below TRACE: the records only reach the sinks of the tests, not the ones
+# configured by web_api_template.core.logging
+TEST_LEVEL: str = "SINK_TEST"
+logger.level(TEST_LEVEL, no=1)
+
+
+class BlockedStream(io.StringIO):
+    """Stream that blocks the writer thread until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.released = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.writing.set()
+        self.released.wait(timeout=5)
+        return super().write(text)
+
+
+def test_background_sink_writes_in_order():
+    stream = io.StringIO()
+    sink = BackgroundSink(stream, name="test")
+    for index in range(1000):
+        sink.write(f"{index}\n")
+    sink.stop()
+
+    assert stream.getvalue() == "".join(f"{index}\n" for index in range(1000))
+    assert sink.dropped == 0
+
+
+def test_background_sink_drops_under_backpressure():
+    stream = BlockedStream()
+    sink = BackgroundSink(stream, name="test", max_queue_size=10)
+
+    sink.write("first\n")
+    assert stream.writing.wait(timeout=5)
+    # The writer is blocked: only max_queue_size records wait
+    for index in range(25):
+        sink.write(f"{index}\n")
+    assert sink.dropped == 15
+
+    stream.released.set()
+    sink.stop()
+    assert stream.getvalue().splitlines() == ["first"] + [str(i) for i in range(10)]
+
+
+def test_span_event_sink():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer(__name__)
+
+    handler_id = logger.add(
+        SpanEventSink(),
+        level=TEST_LEVEL,
+        format="{message}",
+        filter=lambda record: record["level"].name == TEST_LEVEL,
+    )
+    try:
+        logger.log(TEST_LEVEL, "Out of a span")
+        with tracer.start_as_current_span("request"):
+            logger.log(TEST_LEVEL, "Person: {}", "id")
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.opt(exception=True).log(TEST_LEVEL, "Failed")
+    finally:
+        logger.remove(handler_id)
+
+    # No span by record: only the request span
+    (span,) = exporter.get_finished_spans()
+    events = [event for event in span.events if event.name == "log"]
+    assert [event.attributes["log.message"] for event in events] == [
+        "Person: id",
+        "Failed",
+    ]
+    assert events[0].attributes["log.severity"] == TEST_LEVEL
+    assert events[0].attributes["code.function"] == "test_span_event_sink"
+    assert any(event.name == "exception" for event in span.events)
@@ -0,0 +1,92 @@
+import ast
+from pathlib import Path
+from typing import List
+
+import web_api_template
+
+LEVELS = {
+    "trace",
+    "debug",
+    "info",
+    "success",
+    "warning",
+    "error",
+    "critical",
+    "exception",
+    "log",
+}
+
+
+def is_logger(node: ast.expr) -> bool:
+    """logger, logger.opt(...) or logger.bind(...)"""
+    if isinstance(node, ast.Name):
+        return node.id == "logger"
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr in ("opt", "bind", "patch", "contextualize")
+        and is_logger(node.func.value)
+    )
+
+
+def is_eager(node: ast.expr) -> bool:
+    """f"...", "...".format(...) or "..." % ..."""
+    return (
+        isinstance(node, ast.JoinedStr)
+        or (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mod))
+        or (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "format"
+        )
+    )
+
+
+def eager_logger_calls(source: str, filename: str) -> List[str]:
+    calls: List[str] = []
+    for node in ast.walk(ast.parse(source, filename)):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in LEVELS
+            and is_logger(node.func.value)
+            and node.args
+        ):
+            # logger.log(level, message, ...)
+            index: int = 1 if node.func.attr == "log" else 0
+            if len(node.args) > index and is_eager(node.args[index]):
+                calls.append(f"{filename}:{node.lineno}")
+    return calls
+
+
+def test_eager_logger_calls_are_detected():
+    source = "\n".join(
+        [
+            'logger.debug(f"Person: {person}")',
+            'logger.opt(lazy=True).info("Person: {}".format(person))',
+            'logger.log("DEBUG", "Person: %s" % person)',
+            'logger.debug("Person: {}", person)',
+            'logger.opt(lazy=True).debug("Stats: {}", cache.stats)',
+            'print(f"{person}")',
+        ]
+    )
+    assert eager_logger_calls(source, "example.py") == [
+        "example.py:1",
+        "example.py:2",
+        "example.py:3",
+    ]
+
+
+def test_no_eager_logger_calls():
+    """The log messages are formatted by loguru only if a sink accepts the level:
+    use logger.debug("...: {}", value) (or logger.opt(lazy=True) for computed
+    values) instead of f-strings
+    """
+    root = Path(web_api_template.__file__).parent
+    calls: List[str] = []
+    for path in sorted(root.rglob("*.py")):
+        calls.extend(
+            eager_logger_calls(path.read_text(), str(path.relative_to(root.parent)))
+        )
+
+    assert calls == []
@@ -0,0 +1,94 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from web_api_template.core.middleware import (
+    RequestMetricsMiddleware,
+    request_metrics_middleware,
+)
+
+
+class Recorder:
+    def __init__(self):
+        self.values = []
+
+    def record(self, value, attributes):
+        self.values.append((value, attributes))
+
+    add = record
+
+
+@pytest.fixture
+def recorders(monkeypatch):
+    duration, errors = Recorder(), Recorder()
+    monkeypatch.setattr(request_metrics_middleware, "duration_histogram", duration)
+    monkeypatch.setattr(request_metrics_middleware, "errors_counter", errors)
+    return duration, errors
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/persons/{id}")
+    async def get_person(id: str):
+        # The request is in flight
+        return {"in_flight": request_metrics_middleware._InFlight.value}
+
+    @app.get("/error")
+    async def get_error():
+        raise ValueError("boom")
+
+    app.add_middleware(RequestMetricsMiddleware)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_request_metrics(recorders):
+    duration, errors = recorders
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=create_app(), raise_app_exceptions=False),
+        base_url="http://test",
+    ) as client:
+        response = await client.get("/persons/1")
+        assert response.json() == {"in_flight": 1}
+        await client.get("/persons/2")
+        await client.get("/missing")
+        await client.request("BREW", "/persons/3")
+        await client.get("/error")
+
+    assert request_metrics_middleware._InFlight.value == 0
+    assert all(value >= 0 for value, _ in duration.values)
+    # Route template, never the path
+    assert [attributes for _, attributes in duration.values] == [
+        {
+            "http.request.method": "GET",
+            "http.response.status_code": 200,
+            "http.route": "/persons/{id}",
+        },
+        {
+            "http.request.method": "GET",
+            "http.response.status_code": 200,
+            "http.route": "/persons/{id}",
+        },
+        {"http.request.method": "GET", "http.response.status_code": 404},
+        {
+            "http.request.method": "_OTHER",
+            "http.response.status_code": 405,
+            "http.route": "/persons/{id}",
+        },
+        {
+            "http.request.method": "GET",
+            "http.response.status_code": 500,
+            "http.route": "/error",
+        },
+    ]
+    assert errors.values == [
+        (
+            1,
+            {
+                "http.request.method": "GET",
+                "http.response.status_code": 500,
+                "http.route": "/error",
+            },
+        )
+    ]
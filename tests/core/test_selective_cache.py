@@ -0,0 +1,107 @@
+import asyncio
+from typing import List
+
+import pytest
+from aiocache import caches
+
+from web_api_template.core.selective_cache import (
+    is_cache_enabled,
+    selective_cache,
+    set_cache_enabled,
+)
+
+ALIAS: str = "test_selective_cache"
+
+
+class Service:
+    def __init__(self):
+        self.calls: int = 0
+
+    @selective_cache(
+        ttl=60,
+        alias=ALIAS,
+        key_builder=lambda f, *args, **kwargs: f"{f.__name__}_{kwargs['name']}",
+    )
+    async def get_value(self, *, name: str) -> str:
+        """Gets the value"""
+        self.calls += 1
+        return f"value_{name}"
+
+
+@pytest.fixture
+def cache():
+    caches.add(ALIAS, {"cache": "aiocache.SimpleMemoryCache"})
+    enabled: bool = is_cache_enabled()
+    set_cache_enabled(True)
+
+    yield caches.get(ALIAS)
+
+    set_cache_enabled(enabled)
+
+
+@pytest.mark.asyncio
+async def test_cached_once(cache):
+    service = Service()
+
+    assert await service.get_value(name="a") == "value_a"
+    assert await service.get_value(name="a") == "value_a"
+    assert await service.get_value(name="b") == "value_b"
+
+    assert service.calls == 2
+    assert await cache.get("get_value_a") == "value_a"
+    await cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_runtime_toggle(cache):
+    service = Service()
+
+    set_cache_enabled(False)
+    await service.get_value(name="c")
+    await service.get_value(name="c")
+    assert service.calls == 2
+    assert await cache.get("get_value_c") is None
+
+    set_cache_enabled(True)
+    await service.get_value(name="c")
+    await service.get_value(name="c")
+    assert service.calls == 3
+    await cache.clear()
+
+
+def test_wraps_metadata():
+    assert Service.get_value.__name__ == "get_value"
+    assert Service.get_value.__doc__ == "Gets the value"
+    assert Service.get_value.__wrapped__ is not None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_coalesced(cache):
+    service = Service()
+
+    results = await asyncio.gather(*[service.get_value(name="d") for _ in range(20)])
+
+    assert results == ["value_d"] * 20
+    assert service.calls == 1
+    await cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(cache):
+    calls: List[int] = []
+
+    @selective_cache(ttl=0.05, stale_ttl=60, alias=ALIAS)
+    async def get_counter() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert await get_counter() == 1
+    await asyncio.sleep(0.1)
+
+    # Expired: the stale value is returned while one task refreshes it
+    assert await asyncio.gather(*[get_counter() for _ in range(10)]) == [1] * 10
+    await asyncio.sleep(0.01)
+
+    assert len(calls) == 2
+    assert await get_counter() == 2
+    await cache.clear()
@@ -0,0 +1,54 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from opentelemetry.sdk.trace import TracerProvider
+
+from web_api_template.core.logging import trace_id_context
+from web_api_template.core.middleware import TraceIDMiddleware
+
+TRACE_ID: str = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT: str = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/trace-id")
+    async def get_trace_id():
+        return {"trace_id": trace_id_context.get()}
+
+    app.add_middleware(TraceIDMiddleware)
+    return app
+
+
+async def request(app, headers=None) -> str:
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/trace-id", headers=headers)
+    return response.json()["trace_id"]
+
+
+@pytest.mark.asyncio
+async def test_trace_id_from_traceparent():
+    assert await request(create_app(), {"traceparent": TRACEPARENT}) == TRACE_ID
+    # Reset at the end of the request
+    assert trace_id_context.get() is None
+
+
+@pytest.mark.asyncio
+async def test_trace_id_from_active_span():
+    tracer = TracerProvider().get_tracer(__name__)
+    with tracer.start_as_current_span("request") as span:
+        trace_id = await request(create_app(), {"traceparent": TRACEPARENT})
+
+    assert trace_id == format(span.get_span_context().trace_id, "032x")
+
+
+@pytest.mark.asyncio
+async def test_trace_id_generated():
+    app = create_app()
+    first = await request(app, {"traceparent": "invalid"})
+    second = await request(app)
+
+    assert first and second and first != second
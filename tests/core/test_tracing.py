@@ -0,0 +1,71 @@
+import time
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.trace.sampling import Decision
+from opentelemetry.trace import Status, StatusCode
+
+from web_api_template.core.tracing import TailSampler, TailSpanProcessor
+
+
+def create_tracer(ratio: float, **kwargs):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider(sampler=TailSampler(ratio, record_unsampled=True))
+    provider.add_span_processor(
+        TailSpanProcessor(SimpleSpanProcessor(exporter), **kwargs)
+    )
+    return provider.get_tracer(__name__), exporter
+
+
+def test_tail_sampler():
+    assert TailSampler(0).should_sample(None, 1, "request").decision == Decision.DROP
+    assert (
+        TailSampler(0, record_unsampled=True).should_sample(None, 1, "request").decision
+        == Decision.RECORD_ONLY
+    )
+    assert (
+        TailSampler(1, record_unsampled=True).should_sample(None, 1, "request").decision
+        == Decision.RECORD_AND_SAMPLE
+    )
+
+
+def test_tail_span_processor_sampled():
+    tracer, exporter = create_tracer(1)
+    with tracer.start_as_current_span("request"):
+        with tracer.start_as_current_span("SELECT DEFAULT"):
+            pass
+
+    assert [span.name for span in exporter.get_finished_spans()] == [
+        "SELECT DEFAULT",
+        "request",
+    ]
+
+
+def test_tail_span_processor_keeps_errors():
+    tracer, exporter = create_tracer(0, keep_errors=True)
+    with tracer.start_as_current_span("ok"):
+        with tracer.start_as_current_span("SELECT DEFAULT"):
+            pass
+    assert exporter.get_finished_spans() == ()
+
+    with tracer.start_as_current_span("request"):
+        with tracer.start_as_current_span("SELECT DEFAULT") as span:
+            span.set_status(Status(StatusCode.ERROR))
+
+    spans = exporter.get_finished_spans()
+    assert [span.name for span in spans] == ["SELECT DEFAULT", "request"]
+    assert all(span.context.trace_flags.sampled for span in spans)
+    assert spans[0].parent.span_id == spans[1].context.span_id
+
+
+def test_tail_span_processor_keeps_slow_requests():
+    tracer, exporter = create_tracer(0, keep_errors=False, slow_threshold_ms=20)
+    with tracer.start_as_current_span("fast"):
+        pass
+    with tracer.start_as_current_span("slow"):
+        time.sleep(0.03)
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["slow"]
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from aiocache import caches
+
+from web_api_template.core.selective_cache import is_cache_enabled, set_cache_enabled
+from web_api_template.core.two_tier_cache import TwoTierCache
+
+ALIAS: str = "test_two_tier_cache"
+
+
+class Loader:
+    def __init__(self, value):
+        self.value = value
+        self.calls: int = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.value
+
+
+@pytest.fixture
+def remote():
+    caches.add(ALIAS, {"cache": "aiocache.SimpleMemoryCache"})
+    enabled: bool = is_cache_enabled()
+    set_cache_enabled(True)
+
+    yield caches.get(ALIAS)
+
+    set_cache_enabled(enabled)
+
+
+@pytest.mark.asyncio
+async def test_tiers_and_stats(remote):
+    cache = TwoTierCache(alias=ALIAS)
+    loader = Loader(["read"])
+
+    assert await cache.get_or_load("john", loader) == ["read"]
+    assert await cache.get_or_load("john", loader) == ["read"]
+    assert await remote.get("john") == ["read"]
+
+    # Another process: local miss, remote hit
+    other = TwoTierCache(alias=ALIAS)
+    assert await other.get_or_load("john", loader) == ["read"]
+
+    assert loader.calls == 1
+    assert cache.stats() == {
+        "local": {"hits": 1, "misses": 1, "hit_ratio": 0.5},
+        "remote": {"hits": 0, "misses": 1, "hit_ratio": 0.0},
+    }
+    assert other.stats()["remote"]["hits"] == 1
+    await remote.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_coalesced(remote):
+    cache = TwoTierCache(alias=ALIAS)
+    loader = Loader(["read"])
+
+    results = await asyncio.gather(
+        *[cache.get_or_load("jane", loader) for _ in range(20)]
+    )
+
+    assert results == [["read"]] * 20
+    assert loader.calls == 1
+    await remote.clear()
+
+
+@pytest.mark.asyncio
+async def test_invalidate(remote):
+    cache = TwoTierCache(alias=ALIAS)
+
+    await cache.get_or_load("john", Loader(["read"]))
+    await cache.invalidate("john")
+
+    assert await remote.get("john") is None
+    assert await cache.get_or_load("john", Loader(["write"])) == ["write"]
+    await remote.clear()
+
+
+@pytest.mark.asyncio
+async def test_local_lru_and_ttl(remote):
+    cache = TwoTierCache(alias=ALIAS, local_ttl=0, local_maxsize=2)
+
+    for key in ("a", "b", "c"):
+        await cache.get_or_load(key, Loader(key))
+
+    assert list(cache._local) == ["b", "c"]
+
+    # Expired in the local tier: served by the remote tier
+    loader = Loader("new")
+    assert await cache.get_or_load("c", loader) == "c"
+    assert loader.calls == 0
+    await remote.clear()
@@ -0,0 +1,39 @@
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from web_api_template.core.repository.manager.sqlalchemy.async_database import (
+    AsyncDatabase,
+)
+from web_api_template.core.repository.model.sqlalchemy import metadata
+
+
+def enable_foreign_keys(dbapi_connection, connection_record):
+    # SQLite only checks the foreign keys when asked to
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path, monkeypatch):
+    """SQLite database used by the repositories (DEFAULT label, no replicas
+    and no concurrent count). Yields the session factory to seed and check it.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'repository.db'}")
+    event.listen(engine.sync_engine, "connect", enable_foreign_keys)
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    monkeypatch.setattr(AsyncDatabase(), "_sessions", {"DEFAULT": async_session})
+    monkeypatch.setattr(AsyncDatabase(), "_routers", {})
+    monkeypatch.setattr(
+        AsyncDatabase, "get_count_session_factory", lambda label="DEFAULT": None
+    )
+
+    yield async_session
+
+    await engine.dispose()
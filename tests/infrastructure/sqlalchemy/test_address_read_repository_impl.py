@@ -0,0 +1,109 @@
+from typing import List, Set
+
+import pytest
+import pytest_asyncio
+from ksuid import Ksuid
+
+from web_api_template.api.v1.addresses.services import ReadService
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.domain.value_objects import Address, AddressFilter
+from web_api_template.infrastructure.models.sqlalchemy import AddressModel, PersonModel
+from web_api_template.infrastructure.repositories.sqlalchemy import (
+    AddressReadRepositoryImpl,
+)
+
+PERSON_ID: str = str(Ksuid())
+OTHER_PERSON_ID: str = str(Ksuid())
+
+
+def create_address_model(person_id: str, index: int) -> AddressModel:
+    return AddressModel(
+        id=str(Ksuid()),
+        person_id=person_id,
+        street=f"Street {index}",
+        city="Madrid" if index % 2 else "Barcelona",
+        postal_code=f"{index:05d}",
+        province="Province",
+        country="Spain",
+    )
+
+
+@pytest_asyncio.fixture
+async def addresses(database):
+    models: List[AddressModel] = [
+        create_address_model(PERSON_ID, index) for index in range(5)
+    ] + [create_address_model(OTHER_PERSON_ID, index) for index in range(5, 8)]
+
+    async with database() as session:
+        session.add_all(
+            [
+                PersonModel(
+                    id=person_id,
+                    name=f"Person{index}",
+                    surname=f"Surname{index}",
+                    email=f"email{index}@mail.com",
+                    identification_number=f"ID-{index:05d}",
+                )
+                for index, person_id in enumerate([PERSON_ID, OTHER_PERSON_ID])
+            ]
+        )
+        await session.flush()
+        session.add_all(models)
+        await session.commit()
+
+    return models
+
+
+@pytest.mark.asyncio
+async def test_get_paginated_list(addresses):
+    page: Page = await AddressReadRepositoryImpl().get_paginated_list(
+        filter=AddressFilter(), pagination=PaginationQueryModel(size=3, page=3)
+    )
+
+    assert page.total == 8
+    assert page.pages == 3
+    assert page.page == 3
+    assert page.has_next is False
+    assert len(page.items) == 2
+    assert all(isinstance(item, Address) for item in page.items)
+
+
+@pytest.mark.asyncio
+async def test_get_paginated_list_filtered(addresses):
+    page: Page = await AddressReadRepositoryImpl().get_paginated_list(
+        filter=AddressFilter(city="Mad"), pagination=PaginationQueryModel()
+    )
+
+    assert page.total == 4
+    assert {item.city for item in page.items} == {"Madrid"}
+
+
+@pytest.mark.asyncio
+async def test_get_list_by_person_id(addresses):
+    service: ReadService = ReadService(address_db_repo=AddressReadRepositoryImpl())
+    expected: Set[str] = {
+        address.id for address in addresses if address.person_id == PERSON_ID
+    }
+
+    page: Page = await service.get_list_by_person_id(
+        person_id=PERSON_ID, pagination=PaginationQueryModel(size=2)
+    )
+    ids: List[str] = [item.id for item in page.items]
+    while page.next_cursor:
+        page = await service.get_list_by_person_id(
+            person_id=PERSON_ID,
+            pagination=PaginationQueryModel(size=2, cursor=page.next_cursor),
+        )
+        assert page.total == 5
+        ids.extend(item.id for item in page.items)
+
+    # Only the addresses of the person, each one once
+    assert len(ids) == 5
+    assert set(ids) == expected
+
+    page = await service.get_list_by_person_id(
+        person_id=OTHER_PERSON_ID, pagination=PaginationQueryModel()
+    )
+    assert page.total == 3
+    assert not {item.id for item in page.items} & expected
@@ -0,0 +1,187 @@
+from typing import List
+
+import pytest
+import pytest_asyncio
+from ksuid import Ksuid
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from web_api_template.api.v1.persons.services import WriteService
+from web_api_template.core.repository.exceptions import ItemNotFoundException
+from web_api_template.domain.entities.person import Person
+from web_api_template.domain.entities.person_create import PersonCreate
+from web_api_template.domain.exceptions import (
+    PersonAlreadyExistsException,
+    PersonAlreadyModifiedException,
+    PersonNotFoundException,
+)
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel
+from web_api_template.infrastructure.repositories.sqlalchemy import (
+    PersonWriteRepositoryImpl,
+)
+
+PERSON_ID: str = str(Ksuid())
+
+
+def person(version: int, name: str = "Person1", id: str = PERSON_ID) -> Person:
+    return Person(
+        id=id,
+        name=name,
+        surname="Surname1",
+        email="email1@mail.com",
+        identification_number="ID-00001",
+        version=version,
+    )
+
+
+@pytest_asyncio.fixture
+async def stored_person(database):
+    async with database() as session:
+        session.add(
+            PersonModel(
+                id=PERSON_ID,
+                name="Person1",
+                surname="Surname1",
+                email="email1@mail.com",
+                identification_number="ID-00001",
+            )
+        )
+        await session.commit()
+
+
+async def stored_model(database, id: str = PERSON_ID) -> PersonModel:
+    async with database() as session:
+        return await session.scalar(select(PersonModel).where(PersonModel.id == id))
+
+
+@pytest.mark.asyncio
+async def test_update_bumps_version(database, stored_person):
+    version: int = (await stored_model(database)).version
+
+    result: Person = await PersonWriteRepositoryImpl().update(
+        id=PERSON_ID, person=person(version, name="Updated")
+    )
+
+    assert result.id == PERSON_ID
+    assert result.name == "Updated"
+    assert result.version == version + 1
+
+    model: PersonModel = await stored_model(database)
+    assert model.name == "Updated"
+    assert model.version == version + 1
+
+
+@pytest.mark.asyncio
+async def test_update_stale_version(database, stored_person):
+    version: int = (await stored_model(database)).version
+    await PersonWriteRepositoryImpl().update(id=PERSON_ID, person=person(version))
+
+    # Second writer with the version it read before the first update
+    with pytest.raises(PersonAlreadyModifiedException) as error:
+        await PersonWriteRepositoryImpl().update(
+            id=PERSON_ID, person=person(version, name="Lost update")
+        )
+
+    assert error.value.status_code == 409
+    model: PersonModel = await stored_model(database)
+    assert model.name == "Person1"
+    assert model.version == version + 1
+
+
+@pytest.mark.asyncio
+async def test_update_not_found(database):
+    missing_id: str = str(Ksuid())
+
+    with pytest.raises(ItemNotFoundException):
+        await PersonWriteRepositoryImpl().update(
+            id=missing_id, person=person(1, id=missing_id)
+        )
+
+    service: WriteService = WriteService(person_db_repo=PersonWriteRepositoryImpl())
+    with pytest.raises(PersonNotFoundException) as error:
+        await service.update(id=missing_id, request=person(1, id=missing_id))
+
+    assert error.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete(database, stored_person):
+    await PersonWriteRepositoryImpl().delete(id=PERSON_ID)
+
+    assert await stored_model(database) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_not_found(database):
+    missing_id: str = str(Ksuid())
+
+    with pytest.raises(ItemNotFoundException):
+        await PersonWriteRepositoryImpl().delete(id=missing_id)
+
+    service: WriteService = WriteService(person_db_repo=PersonWriteRepositoryImpl())
+    with pytest.raises(PersonNotFoundException) as error:
+        await service.delete_by_id(id=missing_id)
+
+    assert error.value.status_code == 404
+
+
+def person_create(identification_number: str) -> PersonCreate:
+    return PersonCreate(
+        name="Person",
+        surname="Surname",
+        email="email@mail.com",
+        identification_number=identification_number,
+    )
+
+
+async def count_persons(database) -> int:
+    async with database() as session:
+        return await session.scalar(select(func.count()).select_from(PersonModel))
+
+
+@pytest.mark.asyncio
+async def test_create_many_already_exists_by_index(database, stored_person):
+    results: List[Person | Exception] = await PersonWriteRepositoryImpl().create_many(
+        entities=[
+            person_create("ID-00002"),
+            # Stored before the batch
+            person_create("ID-00001"),
+            person_create("ID-00003"),
+            # Repeated in the batch
+            person_create("ID-00002"),
+        ]
+    )
+
+    assert isinstance(results[0], Person)
+    assert isinstance(results[1], PersonAlreadyExistsException)
+    assert isinstance(results[2], Person)
+    assert isinstance(results[3], PersonAlreadyExistsException)
+    assert results[1].status_code == results[3].status_code == 409
+    assert await count_persons(database) == 3
+
+
+@pytest.mark.asyncio
+async def test_create_many_conflict_inserted_row_by_row(
+    database, stored_person, monkeypatch
+):
+    async def concurrent_insert(entities):
+        # The batch insert found a person inserted by another transaction
+        raise IntegrityError("INSERT INTO persons", {}, Exception("duplicated"))
+
+    repository: PersonWriteRepositoryImpl = PersonWriteRepositoryImpl()
+    monkeypatch.setattr(
+        repository, "_PersonWriteRepositoryImpl__insert_many", concurrent_insert
+    )
+
+    results: List[Person | Exception] = await repository.create_many(
+        entities=[
+            person_create("ID-00002"),
+            person_create("ID-00001"),
+            person_create("ID-00002"),
+        ]
+    )
+
+    assert isinstance(results[0], Person)
+    assert isinstance(results[1], PersonAlreadyExistsException)
+    assert isinstance(results[2], PersonAlreadyExistsException)
+    assert await count_persons(database) == 2
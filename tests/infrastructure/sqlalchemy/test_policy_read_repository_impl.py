@@ -0,0 +1,153 @@
+from datetime import date
+from typing import Any, Callable, List
+
+import pytest
+import pytest_asyncio
+from ksuid import Ksuid
+
+from web_api_template.api.v1.policies.services import ReadService
+from web_api_template.core.api.pagination_query_model import PaginationQueryModel
+from web_api_template.core.repository.manager.sqlalchemy.async_database import (
+    AsyncDatabase,
+)
+from web_api_template.core.repository.manager.sqlalchemy.page import Page
+from web_api_template.domain.aggregates import Policy, PolicyFilter
+from web_api_template.domain.types import PolicyStatusEnum, PolicyTypeEnum
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel, PolicyModel
+from web_api_template.infrastructure.repositories.sqlalchemy import (
+    PolicyReadRepositoryImpl,
+)
+from web_api_template.infrastructure.repositories.sqlalchemy.entity_caches import (
+    policy_cache,
+)
+
+HOLDER_ID: str = str(Ksuid())
+OTHER_HOLDER_ID: str = str(Ksuid())
+
+
+def create_policy_model(holder_id: str, index: int) -> PolicyModel:
+    return PolicyModel(
+        id=str(Ksuid()),
+        holder_id=holder_id,
+        policy_number=f"POL-{index:05d}",
+        status=PolicyStatusEnum.ACTIVE if index % 2 else PolicyStatusEnum.INACTIVE,
+        policy_type=PolicyTypeEnum.HOME,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        premium=100.0,
+    )
+
+
+@pytest_asyncio.fixture
+async def policies(database):
+    async with database() as session:
+        session.add_all(
+            [
+                PersonModel(
+                    id=holder_id,
+                    name=f"Person{index}",
+                    surname=f"Surname{index}",
+                    email=f"email{index}@mail.com",
+                    identification_number=f"ID-{index:05d}",
+                )
+                for index, holder_id in enumerate([HOLDER_ID, OTHER_HOLDER_ID])
+            ]
+        )
+        await session.flush()
+        session.add_all(
+            [create_policy_model(HOLDER_ID, index) for index in range(5)]
+            + [create_policy_model(OTHER_HOLDER_ID, index) for index in range(5, 8)]
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_get_paginated_list(policies):
+    page: Page = await PolicyReadRepositoryImpl().get_paginated_list(
+        filter=PolicyFilter(), pagination=PaginationQueryModel(size=3, page=2)
+    )
+
+    assert page.total == 8
+    assert page.pages == 3
+    assert page.page == 2
+    assert page.has_next is True
+    assert len(page.items) == 3
+    assert all(isinstance(item, Policy) for item in page.items)
+
+
+@pytest.mark.asyncio
+async def test_get_paginated_list_filtered(policies):
+    page: Page = await PolicyReadRepositoryImpl().get_paginated_list(
+        filter=PolicyFilter(policy_number="POL-0000"),
+        pagination=PaginationQueryModel(sort="-policy_number"),
+    )
+
+    assert [item.policy_number for item in page.items] == [
+        f"POL-{index:05d}" for index in reversed(range(8))
+    ]
+
+    page = await PolicyReadRepositoryImpl().get_paginated_list(
+        filter=PolicyFilter(status=PolicyStatusEnum.ACTIVE),
+        pagination=PaginationQueryModel(),
+    )
+
+    assert page.total == 4
+    assert {item.status for item in page.items} == {PolicyStatusEnum.ACTIVE}
+
+
+@pytest.mark.asyncio
+async def test_get_list_by_person_id(policies):
+    service: ReadService = ReadService(policy_db_repo=PolicyReadRepositoryImpl())
+
+    page: Page = await service.get_list_by_person_id(
+        person_id=HOLDER_ID, pagination=PaginationQueryModel(size=2)
+    )
+    ids: List[str] = [item.id for item in page.items]
+    while page.next_cursor:
+        page = await service.get_list_by_person_id(
+            person_id=HOLDER_ID,
+            pagination=PaginationQueryModel(size=2, cursor=page.next_cursor),
+        )
+        assert page.total == 5
+        ids.extend(item.id for item in page.items)
+        assert {item.policy_holder_id for item in page.items} == {HOLDER_ID}
+
+    assert len(ids) == len(set(ids)) == 5
+
+    page = await service.get_list_by_person_id(
+        person_id=OTHER_HOLDER_ID, pagination=PaginationQueryModel()
+    )
+    assert page.total == 3
+    assert {item.policy_holder_id for item in page.items} == {OTHER_HOLDER_ID}
+
+
+def record(name: str, calls: List[str]) -> Callable[..., Any]:
+    get_session = getattr(AsyncDatabase, name)
+
+    def recorded(label: str = "DEFAULT"):
+        calls.append(name)
+        return get_session(label)
+
+    return recorded
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "enabled, session",
+    [(False, "get_read_session"), (True, "get_primary_read_session")],
+)
+async def test_get_by_id_session(policies, monkeypatch, enabled, session):
+    page: Page = await PolicyReadRepositoryImpl().get_paginated_list(
+        filter=PolicyFilter(), pagination=PaginationQueryModel(size=1)
+    )
+
+    calls: List[str] = []
+    for name in ("get_read_session", "get_primary_read_session"):
+        monkeypatch.setattr(AsyncDatabase, name, record(name, calls))
+    monkeypatch.setattr(type(policy_cache), "enabled", property(lambda _: enabled))
+
+    policy: Policy = await PolicyReadRepositoryImpl().get_by_id(page.items[0].id)
+
+    assert policy.id == page.items[0].id
+    # Replicas unless the entity is cached (for every request)
+    assert calls == [session]
\ No newline at end of file
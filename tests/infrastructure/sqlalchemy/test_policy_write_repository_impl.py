@@ -0,0 +1,64 @@
+from datetime import date
+from typing import List
+
+import pytest
+import pytest_asyncio
+from ksuid import Ksuid
+
+from web_api_template.core.repository.exceptions import ItemNotFoundException
+from web_api_template.domain.aggregates import PolicyCreate
+from web_api_template.domain.types import PolicyStatusEnum, PolicyTypeEnum
+from web_api_template.infrastructure.models.sqlalchemy import PersonModel
+from web_api_template.infrastructure.repositories.sqlalchemy import (
+    PolicyWriteRepositoryImpl,
+)
+
+HOLDER_ID: str = str(Ksuid())
+
+
+def policy_create(index: int) -> PolicyCreate:
+    return PolicyCreate(
+        policy_number=f"POL-{index:05d}",
+        status=PolicyStatusEnum.ACTIVE,
+        policy_type=PolicyTypeEnum.HOME,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 12, 31),
+        premium=100.0,
+    )
+
+
+@pytest_asyncio.fixture
+async def holder(database):
+    async with database() as session:
+        session.add(
+            PersonModel(
+                id=HOLDER_ID,
+                name="Person1",
+                surname="Surname1",
+                email="email1@mail.com",
+                identification_number="ID-00001",
+            )
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_create_many(holder):
+    results: List[PolicyCreate] = await PolicyWriteRepositoryImpl().create_many(
+        person_id=HOLDER_ID, entities=[policy_create(index) for index in range(3)]
+    )
+
+    assert [result.policy_number for result in results] == [
+        "POL-00000",
+        "POL-00001",
+        "POL-00002",
+    ]
+    assert {result.policy_holder_id for result in results} == {HOLDER_ID}
+
+
+@pytest.mark.asyncio
+async def test_create_many_person_not_found(holder):
+    with pytest.raises(ItemNotFoundException):
+        await PolicyWriteRepositoryImpl().create_many(
+            person_id=str(Ksuid()), entities=[policy_create(0)]
+        )